@@ -0,0 +1,57 @@
+"""mv_prog_mensual
+
+Crea la vista materializada mv_prog_mensual con los totales de programado y
+ejecutado por (anio, ue_id, meta_id, fuente_financiamiento, mes), usada por el
+grafico mensual del dashboard de presupuesto en lugar del JOIN
+programacion_mensual -> programacion_presupuestal.
+
+El indice unico permite REFRESH MATERIALIZED VIEW CONCURRENTLY, que el
+servicio de importacion ejecuta despues de cada carga. Solo PostgreSQL;
+en otros motores la migracion no hace nada.
+
+Revision ID: 0b7e3f5a9c21
+Revises: f2a9d6b3c418
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7e3f5a9c21'
+down_revision: Union[str, None] = 'f2a9d6b3c418'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_prog_mensual AS
+        SELECT pp.anio,
+               pp.ue_id,
+               pp.meta_id,
+               pp.fuente_financiamiento,
+               pm.mes,
+               SUM(pm.programado) AS programado,
+               SUM(pm.ejecutado) AS ejecutado
+        FROM programacion_mensual pm
+        JOIN programacion_presupuestal pp ON pp.id = pm.programacion_presupuestal_id
+        GROUP BY pp.anio, pp.ue_id, pp.meta_id, pp.fuente_financiamiento, pm.mes
+        """
+    )
+    op.execute(
+        """
+        CREATE UNIQUE INDEX ux_mv_prog_mensual
+        ON mv_prog_mensual (anio, ue_id, meta_id, fuente_financiamiento, mes)
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_prog_mensual')
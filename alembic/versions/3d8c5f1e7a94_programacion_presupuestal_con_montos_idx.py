@@ -0,0 +1,39 @@
+"""programacion_presupuestal_con_montos_idx
+
+Agrega un indice parcial sobre programacion_presupuestal (anio, ue_id) que
+solo cubre las lineas con algun monto (pim, certificado o devengado distinto
+de cero), con INCLUDE de esos montos. El ranking de ejecucion del dashboard
+filtra con el mismo predicado, asi PostgreSQL omite las lineas en cero al
+escanear en lugar de descartarlas despues de agregar.
+
+Revision ID: 3d8c5f1e7a94
+Revises: 0b7e3f5a9c21
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3d8c5f1e7a94'
+down_revision: Union[str, None] = '0b7e3f5a9c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_programacion_presupuestal_con_montos',
+        'programacion_presupuestal',
+        ['anio', 'ue_id'],
+        postgresql_include=['pim', 'certificado', 'devengado'],
+        postgresql_where=sa.text('pim <> 0 OR certificado <> 0 OR devengado <> 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_programacion_presupuestal_con_montos', table_name='programacion_presupuestal'
+    )
@@ -0,0 +1,59 @@
+"""fk_on_delete_cascade
+
+Declara ON DELETE CASCADE en las llaves foraneas que cuelgan de
+unidad_ejecutora (directamente o via adquisicion, contrato_menor,
+meta_presupuestal y programacion_presupuestal). Asi, borrar una UE elimina
+todos sus datos dependientes en una sola sentencia, sin repetir a mano la
+cascada en scripts como clean_odeis_prod.py.
+
+Las llaves se crearon sin nombre explicito, por lo que usan el nombre por
+defecto de PostgreSQL (``<tabla>_<columna>_fkey``).
+
+Revision ID: 5a2c7e9b4d18
+Revises: 3d8c5f1e7a94
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5a2c7e9b4d18'
+down_revision: Union[str, None] = '3d8c5f1e7a94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (tabla, columna, tabla referenciada)
+_CASCADE_FKS = (
+    ('adquisicion', 'ue_id', 'unidad_ejecutora'),
+    ('contrato_menor', 'ue_id', 'unidad_ejecutora'),
+    ('actividad_operativa', 'ue_id', 'unidad_ejecutora'),
+    ('alerta', 'ue_id', 'unidad_ejecutora'),
+    ('meta_presupuestal', 'ue_id', 'unidad_ejecutora'),
+    ('programacion_presupuestal', 'ue_id', 'unidad_ejecutora'),
+    ('usuario', 'ue_id', 'unidad_ejecutora'),
+    ('adquisicion_proceso', 'adquisicion_id', 'adquisicion'),
+    ('adquisicion_detalle', 'adquisicion_id', 'adquisicion'),
+    ('contrato_menor_proceso', 'contrato_menor_id', 'contrato_menor'),
+    ('programacion_presupuestal', 'meta_id', 'meta_presupuestal'),
+    ('programacion_mensual', 'programacion_presupuestal_id', 'programacion_presupuestal'),
+)
+
+
+def _recreate_fks(ondelete: Union[str, None]) -> None:
+    for tabla, columna, referida in _CASCADE_FKS:
+        nombre = f'{tabla}_{columna}_fkey'
+        op.drop_constraint(nombre, tabla, type_='foreignkey')
+        op.create_foreign_key(
+            nombre, tabla, referida, [columna], ['id'], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    _recreate_fks('CASCADE')
+
+
+def downgrade() -> None:
+    _recreate_fks(None)
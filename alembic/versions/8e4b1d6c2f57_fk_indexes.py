@@ -0,0 +1,51 @@
+"""fk_indexes
+
+Agrega indices btree sobre las llaves foraneas que recorre el borrado en
+cascada de una unidad_ejecutora (ver 5a2c7e9b4d18): los ue_id de las tablas
+que cuelgan de la UE y las llaves hacia adquisicion, contrato_menor,
+meta_presupuestal y programacion_presupuestal. Sin ellos, cada accion de
+cascada (y cada filtro por UE) es un seq scan de la tabla hija.
+
+adquisicion_detalle.adquisicion_id no se incluye: su restriccion UNIQUE ya
+crea un indice.
+
+Revision ID: 8e4b1d6c2f57
+Revises: 5a2c7e9b4d18
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b1d6c2f57'
+down_revision: Union[str, None] = '5a2c7e9b4d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (tabla, columna); el indice se llama ix_<tabla>_<columna> como index=True.
+_FK_INDEXES = (
+    ('adquisicion', 'ue_id'),
+    ('contrato_menor', 'ue_id'),
+    ('actividad_operativa', 'ue_id'),
+    ('alerta', 'ue_id'),
+    ('meta_presupuestal', 'ue_id'),
+    ('programacion_presupuestal', 'ue_id'),
+    ('usuario', 'ue_id'),
+    ('adquisicion_proceso', 'adquisicion_id'),
+    ('contrato_menor_proceso', 'contrato_menor_id'),
+    ('programacion_presupuestal', 'meta_id'),
+    ('programacion_mensual', 'programacion_presupuestal_id'),
+)
+
+
+def upgrade() -> None:
+    for tabla, columna in _FK_INDEXES:
+        op.create_index(f'ix_{tabla}_{columna}', tabla, [columna])
+
+
+def downgrade() -> None:
+    for tabla, columna in reversed(_FK_INDEXES):
+        op.drop_index(f'ix_{tabla}_{columna}', table_name=tabla)
@@ -0,0 +1,38 @@
+"""upsert_unique_keys
+
+Agrega la restriccion UNIQUE sobre la clave natural de
+programacion_presupuestal (anio, ue_id, meta_id, clasificador_id), usada como
+destino de ``INSERT ... ON CONFLICT DO UPDATE`` en las importaciones SIAF.
+
+La importacion ya omitia duplicados sobre esta clave, por lo que no se
+esperan filas repetidas. Si existieran, la migracion falla y deben
+depurarse manualmente antes de reintentar.
+
+Revision ID: c7d2e4a91f36
+Revises: a1f3e9d72b05
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e4a91f36'
+down_revision: Union[str, None] = 'a1f3e9d72b05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        'uq_programacion_presupuestal_clave',
+        'programacion_presupuestal',
+        ['anio', 'ue_id', 'meta_id', 'clasificador_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'uq_programacion_presupuestal_clave', 'programacion_presupuestal', type_='unique'
+    )
@@ -0,0 +1,35 @@
+"""registro_importacion_formato_fecha_idx
+
+Agrega un indice sobre registro_importacion (formato, fecha DESC, id DESC)
+con INCLUDE (estado, registros_ok, usuario_username) para el tablero de
+estado de formatos, que consulta la ultima importacion de cada formato.
+En PostgreSQL el indice cubre la consulta completa (index-only scan).
+
+Revision ID: e5b8c1d40a27
+Revises: c7d2e4a91f36
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c1d40a27'
+down_revision: Union[str, None] = 'c7d2e4a91f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_registro_importacion_formato_fecha',
+        'registro_importacion',
+        ['formato', sa.text('fecha DESC'), sa.text('id DESC')],
+        postgresql_include=['estado', 'registros_ok', 'usuario_username'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_registro_importacion_formato_fecha', table_name='registro_importacion')
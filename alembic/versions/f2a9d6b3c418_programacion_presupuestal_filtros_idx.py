@@ -0,0 +1,37 @@
+"""programacion_presupuestal_filtros_idx
+
+Agrega un indice compuesto sobre programacion_presupuestal
+(anio, ue_id, meta_id, fuente_financiamiento) con INCLUDE de los montos
+(pim, certificado, compromiso_anual, devengado, saldo). Coincide con los
+filtros del dashboard de presupuesto, de modo que PostgreSQL puede resolver
+los KPIs y graficos con un index-only scan.
+
+Revision ID: f2a9d6b3c418
+Revises: e5b8c1d40a27
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9d6b3c418'
+down_revision: Union[str, None] = 'e5b8c1d40a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_programacion_presupuestal_filtros',
+        'programacion_presupuestal',
+        ['anio', 'ue_id', 'meta_id', 'fuente_financiamiento'],
+        postgresql_include=['pim', 'certificado', 'compromiso_anual', 'devengado', 'saldo'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_programacion_presupuestal_filtros', table_name='programacion_presupuestal'
+    )
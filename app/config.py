@@ -16,6 +16,14 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_MINUTES: int = 480  # 8 hours
 
+    # Passwords — Argon2id parameters (memory in KiB).  The defaults are the
+    # OWASP baseline (19 MiB, 2 iterations, 1 lane); benchmark on the
+    # deployment host and raise them while a login stays under ~100 ms.
+    # Hashes made with other parameters are upgraded on the next login.
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 19456
+    ARGON2_PARALLELISM: int = 1
+
     # App
     APP_NAME: str = "Dashboard INEI"
     DEBUG: bool = True
@@ -36,6 +44,17 @@ class Settings(BaseSettings):
     PLANTILLAS_DIR: Path = _BACKEND_ROOT / "formatos" / "plantillas"
     UPLOADS_DIR: Path = _BACKEND_ROOT / "formatos" / "uploads"
 
+    # Imports — write the RegistroImportacion audit row inside the import
+    # transaction (default).  Set to true to write it after the data commit,
+    # in its own session, without delaying the upload response; /historial
+    # and /estado-formatos may then briefly miss an upload that just returned.
+    IMPORT_AUDIT_ASYNC: bool = False
+
+    # Dashboard — seconds between background refreshes of the mv_prog_mensual
+    # rollup (PostgreSQL), which catches writes made outside the import
+    # service such as the seed scripts.  0 disables the periodic refresh.
+    RESUMEN_MENSUAL_REFRESH_SECONDS: int = 300
+
     model_config = {"env_file": ".env", "extra": "ignore"}
 
 
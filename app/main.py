@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -47,26 +48,54 @@ def _seed_admin_user() -> None:
         print(f"[SEED] ERROR: {exc}", flush=True)
 
 
+def _refresh_resumen_mensual() -> None:
+    """Rebuild the monthly rollup from whatever is in the tables now."""
+    from app.database import SessionLocal
+    from app.services.presupuesto_service import refresh_resumen_mensual
+
+    db = SessionLocal()
+    try:
+        refresh_resumen_mensual(db)
+    finally:
+        db.close()
+
+
+async def _refresh_resumen_mensual_periodically(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(_refresh_resumen_mensual)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: seed admin user if DB is empty
-    _seed_admin_user()
-
-    # Startup: generate plantillas if they don't exist
+    # Startup: seed admin user if DB is empty (DB + password hashing, off the event loop)
+    await asyncio.to_thread(_seed_admin_user)
+
+    # Startup: the seed scripts in start.sh write programacion_mensual
+    # directly, so bring mv_prog_mensual up to date, then keep refreshing it
+    await asyncio.to_thread(_refresh_resumen_mensual)
+    refresh_task = None
+    if settings.RESUMEN_MENSUAL_REFRESH_SECONDS > 0:
+        refresh_task = asyncio.create_task(
+            _refresh_resumen_mensual_periodically(settings.RESUMEN_MENSUAL_REFRESH_SECONDS)
+        )
+
+    # Startup: generate plantillas if they are missing or stale (the catalog
+    # fingerprint decides; up-to-date files are left untouched)
     try:
         from app.services.template_service import generate_all_templates
-        plantillas_dir = settings.PLANTILLAS_DIR
-        existing = list(plantillas_dir.glob("*.xlsx"))
-        if not existing:
-            logger.info("Generating Excel plantillas on startup...")
-            generate_all_templates(plantillas_dir)
-            logger.info("Plantillas generated successfully.")
-        else:
-            logger.info("Plantillas already exist (%d files), skipping generation.", len(existing))
+        generate_all_templates(settings.PLANTILLAS_DIR)
     except Exception as exc:
         logger.warning("Could not generate plantillas on startup: %s", exc)
     yield
 
+    if refresh_task is not None:
+        refresh_task.cancel()
+
+    # Shutdown: let queued import audit rows (IMPORT_AUDIT_ASYNC) finish
+    from app.services.importacion_service import drain_audit_tasks
+    await drain_audit_tasks()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
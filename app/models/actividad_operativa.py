@@ -33,7 +33,7 @@ class ActividadOperativa(Base):
     oei = Column(String(200), nullable=True)
     aei = Column(String(200), nullable=True)
     meta_id = Column(Integer, ForeignKey("meta_presupuestal.id"), nullable=True)
-    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id"), nullable=True)
+    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id", ondelete="CASCADE"), nullable=True, index=True)
     anio = Column(Integer, nullable=True)
     activo = Column(Boolean, default=True, nullable=False)
 
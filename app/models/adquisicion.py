@@ -36,7 +36,7 @@ class Adquisicion(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     codigo = Column(String(20), unique=True, nullable=False)
     anio = Column(Integer, nullable=True)
-    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id"), nullable=True)
+    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id", ondelete="CASCADE"), nullable=True, index=True)
     meta_id = Column(Integer, ForeignKey("meta_presupuestal.id"), nullable=True)
     descripcion = Column(String(1000), nullable=False)
     tipo_objeto = Column(String(20), nullable=True)  # "BIEN", "SERVICIO", "OBRA", "CONSULTORÍA"
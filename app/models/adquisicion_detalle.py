@@ -29,7 +29,7 @@ class AdquisicionDetalle(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     adquisicion_id = Column(
         Integer,
-        ForeignKey("adquisicion.id"),
+        ForeignKey("adquisicion.id", ondelete="CASCADE"),
         unique=True,
         nullable=False,
     )
@@ -32,7 +32,7 @@ class AdquisicionProceso(Base):
     __tablename__ = "adquisicion_proceso"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    adquisicion_id = Column(Integer, ForeignKey("adquisicion.id"), nullable=False)
+    adquisicion_id = Column(Integer, ForeignKey("adquisicion.id", ondelete="CASCADE"), nullable=False, index=True)
     orden = Column(Integer, nullable=False)  # 1–22
     hito = Column(String(200), nullable=False)
     fase = Column(String(50), nullable=True)
@@ -39,7 +39,7 @@ class Alerta(Base):
     nivel = Column(String(10), nullable=True)  # "ROJO", "AMARILLO", "VERDE"
     titulo = Column(String(300), nullable=True)
     descripcion = Column(Text, nullable=True)
-    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id"), nullable=True)
+    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id", ondelete="CASCADE"), nullable=True, index=True)
     modulo = Column(String(50), nullable=True)
     # "PRESUPUESTO", "ADQUISICIONES", "CONTRATOS_MENORES", "ACTIVIDADES_OPERATIVAS"
     entidad_id = Column(Integer, nullable=True)
@@ -38,7 +38,7 @@ class ContratoMenor(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     codigo = Column(String(20), unique=True, nullable=True)
     anio = Column(Integer, nullable=True)
-    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id"), nullable=True)
+    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id", ondelete="CASCADE"), nullable=True, index=True)
     meta_id = Column(Integer, ForeignKey("meta_presupuestal.id"), nullable=True)
     descripcion = Column(String(1000), nullable=True)
     tipo_objeto = Column(String(20), nullable=True)  # "BIEN", "SERVICIO"
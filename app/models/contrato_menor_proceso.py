@@ -27,7 +27,7 @@ class ContratoMenorProceso(Base):
     __tablename__ = "contrato_menor_proceso"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    contrato_menor_id = Column(Integer, ForeignKey("contrato_menor.id"), nullable=False)
+    contrato_menor_id = Column(Integer, ForeignKey("contrato_menor.id", ondelete="CASCADE"), nullable=False, index=True)
     orden = Column(Integer, nullable=False)  # 1–9
     hito = Column(String(200), nullable=False)
     area_responsable = Column(String(50), nullable=True)
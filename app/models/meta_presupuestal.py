@@ -25,7 +25,7 @@ class MetaPresupuestal(Base):
     codigo = Column(String(10), nullable=False)
     descripcion = Column(String(500), nullable=True)
     sec_funcional = Column(String(20), nullable=True)
-    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id"), nullable=False)
+    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id", ondelete="CASCADE"), nullable=False, index=True)
     anio = Column(Integer, nullable=False)
     activo = Column(Boolean, default=True, nullable=False)
 
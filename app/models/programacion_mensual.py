@@ -26,8 +26,9 @@ class ProgramacionMensual(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     programacion_presupuestal_id = Column(
         Integer,
-        ForeignKey("programacion_presupuestal.id"),
+        ForeignKey("programacion_presupuestal.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     mes = Column(Integer, nullable=False)  # 1–12
     programado = Column(Numeric(15, 2), default=0, nullable=False)
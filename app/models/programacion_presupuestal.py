@@ -1,6 +1,6 @@
 """ProgramacionPresupuestal model — annual budget programming record."""
 
-from sqlalchemy import Column, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, Numeric, String, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -29,11 +29,33 @@ class ProgramacionPresupuestal(Base):
     """
 
     __tablename__ = "programacion_presupuestal"
+    __table_args__ = (
+        # Natural key of a budget line; conflict target for SIAF upserts.
+        UniqueConstraint(
+            "anio", "ue_id", "meta_id", "clasificador_id",
+            name="uq_programacion_presupuestal_clave",
+        ),
+        # Matches the dashboard filters (see presupuesto_service._apply_pp_filters);
+        # INCLUDE lets PostgreSQL answer the KPI/chart sums from the index alone.
+        Index(
+            "ix_programacion_presupuestal_filtros",
+            "anio", "ue_id", "meta_id", "fuente_financiamiento",
+            postgresql_include=["pim", "certificado", "compromiso_anual", "devengado", "saldo"],
+        ),
+        # Budget lines with some amount; the execution ranking filters on the
+        # same predicate so all-zero lines are skipped at scan time.
+        Index(
+            "ix_programacion_presupuestal_con_montos",
+            "anio", "ue_id",
+            postgresql_include=["pim", "certificado", "devengado"],
+            postgresql_where=text("pim <> 0 OR certificado <> 0 OR devengado <> 0"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     anio = Column(Integer, nullable=False)
-    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id"), nullable=False)
-    meta_id = Column(Integer, ForeignKey("meta_presupuestal.id"), nullable=False)
+    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id", ondelete="CASCADE"), nullable=False, index=True)
+    meta_id = Column(Integer, ForeignKey("meta_presupuestal.id", ondelete="CASCADE"), nullable=False, index=True)
     clasificador_id = Column(Integer, ForeignKey("clasificador_gasto.id"), nullable=False)
     pia = Column(Numeric(15, 2), default=0, nullable=False)
     pim = Column(Numeric(15, 2), default=0, nullable=False)
@@ -1,6 +1,6 @@
 """RegistroImportacion model — audit log of every file imported into the system."""
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, text
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -33,6 +33,15 @@ class RegistroImportacion(Base):
     """
 
     __tablename__ = "registro_importacion"
+    __table_args__ = (
+        # Newest import per formato (status dashboard); INCLUDE makes it
+        # covering on PostgreSQL so the lookup never touches the heap.
+        Index(
+            "ix_registro_importacion_formato_fecha",
+            "formato", text("fecha DESC"), text("id DESC"),
+            postgresql_include=["estado", "registros_ok", "usuario_username"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     formato = Column(String(50), nullable=False)
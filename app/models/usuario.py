@@ -21,7 +21,7 @@ class Usuario(Base):
         id: Primary key.
         username: Unique login username.
         email: Unique email address.
-        password_hash: Bcrypt-hashed password (never store plain text).
+        password_hash: Argon2id (or legacy bcrypt) password hash (never store plain text).
         nombre_completo: Full display name.
         rol: Role identifier controlling permissions.
         ue_id: Optional FK to UnidadEjecutora (restricts data scope).
@@ -40,7 +40,7 @@ class Usuario(Base):
     nombre_completo = Column(String(300), nullable=True)
     rol = Column(String(50), nullable=True)
     # "ADMIN", "GERENCIA", "PRESUPUESTO", "LOGISTICA", "CONSULTA"
-    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id"), nullable=True)
+    ue_id = Column(Integer, ForeignKey("unidad_ejecutora.id", ondelete="CASCADE"), nullable=True, index=True)
     activo = Column(Boolean, default=True, nullable=False)
     ultimo_acceso = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=func.now(), nullable=False)
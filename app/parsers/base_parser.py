@@ -85,6 +85,13 @@ class BaseParser(ABC):
     binary-mode file object so it works both from the filesystem and from
     FastAPI ``UploadFile.read()``.
 
+    Presupuestal records normally carry ``ue_codigo``, ``meta_codigo`` and
+    ``clasificador_codigo``, which the import service resolves to FK IDs.
+    A parser that already knows the IDs may instead set ``ue_id``,
+    ``meta_id`` and ``clasificador_id`` on *every* record (with ``anio``
+    filled in and no keys outside the table columns, besides ``_``-prefixed
+    ones); the service then skips the code lookup entirely.
+
     Attributes:
         file_source: The original argument passed to the constructor.
         workbook_bytes: Raw bytes of the workbook, kept for re-parsing.
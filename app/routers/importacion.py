@@ -19,10 +19,11 @@ DELETE /limpiar-formato/{formato} — Delete imported data for a format.
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
@@ -41,7 +42,7 @@ from app.services import importacion_service
 from app.services.template_service import (
     FORMATO_CATALOG,
     generate_all_templates,
-    generate_template,
+    get_template_bytes,
 )
 
 logger = logging.getLogger(__name__)
@@ -371,15 +372,15 @@ def get_formatos_catalogo(
     settings = get_settings()
     result: list[FormatoCatalogItem] = []
     for fmt in FORMATO_CATALOG:
-        plantilla_path = settings.PLANTILLAS_DIR / f"plantilla_{fmt['key']}.xlsx"
+        plantilla_path = settings.PLANTILLAS_DIR / f"plantilla_{fmt.key}.xlsx"
         result.append(
             FormatoCatalogItem(
-                key=fmt["key"],
-                nombre=fmt["nombre"],
-                descripcion=fmt["descripcion"],
-                hoja=fmt["hoja"],
-                columnas=len(fmt["columnas"]),
-                fila_inicio=fmt["fila_inicio"],
+                key=fmt.key,
+                nombre=fmt.nombre,
+                descripcion=fmt.descripcion,
+                hoja=fmt.hoja,
+                columnas=len(fmt.columnas),
+                fila_inicio=fmt.fila_inicio,
                 tiene_plantilla=plantilla_path.exists(),
             )
         )
@@ -403,24 +404,29 @@ def get_formatos_catalogo(
 def download_plantilla(
     formato_key: str,
     _current_user: Annotated[Usuario, Depends(get_current_user)],
-) -> FileResponse:
-    settings = get_settings()
-    plantilla_path = settings.PLANTILLAS_DIR / f"plantilla_{formato_key}.xlsx"
-
-    if not plantilla_path.exists():
-        # Try generating it on-the-fly
-        try:
-            generate_template(formato_key, plantilla_path)
-        except KeyError:
+) -> Response:
+    # Catalog formats are served from the in-memory template cache (the files
+    # under PLANTILLAS_DIR are written from the same bytes).  Other templates
+    # (e.g. SIAF/SIGA from generate_examples.py) only exist as files.
+    try:
+        content = get_template_bytes(formato_key)
+    except KeyError:
+        plantilla_path = get_settings().PLANTILLAS_DIR / f"plantilla_{formato_key}.xlsx"
+        if not plantilla_path.is_file():
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Formato '{formato_key}' no encontrado en el catalogo.",
             )
+        return FileResponse(
+            path=str(plantilla_path),
+            filename=plantilla_path.name,
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
 
-    return FileResponse(
-        path=str(plantilla_path),
-        filename=f"plantilla_{formato_key}.xlsx",
+    return Response(
+        content=content,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Content-Disposition": f'attachment; filename="plantilla_{formato_key}.xlsx"'},
     )
 
 
@@ -442,7 +448,7 @@ def regenerar_plantillas(
     _current_user: Annotated[Usuario, Depends(require_role("ADMIN"))],
 ) -> dict:
     settings = get_settings()
-    generated = generate_all_templates(settings.PLANTILLAS_DIR)
+    generated = generate_all_templates(settings.PLANTILLAS_DIR, force=True)
     return {
         "message": f"{len(generated)} plantillas regeneradas exitosamente.",
         "archivos": generated,
@@ -459,6 +465,10 @@ def regenerar_plantillas(
     summary="Eliminar datos importados de un formato",
     description=(
         "Elimina los datos importados y el historial de un formato especifico. "
+        "El borrado es en cascada: limpiar FORMATO_1, FORMATO_2, FORMATO_3 o "
+        "SIAF elimina toda la programacion presupuestal junto con su "
+        "programacion mensual. CUADRO_AO_META solo elimina las actividades "
+        "operativas; unidades ejecutoras y metas no se borran. "
         "Requiere rol ADMIN."
     ),
     responses={
@@ -522,7 +532,8 @@ def get_estado_formatos(
     summary="Historial de importaciones",
     description=(
         "Lista los registros de importación ordenados del más reciente al más antiguo. "
-        "Filtrable por año fiscal. Cualquier usuario autenticado puede consultar el historial."
+        "Filtrable por año fiscal y paginado por cursor (fecha, id) del último registro. "
+        "Cualquier usuario autenticado puede consultar el historial."
     ),
     responses={
         200: {"description": "Lista de importaciones registradas."},
@@ -536,17 +547,48 @@ def get_historial(
         int | None,
         Query(description="Filtrar por año fiscal, ej. 2026.", ge=2000, le=2100),
     ] = None,
+    limit: Annotated[
+        int,
+        Query(
+            description="Cantidad máxima de registros a retornar.",
+            ge=1,
+            le=importacion_service.HISTORIAL_LIMIT_MAX,
+        ),
+    ] = importacion_service.HISTORIAL_LIMIT_DEFAULT,
+    cursor_fecha: Annotated[
+        datetime | None,
+        Query(description="Fecha del último registro de la página anterior."),
+    ] = None,
+    cursor_id: Annotated[
+        int | None,
+        Query(description="ID del último registro de la página anterior.", ge=1),
+    ] = None,
 ) -> list[HistorialImportacion]:
-    """Return the import history list, optionally filtered by fiscal year.
+    """Return one page of the import history, optionally filtered by fiscal year.
 
     Args:
         db: Database session.
         _current_user: Authenticated user guard.
         anio: Optional year filter applied to the ``fecha`` column.
+        limit: Maximum number of records in the page.
+        cursor_fecha: ``fecha`` of the last record already received.
+        cursor_id: ``id`` of the last record already received.
 
     Returns:
         List of ``HistorialImportacion`` records, most-recent first.
+
+    Raises:
+        HTTPException 422: If only one of the two cursor fields is given.
     """
+    if (cursor_fecha is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="cursor_fecha y cursor_id deben enviarse juntos.",
+        )
+    cursor = (cursor_fecha, cursor_id) if cursor_id is not None else None
+
     filters = FilterParams(anio=anio)
-    logger.debug("GET /importacion/historial anio=%s", anio)
-    return importacion_service.get_historial(db, filters)
+    logger.debug(
+        "GET /importacion/historial anio=%s limit=%d cursor=%s", anio, limit, cursor,
+    )
+    return importacion_service.get_historial(db, filters, limit=limit, cursor=cursor)
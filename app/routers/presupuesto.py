@@ -12,6 +12,7 @@ Endpoints
 GET /kpis                     — Four KPI header cards (totals + execution %).
 GET /grafico-pim-certificado  — Bar chart: PIM vs certificado vs devengado by UE.
 GET /grafico-ejecucion        — Bar chart: UEs ranked by execution % descending.
+GET /dashboard                — KPIs + every chart in one call.
 GET /grafico-devengado-mensual— Line chart: monthly programado vs ejecutado.
 GET /tabla                    — Paginated detail table with full joins.
 """
@@ -19,15 +20,17 @@ GET /tabla                    — Paginated detail table with full joins.
 from __future__ import annotations
 
 import logging
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.usuario import Usuario
 from app.schemas.common import FilterParams, PaginationParams
 from app.schemas.presupuesto import (
+    DashboardPresupuestoResponse,
+    GraficoBarColumnas,
     GraficoBarItem,
     GraficoEvolucionItem,
     KpiPresupuestoResponse,
@@ -40,6 +43,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Presupuesto"])
 
+#: ``formato`` query parameter shared by the bar-chart endpoints.
+_FormatoBar = Annotated[
+    Literal["filas", "columnas"],
+    Query(description="'filas': lista de objetos por UE. 'columnas': un arreglo por campo."),
+]
+
 
 # ---------------------------------------------------------------------------
 # Shared dependency — build FilterParams from Query parameters
@@ -101,17 +110,22 @@ def _pagination_params(
     page_size: Annotated[
         int, Query(description="Registros por página (máx. 200).", ge=1, le=200)
     ] = 20,
+    after_id: Annotated[
+        int | None,
+        Query(description="Cursor: next_cursor de la página anterior. Reemplaza a 'page'.", ge=0),
+    ] = None,
 ) -> PaginationParams:
     """Assemble a ``PaginationParams`` instance from URL query parameters.
 
     Args:
         page: 1-based page number.
         page_size: Number of rows per page.
+        after_id: Optional keyset cursor (``next_cursor`` of the previous page).
 
     Returns:
         A validated ``PaginationParams`` instance.
     """
-    return PaginationParams(page=page, page_size=page_size)
+    return PaginationParams(page=page, page_size=page_size, after_id=after_id)
 
 
 # ---------------------------------------------------------------------------
@@ -160,11 +174,12 @@ def get_kpis(
 
 @router.get(
     "/grafico-pim-certificado",
-    response_model=list[GraficoBarItem],
+    response_model=list[GraficoBarItem] | GraficoBarColumnas,
     summary="Gráfico PIM vs Certificado por UE",
     description=(
         "Retorna los montos de PIM, certificado y devengado agrupados por Unidad Ejecutora, "
-        "ordenados por PIM descendente. Usado en el gráfico de barras del dashboard."
+        "ordenados por PIM descendente. Usado en el gráfico de barras del dashboard. "
+        "Con formato=columnas retorna un arreglo por campo."
     ),
     responses={
         200: {"description": "Lista de items por UE."},
@@ -175,19 +190,22 @@ def get_grafico_pim_certificado(
     filters: Annotated[FilterParams, Depends(_filter_params)],
     db: Annotated[Session, Depends(get_db)],
     _current_user: Annotated[Usuario, Depends(get_current_user)],
-) -> list[GraficoBarItem]:
+    formato: _FormatoBar = "filas",
+) -> list[GraficoBarItem] | GraficoBarColumnas:
     """Return PIM vs certificado vs devengado grouped by executing unit.
 
     Args:
         filters: Year, UE, meta, and funding-source constraints.
         db: Database session.
         _current_user: Authenticated user guard.
+        formato: Row-oriented (default) or column-oriented payload.
 
     Returns:
-        List of bar-chart items, one per UE, ordered by PIM descending.
+        Bar-chart items, one per UE, ordered by PIM descending.
     """
     logger.debug("GET /presupuesto/grafico-pim-certificado filters=%s", filters)
-    return presupuesto_service.get_grafico_pim_certificado(db, filters)
+    items = presupuesto_service.get_grafico_pim_certificado(db, filters)
+    return presupuesto_service.a_columnas(items) if formato == "columnas" else items
 
 
 # ---------------------------------------------------------------------------
@@ -197,11 +215,13 @@ def get_grafico_pim_certificado(
 
 @router.get(
     "/grafico-ejecucion",
-    response_model=list[GraficoBarItem],
+    response_model=list[GraficoBarItem] | GraficoBarColumnas,
     summary="Ranking de ejecución por UE",
     description=(
         "Retorna las Unidades Ejecutoras ordenadas por porcentaje de ejecución "
-        "(devengado / PIM) de mayor a menor. Excluye UEs sin presupuesto asignado."
+        "(devengado / PIM) de mayor a menor. Excluye UEs sin presupuesto asignado. "
+        "Use 'top' para limitar el ranking a las N primeras y formato=columnas para "
+        "recibir un arreglo por campo."
     ),
     responses={
         200: {"description": "Lista de UEs ordenada por ejecución."},
@@ -212,19 +232,68 @@ def get_grafico_ejecucion(
     filters: Annotated[FilterParams, Depends(_filter_params)],
     db: Annotated[Session, Depends(get_db)],
     _current_user: Annotated[Usuario, Depends(get_current_user)],
-) -> list[GraficoBarItem]:
+    top: Annotated[
+        int | None,
+        Query(description="Número máximo de UEs a retornar. Omitir para todas.", ge=1),
+    ] = None,
+    formato: _FormatoBar = "filas",
+) -> list[GraficoBarItem] | GraficoBarColumnas:
     """Return executing units ranked by execution percentage.
 
     Args:
         filters: Year, UE, meta, and funding-source constraints.
         db: Database session.
         _current_user: Authenticated user guard.
+        top: Optional limit on the number of ranked UEs.
+        formato: Row-oriented (default) or column-oriented payload.
 
     Returns:
-        List of bar-chart items sorted by execution percentage (highest first).
+        Bar-chart items sorted by execution percentage (highest first).
     """
-    logger.debug("GET /presupuesto/grafico-ejecucion filters=%s", filters)
-    return presupuesto_service.get_grafico_ejecucion(db, filters)
+    logger.debug("GET /presupuesto/grafico-ejecucion filters=%s top=%s", filters, top)
+    items = presupuesto_service.get_grafico_ejecucion(db, filters, top_n=top)
+    return presupuesto_service.a_columnas(items) if formato == "columnas" else items
+
+
+# ---------------------------------------------------------------------------
+# GET /dashboard
+# ---------------------------------------------------------------------------
+
+
+@router.get(
+    "/dashboard",
+    response_model=DashboardPresupuestoResponse,
+    summary="KPIs y gráficos del dashboard en una sola llamada",
+    description=(
+        "Retorna en una sola respuesta los KPIs, el gráfico PIM vs Certificado, el "
+        "ranking de ejecución por UE y la evolución mensual. Las consultas por UE y "
+        "mensual se ejecutan en paralelo. "
+        "Acepta los mismos filtros que los endpoints individuales."
+    ),
+    responses={
+        200: {"description": "KPIs y gráficos del dashboard."},
+        401: {"description": "Token JWT ausente o inválido."},
+    },
+)
+async def get_dashboard(
+    filters: Annotated[FilterParams, Depends(_filter_params)],
+    _current_user: Annotated[Usuario, Depends(get_current_user)],
+) -> DashboardPresupuestoResponse:
+    """Return the KPI cards and every chart in one response.
+
+    The service opens its own sessions so the independent queries can run
+    concurrently; no request-scoped session is needed here.
+
+    Args:
+        filters: Year, UE, meta, and funding-source constraints.
+        _current_user: Authenticated user guard.
+
+    Returns:
+        The ``/kpis``, ``/grafico-pim-certificado``, ``/grafico-ejecucion`` and
+        ``/grafico-devengado-mensual`` payloads bundled together.
+    """
+    logger.debug("GET /presupuesto/dashboard filters=%s", filters)
+    return await presupuesto_service.get_dashboard_bundle(filters)
 
 
 # ---------------------------------------------------------------------------
@@ -288,9 +357,13 @@ def get_tabla(
     pagination: Annotated[PaginationParams, Depends(_pagination_params)],
     db: Annotated[Session, Depends(get_db)],
     _current_user: Annotated[Usuario, Depends(get_current_user)],
-) -> TablaPresupuestoResponse:
+) -> Response:
     """Return a paginated budget detail table with all human-readable labels resolved.
 
+    The page is encoded once by pydantic-core (``model_dump_json``) and sent
+    as-is, skipping FastAPI's second pass over every row through
+    ``jsonable_encoder`` and ``json.dumps``.
+
     Args:
         filters: Year, UE, meta, and funding-source constraints.
         pagination: Page number and page size.
@@ -298,11 +371,12 @@ def get_tabla(
         _current_user: Authenticated user guard.
 
     Returns:
-        A ``TablaPresupuestoResponse`` with the current page of rows, total
-        row count, and pagination metadata.
+        A JSON ``TablaPresupuestoResponse`` with the current page of rows,
+        total row count, and pagination metadata.
     """
     logger.debug(
         "GET /presupuesto/tabla filters=%s page=%d size=%d",
         filters, pagination.page, pagination.page_size,
     )
-    return presupuesto_service.get_tabla(db, filters, pagination)
+    tabla = presupuesto_service.get_tabla(db, filters, pagination)
+    return Response(content=tabla.model_dump_json(), media_type="application/json")
@@ -60,6 +60,9 @@ class PaginationParams(BaseModel):
     Attributes:
         page: 1-based page number.
         page_size: Number of rows per page (capped at 200 to protect DB).
+        after_id: Keyset cursor — the last id of the previous page.  When
+            set, endpoints that support it seek past it instead of using
+            ``page`` as an offset.
     """
 
     page: int = Field(
@@ -73,6 +76,11 @@ class PaginationParams(BaseModel):
         le=200,
         description="Registros por página (máximo 200).",
     )
+    after_id: int | None = Field(
+        default=None,
+        ge=0,
+        description="Cursor: último id de la página anterior (paginación por keyset).",
+    )
 
 
 class MessageResponse(BaseModel):
@@ -101,6 +101,43 @@ class GraficoBarItem(BaseModel):
     )
 
 
+class GraficoBarColumnas(BaseModel):
+    """Column-oriented form of a ``GraficoBarItem`` list.
+
+    Returned by the bar-chart endpoints when ``formato=columnas``: one array
+    per field instead of one object per UE, so field names are not repeated
+    for every bar and the arrays can be fed to the chart series directly.
+    Position *i* of every array describes the same UE.
+
+    Attributes:
+        nombre: X-axis labels.
+        pim: PIM amounts in soles.
+        certificado: Certified amounts in soles.
+        devengado: Accrued expenditure in soles.
+        ejecucion_porcentaje: Execution percentages.
+    """
+
+    nombre: list[str] = Field(..., description="Etiquetas del eje X.")
+    pim: list[float] = Field(..., description="PIM en soles por UE.")
+    certificado: list[float] = Field(..., description="Monto certificado en soles por UE.")
+    devengado: list[float] = Field(..., description="Devengado en soles por UE.")
+    ejecucion_porcentaje: list[float] = Field(
+        ..., description="Porcentaje de ejecución por UE."
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "nombre": ["INEI-LIMA", "ODEI-CUSCO"],
+                "pim": [12_500_000.0, 3_200_000.0],
+                "certificado": [10_800_000.0, 2_900_000.0],
+                "devengado": [9_400_000.0, 2_100_000.0],
+                "ejecucion_porcentaje": [75.2, 65.63],
+            }
+        }
+    )
+
+
 # ---------------------------------------------------------------------------
 # Evolution line chart — monthly programado vs ejecutado
 # ---------------------------------------------------------------------------
@@ -130,6 +167,27 @@ class GraficoEvolucionItem(BaseModel):
     )
 
 
+# ---------------------------------------------------------------------------
+# Dashboard bundle (KPIs + every chart)
+# ---------------------------------------------------------------------------
+
+
+class DashboardPresupuestoResponse(BaseModel):
+    """KPI cards and every dashboard chart, returned by ``GET /dashboard``.
+
+    Attributes:
+        kpis: Same payload as ``GET /kpis``.
+        grafico_pim_certificado: Same payload as ``GET /grafico-pim-certificado``.
+        grafico_ejecucion: Same payload as ``GET /grafico-ejecucion``.
+        grafico_devengado_mensual: Same payload as ``GET /grafico-devengado-mensual``.
+    """
+
+    kpis: KpiPresupuestoResponse
+    grafico_pim_certificado: list[GraficoBarItem]
+    grafico_ejecucion: list[GraficoBarItem]
+    grafico_devengado_mensual: list[GraficoEvolucionItem]
+
+
 # ---------------------------------------------------------------------------
 # Paginated detail table
 # ---------------------------------------------------------------------------
@@ -192,12 +250,16 @@ class TablaPresupuestoResponse(BaseModel):
         total: Total number of matching rows (ignoring pagination).
         page: Current page number (1-based).
         page_size: Number of rows per page as requested.
+        next_cursor: ``after_id`` for the next page, or ``None`` on the last one.
     """
 
     rows: list[TablaPresupuestoRow]
     total: int = Field(..., ge=0, description="Total de registros sin paginar.")
     page: int = Field(..., ge=1, description="Página actual (base 1).")
     page_size: int = Field(..., ge=1, description="Registros por página.")
+    next_cursor: int | None = Field(
+        None, description="Valor de after_id para pedir la página siguiente."
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -206,6 +268,7 @@ class TablaPresupuestoResponse(BaseModel):
                 "total": 450,
                 "page": 1,
                 "page_size": 20,
+                "next_cursor": 20,
             }
         }
     )
@@ -45,7 +45,7 @@ class UsuarioCreate(BaseModel):
         ...,
         min_length=8,
         max_length=128,
-        description="Contraseña en texto plano; se almacenará hasheada con bcrypt",
+        description="Contraseña en texto plano; se almacenará hasheada con Argon2id",
     )
     nombre_completo: str = Field(
         ...,
@@ -54,9 +54,13 @@ from app.schemas.adquisicion import (
 from app.schemas.common import PaginationParams
 from app.utils.constants import (
     ESTADOS_ADQUISICION,
+    ESTADOS_ADQUISICION_SET,
     FASES_ADQUISICION,
+    FASES_ADQUISICION_SET,
     TIPOS_OBJETO,
+    TIPOS_OBJETO_SET,
     TIPOS_PROCEDIMIENTO,
+    TIPOS_PROCEDIMIENTO_SET,
 )
 
 logger = logging.getLogger(__name__)
@@ -515,7 +519,7 @@ def create_adquisicion(
         HTTPException 409: If an explicit ``data.codigo`` is already in use.
     """
     # Validate enumerated fields against known constants
-    if data.tipo_objeto not in TIPOS_OBJETO:
+    if data.tipo_objeto not in TIPOS_OBJETO_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
@@ -523,7 +527,7 @@ def create_adquisicion(
                 f"Valores válidos: {TIPOS_OBJETO}."
             ),
         )
-    if data.tipo_procedimiento not in TIPOS_PROCEDIMIENTO:
+    if data.tipo_procedimiento not in TIPOS_PROCEDIMIENTO_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
@@ -606,7 +610,7 @@ def update_adquisicion(
         )
 
     # Validate enumerated fields when supplied
-    if data.estado is not None and data.estado not in ESTADOS_ADQUISICION:
+    if data.estado is not None and data.estado not in ESTADOS_ADQUISICION_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
@@ -614,7 +618,7 @@ def update_adquisicion(
                 f"Valores válidos: {ESTADOS_ADQUISICION}."
             ),
         )
-    if data.fase_actual is not None and data.fase_actual not in FASES_ADQUISICION:
+    if data.fase_actual is not None and data.fase_actual not in FASES_ADQUISICION_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
@@ -622,7 +626,7 @@ def update_adquisicion(
                 f"Valores válidos: {FASES_ADQUISICION}."
             ),
         )
-    if data.tipo_objeto is not None and data.tipo_objeto not in TIPOS_OBJETO:
+    if data.tipo_objeto is not None and data.tipo_objeto not in TIPOS_OBJETO_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
@@ -632,7 +636,7 @@ def update_adquisicion(
         )
     if (
         data.tipo_procedimiento is not None
-        and data.tipo_procedimiento not in TIPOS_PROCEDIMIENTO
+        and data.tipo_procedimiento not in TIPOS_PROCEDIMIENTO_SET
     ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -82,6 +82,11 @@ def _safe_pct(numerator: float, denominator: float) -> float:
     return round((numerator / denominator) * 100, 2)
 
 
+# Semaforo thresholds on the 0–100 percentage scale used by _safe_pct.
+_SEMAFORO_VERDE_PCT: float = SEMAFORO_VERDE_MIN * 100        # 90.0
+_SEMAFORO_AMARILLO_PCT: float = SEMAFORO_AMARILLO_MIN * 100  # 70.0
+
+
 def _semaforo(pct: float) -> str:
     """Convert an execution percentage to a traffic-light colour string.
 
@@ -96,12 +101,9 @@ def _semaforo(pct: float) -> str:
     Returns:
         One of ``"VERDE"``, ``"AMARILLO"``, or ``"ROJO"``.
     """
-    verde_threshold = SEMAFORO_VERDE_MIN * 100      # 90.0
-    amarillo_threshold = SEMAFORO_AMARILLO_MIN * 100  # 70.0
-
-    if pct >= verde_threshold:
+    if pct >= _SEMAFORO_VERDE_PCT:
         return "VERDE"
-    if pct >= amarillo_threshold:
+    if pct >= _SEMAFORO_AMARILLO_PCT:
         return "AMARILLO"
     return "ROJO"
 
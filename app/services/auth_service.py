@@ -21,7 +21,12 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.usuario import Usuario
-from app.utils.security import verify_password, verify_token
+from app.utils.security import (
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+    verify_token,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +47,7 @@ def authenticate_user(db: Session, username: str, password: str) -> Usuario | No
     """Verify username/password credentials against the database.
 
     Looks up the user by ``username``, confirms the account is active,
-    and validates the supplied password against the stored bcrypt hash.
+    and validates the supplied password against the stored password hash.
     Returns ``None`` (instead of raising) so that callers can control the
     HTTP error response.
 
@@ -71,8 +76,12 @@ def authenticate_user(db: Session, username: str, password: str) -> Usuario | No
         logger.debug("authenticate_user: wrong password for user '%s'", username)
         return None
 
-    # Update last-access timestamp — best-effort, do not rollback on failure.
+    # Update last-access timestamp (and upgrade a legacy/outdated password
+    # hash while the plain password is at hand) — best-effort, do not
+    # rollback on failure.
     try:
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = hash_password(password)
         user.ultimo_acceso = datetime.now(timezone.utc)
         db.commit()
     except Exception:  # pragma: no cover
@@ -42,6 +42,7 @@ class _ExportPagination:
     """Lightweight pagination for exports — bypasses PaginationParams validation cap."""
     page: int = 1
     page_size: int = 5_000
+    after_id: int | None = None
 
 
 # Large but bounded page used for exports (5,000 rows maximum per export)
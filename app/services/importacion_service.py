@@ -6,12 +6,16 @@ Handles Excel and system-export (SIAF/SIGA) file uploads end-to-end:
 1. Detect the file format using the existing ``app.parsers.detector`` module.
 2. Dispatch to the format's registered parser (``BaseParser`` subclasses).
 3. Bulk-insert valid records into the appropriate database tables.
-4. Write a ``RegistroImportacion`` audit row.
+4. Write a ``RegistroImportacion`` audit row — in the import transaction,
+   or after the data commit in its own session (``IMPORT_AUDIT_ASYNC``).
 5. Return an ``ImportacionUploadResponse`` summary to the calling router.
 
 Bulk insert strategy
 --------------------
 - ``ProgramacionPresupuestal`` rows: keyed on (anio, ue_id, meta_id, clasificador_id).
+  SIAF re-imports upsert in chunks with ``INSERT ... ON CONFLICT DO UPDATE``.
+- Plain (non-upsert) inserts use ``COPY ... FROM STDIN`` on PostgreSQL and an
+  executemany ``INSERT`` on other dialects (see ``_copy_insert``).
 - ``ProgramacionMensual`` rows: keyed on (programacion_presupuestal_id, mes).
   Formats 5A/5B resolve AO codes → presupuestal IDs via ActividadOperativa FK chain.
 - ``ModificacionPresupuestal`` rows: from FORMATO_04 records.
@@ -21,17 +25,26 @@ Bulk insert strategy
 
 from __future__ import annotations
 
+import asyncio
+import io
 import json
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from fastapi import UploadFile
-from sqlalchemy import extract, func
+from sqlalchemy import (
+    Table, and_, case, delete, func, insert, literal, or_, select, tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
+from app.database import SessionLocal
 from app.models.actividad_operativa import ActividadOperativa
 from app.models.clasificador_gasto import ClasificadorGasto
 from app.models.meta_presupuestal import MetaPresupuestal
@@ -50,6 +63,10 @@ from app.schemas.importacion import (
     ImportacionUploadResponse,
 )
 from app.services.file_storage import save_upload
+from app.services.presupuesto_service import (
+    invalidate_presupuesto_cache,
+    refresh_resumen_mensual,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -103,20 +120,46 @@ def _strip_internal_keys(rec: dict[str, Any]) -> dict[str, Any]:
     return {k: v for k, v in rec.items() if not k.startswith("_")}
 
 
+def _load_code_maps(db: Session) -> tuple[dict[str, int], dict[str, int]]:
+    """Return ``(ue_map, meta_map)`` mapping UE and Meta ``codigo`` to ``id``."""
+    ue_map: dict[str, int] = dict(
+        db.execute(select(UnidadEjecutora.codigo, UnidadEjecutora.id)).tuples().all()
+    )
+    meta_map: dict[str, int] = dict(
+        db.execute(select(MetaPresupuestal.codigo, MetaPresupuestal.id)).tuples().all()
+    )
+    return ue_map, meta_map
+
+
+#: FK columns a parser may fill in itself to skip code resolution.
+_PRESUPUESTAL_FK_FIELDS: tuple[str, ...] = ("ue_id", "meta_id", "clasificador_id")
+
+
+def _has_resolved_fks(records: list[dict[str, Any]]) -> bool:
+    """True when every record already carries non-null ``_PRESUPUESTAL_FK_FIELDS``."""
+    return all(
+        rec.get(field) is not None
+        for rec in records
+        for field in _PRESUPUESTAL_FK_FIELDS
+    )
+
+
 def _resolve_codes_to_ids(
-    db: Session, records: list[dict[str, Any]]
+    db: Session,
+    records: list[dict[str, Any]],
+    *,
+    ue_map: dict[str, int] | None = None,
+    meta_map: dict[str, int] | None = None,
 ) -> tuple[list[dict[str, Any]], list[str]]:
     """Resolve ``ue_codigo``, ``meta_codigo``, ``clasificador_codigo`` to FK IDs.
 
     Auto-creates missing UE, Meta, and Clasificador entries so that data
-    formats can be loaded independently of master data.
+    formats can be loaded independently of master data.  ``ue_map`` and
+    ``meta_map`` may be shared with other resolvers; auto-created entries
+    are added to them in place.
     """
-    ue_map: dict[str, int] = {
-        ue.codigo: ue.id for ue in db.query(UnidadEjecutora).all()
-    }
-    meta_map: dict[str, int] = {
-        m.codigo: m.id for m in db.query(MetaPresupuestal).all()
-    }
+    if ue_map is None or meta_map is None:
+        ue_map, meta_map = _load_code_maps(db)
     clas_map: dict[str, int] = {
         c.codigo: c.id for c in db.query(ClasificadorGasto).all()
     }
@@ -235,86 +278,207 @@ def _resolve_codes_to_ids(
 
         # Remove extra keys not in the table
         new_rec.pop("descripcion", None)
-        valid_cols = {c.name for c in ProgramacionPresupuestal.__table__.columns} - {"id"}
-        new_rec = {k: v for k, v in new_rec.items() if k in valid_cols}
+        new_rec = {k: v for k, v in new_rec.items() if k in _PRESUPUESTAL_COLUMNS}
         resolved.append(new_rec)
 
     return resolved, warnings
 
 
+#: Insertable ProgramacionPresupuestal columns, computed once per process
+#: instead of once per record.
+_PRESUPUESTAL_COLUMNS: frozenset[str] = frozenset(
+    c.name for c in ProgramacionPresupuestal.__table__.columns if c.name != "id"
+)
+
+#: Rows per ``INSERT ... ON CONFLICT`` statement in the SIAF upsert.
+_UPSERT_CHUNK_SIZE: int = 1000
+
+#: Conflict target (must match ``uq_programacion_presupuestal_clave``).
+_PRESUPUESTAL_KEY: tuple[str, ...] = ("anio", "ue_id", "meta_id", "clasificador_id")
+
+#: Amount columns a SIAF upsert may overwrite (only with non-zero values).
+_PRESUPUESTAL_UPSERT_FIELDS: tuple[str, ...] = (
+    "pia", "pim", "certificado", "compromiso_anual", "devengado", "girado", "saldo",
+)
+
+
+def _dialect_insert(db: Session) -> Any:
+    """Return the ``insert`` construct supporting ``on_conflict_do_update``."""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
+
+
+def _copy_field(value: Any) -> str:
+    """Format one value as a ``COPY ... CSV`` field.
+
+    ``None`` is the unquoted empty field COPY reads as NULL; every other
+    value is quoted, so an empty string is loaded as ``''`` just as the
+    ``INSERT`` fallback stores it.
+    """
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_insert(db: Session, table: Table, records: list[dict[str, Any]]) -> int:
+    """Insert ``records`` into ``table``; return the row count.
+
+    On PostgreSQL the rows are streamed as CSV through ``COPY ... FROM STDIN``
+    on the session's own connection, so they join the import transaction.
+    Other dialects (SQLite in tests) fall back to an executemany ``INSERT``.
+
+    Rows are sent in batches of ``_UPSERT_CHUNK_SIZE``, so the expanded rows
+    and the CSV buffer never hold more than one batch at a time.  Every row
+    is expanded to the full column set; missing keys take the column's
+    scalar Python default, as the ORM would have applied.
+    """
+    if not records:
+        return 0
+
+    cols = [c for c in table.columns if not c.primary_key]
+    defaults = {
+        c.name: c.default.arg if c.default is not None and c.default.is_scalar else None
+        for c in cols
+    }
+    names = list(defaults)
+    use_copy = db.get_bind().dialect.name == "postgresql"
+    copy_sql = f"COPY {table.name} ({', '.join(names)}) FROM STDIN WITH (FORMAT csv)"
+
+    for chunk in _chunks(records, _UPSERT_CHUNK_SIZE):
+        rows = [{**defaults, **{k: v for k, v in r.items() if k in defaults}} for r in chunk]
+        if not use_copy:
+            db.execute(insert(table), rows)
+            continue
+
+        buf = io.StringIO()
+        for row in rows:
+            buf.write(",".join([_copy_field(row[n]) for n in names]))
+            buf.write("\n")
+        buf.seek(0)
+
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(copy_sql, buf)
+        finally:
+            cursor.close()
+    return len(records)
+
+
+def _chunks(rows: list[Any], size: int) -> Iterator[list[Any]]:
+    """Yield consecutive slices of ``rows`` with at most ``size`` items."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _bulk_upsert_presupuestal(
+    db: Session, records: list[dict[str, Any]]
+) -> tuple[int, list[str]]:
+    """Upsert ProgramacionPresupuestal rows with ``INSERT ... ON CONFLICT DO UPDATE``.
+
+    New budget lines are inserted; existing ones get every amount column
+    for which the file carries a non-zero value.  Rows are sent in chunks of
+    ``_UPSERT_CHUNK_SIZE`` — one statement per chunk instead of a SELECT
+    plus UPDATE per row.  Rows whose amounts would not change are left
+    untouched and are not counted.
+    """
+    table = ProgramacionPresupuestal.__table__
+    defaults: dict[str, Any] = {f: 0 for f in _PRESUPUESTAL_UPSERT_FIELDS}
+    defaults["fuente_financiamiento"] = None
+
+    # Normalise every row to the same column set (required by multi-row
+    # VALUES) and merge repeated keys, since one statement cannot touch the
+    # same row twice.  Later non-zero amounts win, as with per-row updates.
+    merged: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for raw_rec in records:
+        rec = {**defaults, **_strip_internal_keys(raw_rec)}
+        key = tuple(rec.get(k) for k in _PRESUPUESTAL_KEY)
+        row = {c: rec.get(c) for c in (*_PRESUPUESTAL_KEY, *defaults)}
+        previous = merged.get(key)
+        if previous is None:
+            merged[key] = row
+        else:
+            for field in _PRESUPUESTAL_UPSERT_FIELDS:
+                if row[field]:
+                    previous[field] = row[field]
+
+    affected = 0
+    dialect_insert = _dialect_insert(db)
+    for chunk in _chunks(list(merged.values()), _UPSERT_CHUNK_SIZE):
+        stmt = dialect_insert(table).values(chunk)
+        excluded = stmt.excluded
+        has_value = {
+            f: and_(excluded[f].is_not(None), excluded[f] != 0)
+            for f in _PRESUPUESTAL_UPSERT_FIELDS
+        }
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(_PRESUPUESTAL_KEY),
+            set_={
+                f: case((has_value[f], excluded[f]), else_=table.c[f])
+                for f in _PRESUPUESTAL_UPSERT_FIELDS
+            },
+            where=or_(*(
+                and_(has_value[f], excluded[f].is_distinct_from(table.c[f]))
+                for f in _PRESUPUESTAL_UPSERT_FIELDS
+            )),
+        )
+        affected += db.execute(stmt).rowcount
+
+    warnings: list[str] = []
+    sin_cambios = len(records) - affected
+    if sin_cambios > 0:
+        warnings.append(f"{sin_cambios} registros existentes sin cambios.")
+    logger.info("_bulk_upsert_presupuestal: %d rows inserted/updated", affected)
+    return affected, warnings
+
+
 def _bulk_insert_presupuestal(
     db: Session, records: list[dict[str, Any]], *, upsert: bool = False
 ) -> tuple[int, list[str]]:
     """Bulk-insert ProgramacionPresupuestal rows.
 
-    When ``upsert=True`` (used by SIAF), existing rows are UPDATED with
-    execution fields (certificado, compromiso_anual, devengado, girado, saldo).
+    When ``upsert=True`` (used by SIAF), delegates to
+    :func:`_bulk_upsert_presupuestal`, which updates existing rows with the
+    non-zero amounts from the file (PIA/PIM and execution fields).
     When ``upsert=False`` (default), exact duplicates are skipped.
     """
-    inserted = 0
-    updated = 0
-    warnings: list[str] = []
+    if upsert:
+        return _bulk_upsert_presupuestal(db, records)
 
-    _EXECUTION_FIELDS = ("certificado", "compromiso_anual", "devengado", "girado", "saldo")
+    warnings: list[str] = []
 
+    # One query for the keys already stored for the years in this batch;
+    # rows added below are appended so in-file duplicates are caught too.
+    anios = {r.get("anio") for r in records}
+    seen: set[tuple[Any, ...]] = set(
+        db.execute(
+            select(*(getattr(ProgramacionPresupuestal, k) for k in _PRESUPUESTAL_KEY))
+            .where(ProgramacionPresupuestal.anio.in_(anios))
+        ).tuples()
+    ) if anios else set()
+
+    new_rows: list[dict[str, Any]] = []
     for raw_rec in records:
         rec = _strip_internal_keys(raw_rec)
         anio = rec.get("anio")
         ue_id = rec.get("ue_id")
         meta_id = rec.get("meta_id")
         clasificador_id = rec.get("clasificador_id")
+        key = (anio, ue_id, meta_id, clasificador_id)
 
-        existing = (
-            db.query(ProgramacionPresupuestal)
-            .filter(
-                ProgramacionPresupuestal.anio == anio,
-                ProgramacionPresupuestal.ue_id == ue_id,
-                ProgramacionPresupuestal.meta_id == meta_id,
-                ProgramacionPresupuestal.clasificador_id == clasificador_id,
+        if key in seen:
+            warnings.append(
+                f"Fila duplicada omitida: anio={anio}, ue_id={ue_id}, "
+                f"meta_id={meta_id}, clasificador_id={clasificador_id}."
             )
-            .first()
-        )
-        if existing:
-            if upsert:
-                # Update execution fields from SIAF data
-                changed = False
-                for field in _EXECUTION_FIELDS:
-                    new_val = rec.get(field)
-                    if new_val is not None and new_val != 0:
-                        old_val = getattr(existing, field, 0)
-                        if float(new_val) != float(old_val or 0):
-                            setattr(existing, field, new_val)
-                            changed = True
-                # Also update PIA/PIM if SIAF provides non-zero values
-                for field in ("pia", "pim"):
-                    new_val = rec.get(field)
-                    if new_val is not None and new_val != 0:
-                        old_val = getattr(existing, field, 0)
-                        if float(new_val) != float(old_val or 0):
-                            setattr(existing, field, new_val)
-                            changed = True
-                if changed:
-                    updated += 1
-                else:
-                    warnings.append(
-                        f"Registro existente sin cambios: anio={anio}, "
-                        f"clasificador_id={clasificador_id}."
-                    )
-            else:
-                warnings.append(
-                    f"Fila duplicada omitida: anio={anio}, ue_id={ue_id}, "
-                    f"meta_id={meta_id}, clasificador_id={clasificador_id}."
-                )
             continue
 
-        db.add(ProgramacionPresupuestal(**rec))
-        inserted += 1
+        new_rows.append(rec)
+        seen.add(key)
 
     db.flush()
-    total = inserted + updated
-    if updated:
-        logger.info("_bulk_insert_presupuestal: %d inserted, %d updated", inserted, updated)
-    return total, warnings
+    inserted = _copy_insert(db, ProgramacionPresupuestal.__table__, new_rows)
+    return inserted, warnings
 
 
 def _bulk_insert_mensual(
@@ -325,10 +489,26 @@ def _bulk_insert_mensual(
     When ``upsert=True`` (used by FORMATO_5B), existing rows are UPDATED
     with ejecutado and saldo values.  Otherwise duplicates are skipped.
     """
-    inserted = 0
     updated = 0
     warnings: list[str] = []
 
+    # Prefetch the stored months of every parent row in the batch instead of
+    # issuing one SELECT per record.  Rows added below are not registered:
+    # only months already in the DB count as existing.
+    existing_rows: dict[tuple[int, int], ProgramacionMensual] = {}
+    prog_ids = sorted({
+        r["programacion_presupuestal_id"]
+        for r in records if r.get("programacion_presupuestal_id")
+    })
+    for chunk in _chunks(prog_ids, _UPSERT_CHUNK_SIZE):
+        for row in db.scalars(
+            select(ProgramacionMensual)
+            .where(ProgramacionMensual.programacion_presupuestal_id.in_(chunk))
+            .order_by(ProgramacionMensual.id)
+        ):
+            existing_rows.setdefault((row.programacion_presupuestal_id, row.mes), row)
+
+    new_rows: list[dict[str, Any]] = []
     for raw_rec in records:
         rec = _strip_internal_keys(raw_rec)
         prog_id = rec.get("programacion_presupuestal_id")
@@ -338,14 +518,7 @@ def _bulk_insert_mensual(
             warnings.append(f"Registro mensual sin programacion_presupuestal_id (mes={mes}); omitido.")
             continue
 
-        existing = (
-            db.query(ProgramacionMensual)
-            .filter(
-                ProgramacionMensual.programacion_presupuestal_id == prog_id,
-                ProgramacionMensual.mes == mes,
-            )
-            .first()
-        )
+        existing = existing_rows.get((prog_id, mes))
         if existing:
             if upsert:
                 changed = False
@@ -362,13 +535,10 @@ def _bulk_insert_mensual(
                 warnings.append(f"Mes {mes} para programacion_id={prog_id} ya existe; omitido.")
             continue
 
-        # Filter to valid columns
-        valid_cols = {c.name for c in ProgramacionMensual.__table__.columns} - {"id"}
-        clean_rec = {k: v for k, v in rec.items() if k in valid_cols}
-        db.add(ProgramacionMensual(**clean_rec))
-        inserted += 1
+        new_rows.append(rec)
 
     db.flush()
+    inserted = _copy_insert(db, ProgramacionMensual.__table__, new_rows)
     total = inserted + updated
     if updated:
         logger.info("_bulk_insert_mensual: %d inserted, %d updated", inserted, updated)
@@ -381,7 +551,11 @@ def _bulk_insert_mensual(
 
 
 def _resolve_ao_to_presupuestal_id(
-    db: Session, records: list[dict[str, Any]]
+    db: Session,
+    records: list[dict[str, Any]],
+    *,
+    ue_map: dict[str, int] | None = None,
+    meta_map: dict[str, int] | None = None,
 ) -> tuple[list[dict[str, Any]], list[str]]:
     """Resolve ``codigo_ao`` + ``ue_codigo`` + ``meta_codigo`` to a
     ``programacion_presupuestal_id`` FK for ProgramacionMensual insertion.
@@ -393,21 +567,27 @@ def _resolve_ao_to_presupuestal_id(
        If multiple exist, pick the first one (they share the same budget line).
     4. If no ProgramacionPresupuestal exists, create a placeholder with 0 amounts
        so the mensual records have a valid FK.
+
+    ``ue_map``/``meta_map`` can be passed in to reuse maps already loaded
+    by :func:`_resolve_codes_to_ids` for the same upload.
     """
     warnings: list[str] = []
     resolved: list[dict[str, Any]] = []
 
-    # Build lookup caches
-    ao_map: dict[str, ActividadOperativa] = {
-        ao.codigo_ceplan: ao
-        for ao in db.query(ActividadOperativa).all()
-    }
-    ue_map: dict[str, int] = {
-        ue.codigo: ue.id for ue in db.query(UnidadEjecutora).all()
-    }
-    meta_map: dict[str, int] = {
-        m.codigo: m.id for m in db.query(MetaPresupuestal).all()
+    # Build lookup caches — only the AOs referenced by this upload
+    codigos_ao = {str(r.get("codigo_ao", "")).strip().upper() for r in records}
+    ao_map: dict[str, tuple[int | None, int | None]] = {
+        row.codigo_ceplan: (row.ue_id, row.meta_id)
+        for row in db.execute(
+            select(
+                ActividadOperativa.codigo_ceplan,
+                ActividadOperativa.ue_id,
+                ActividadOperativa.meta_id,
+            ).where(ActividadOperativa.codigo_ceplan.in_(codigos_ao))
+        )
     }
+    if ue_map is None or meta_map is None:
+        ue_map, meta_map = _load_code_maps(db)
 
     # Cache for presupuestal lookups: (anio, ue_id, meta_id) → presupuestal_id
     presup_cache: dict[tuple[int, int, int], int] = {}
@@ -423,8 +603,7 @@ def _resolve_ao_to_presupuestal_id(
 
         ao = ao_map.get(codigo_ao)
         if ao:
-            ue_id = ao.ue_id
-            meta_id = ao.meta_id
+            ue_id, meta_id = ao
 
         # Fall back to codes in the record
         ue_codigo = str(rec.get("ue_codigo", "")).strip()
@@ -671,7 +850,6 @@ def _bulk_insert_modificaciones(
     db: Session, records: list[dict[str, Any]]
 ) -> tuple[int, list[str]]:
     """Insert ModificacionPresupuestal rows from FORMATO_04 parser output."""
-    inserted = 0
     warnings: list[str] = []
 
     ue_map: dict[str, int] = {
@@ -681,8 +859,7 @@ def _bulk_insert_modificaciones(
         c.codigo: c.id for c in db.query(ClasificadorGasto).all()
     }
 
-    valid_cols = {c.name for c in ModificacionPresupuestal.__table__.columns} - {"id"}
-
+    new_rows: list[dict[str, Any]] = []
     for rec in records:
         clean = _strip_internal_keys(rec)
 
@@ -704,12 +881,9 @@ def _bulk_insert_modificaciones(
             else:
                 warnings.append(f"Modif: Clasificador '{clas_codigo}' no encontrado.")
 
-        # Remove extra fields not in model
-        clean = {k: v for k, v in clean.items() if k in valid_cols}
-        db.add(ModificacionPresupuestal(**clean))
-        inserted += 1
+        new_rows.append(clean)
 
-    db.flush()
+    inserted = _copy_insert(db, ModificacionPresupuestal.__table__, new_rows)
     logger.info("_bulk_insert_modificaciones: %d records inserted", inserted)
     return inserted, warnings
 
@@ -757,6 +931,42 @@ def _write_audit_log(
     )
 
 
+#: Pending post-commit audit writes.  The event loop only keeps weak
+#: references to tasks, so they are held here until done.
+_audit_tasks: set[asyncio.Task[None]] = set()
+
+
+def _append_audit_log(audit: dict[str, Any]) -> None:
+    """Write one audit row in a dedicated short-lived session."""
+    db = SessionLocal()
+    try:
+        _write_audit_log(db, **audit)
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception(
+            "Failed to write audit log for import '%s'", audit.get("archivo_nombre")
+        )
+    finally:
+        db.close()
+
+
+def _schedule_audit_log(audit: dict[str, Any]) -> None:
+    """Write the audit row off the request path, after the data commit.
+
+    Errors are logged inside the task, never raised to the caller.
+    """
+    task = asyncio.create_task(asyncio.to_thread(_append_audit_log, audit))
+    _audit_tasks.add(task)
+    task.add_done_callback(_audit_tasks.discard)
+
+
+async def drain_audit_tasks() -> None:
+    """Wait for pending audit writes (called on application shutdown)."""
+    if _audit_tasks:
+        await asyncio.gather(*_audit_tasks, return_exceptions=True)
+
+
 # ---------------------------------------------------------------------------
 # DB table dispatch for parser output
 # ---------------------------------------------------------------------------
@@ -786,100 +996,158 @@ _PASSTHROUGH_FORMATS: frozenset[str] = frozenset(
     {"FORMATO_5_RESUMEN", "ANEXO_01", "SIGA"}
 )
 
+#: Record ``_type`` values handled by ``_bulk_upsert_maestros``.
+_MAESTRO_TYPES: frozenset[str] = frozenset(
+    {"unidad_ejecutora", "meta_presupuestal", "actividad_operativa", "clasificador_gasto"}
+)
 
-def _persist_parse_result(
-    db: Session, formato: str, result: ParseResult
+#: Grouping key shared by all master data types in ``_group_by_type``.
+_MAESTRO_GROUP = "_maestro"
+
+#: Signature of a per-format persist handler: (db, formato, records).
+_PersistHandler = Callable[[Session, str, list[dict[str, Any]]], tuple[int, list[str]]]
+
+
+def _group_by_type(
+    records: list[dict[str, Any]],
+) -> defaultdict[str | None, list[dict[str, Any]]]:
+    """Split mixed parser output by ``_type`` in a single pass.
+
+    Master data types share one bucket so their file order is kept; records
+    with no _type (legacy parsers that don't tag records) land under None.
+    """
+    groups: defaultdict[str | None, list[dict[str, Any]]] = defaultdict(list)
+    for r in records:
+        rec_type = r.get("_type") or None
+        groups[_MAESTRO_GROUP if rec_type in _MAESTRO_TYPES else rec_type].append(r)
+    return groups
+
+
+def _persist_maestros(
+    db: Session, formato: str, records: list[dict[str, Any]]
 ) -> tuple[int, list[str]]:
-    """Route parser output to the correct table and insert valid rows.
+    """Master data formats → upsert into master tables."""
+    maestro_records = _group_by_type(records)[_MAESTRO_GROUP]
+    return _bulk_upsert_maestros(db, formato, maestro_records or records)
+
+
+def _persist_modificaciones(
+    db: Session, formato: str, records: list[dict[str, Any]]
+) -> tuple[int, list[str]]:
+    """FORMATO_04 → modificacion_presupuestal."""
+    modif_records = _group_by_type(records)["modificacion_presupuestal"]
+    return _bulk_insert_modificaciones(db, modif_records or records)
+
+
+def _persist_presupuestal(
+    db: Session, formato: str, records: list[dict[str, Any]]
+) -> tuple[int, list[str]]:
+    """Presupuestal formats (FORMATO_1/2/3, SIAF), plus embedded mensual rows.
 
     Handles mixed-type records (e.g. FORMATO_1 emitting both
     programacion_presupuestal and programacion_mensual records).
     """
-    all_records = result.records
     total_inserted = 0
     all_warnings: list[str] = []
-
-    # --- A5: Separate records by _type if mixed ---
-    presup_records = [r for r in all_records if r.get("_type") == "programacion_presupuestal"]
-    mensual_records = [r for r in all_records if r.get("_type") == "programacion_mensual"]
-    modif_records = [r for r in all_records if r.get("_type") == "modificacion_presupuestal"]
-    # Master data types
-    maestro_types = {"unidad_ejecutora", "meta_presupuestal", "actividad_operativa", "clasificador_gasto"}
-    maestro_records = [r for r in all_records if r.get("_type") in maestro_types]
-    # Records with no _type (legacy parsers that don't tag records)
-    untyped_records = [r for r in all_records if not r.get("_type")]
-
-    # --- Process by format category ---
-
-    # Master data formats
-    if formato in _MAESTRO_FORMATS and (maestro_records or all_records):
-        recs_to_use = maestro_records if maestro_records else all_records
-        ins, warns = _bulk_upsert_maestros(db, formato, recs_to_use)
-        total_inserted += ins
-        all_warnings.extend(warns)
-        return total_inserted, all_warnings
-
-    # FORMATO_04 → modificacion_presupuestal
-    if formato in _MODIFICACION_FORMATS:
-        recs = modif_records if modif_records else all_records
-        ins, warns = _bulk_insert_modificaciones(db, recs)
-        total_inserted += ins
-        all_warnings.extend(warns)
-        return total_inserted, all_warnings
-
-    # Presupuestal formats (FORMATO_1/2/3, SIAF)
-    if formato in _PRESUPUESTAL_FORMATS:
-        # Process presupuestal records (untyped or explicitly typed)
-        presup_to_insert = presup_records if presup_records else untyped_records if untyped_records else all_records
-        if presup_to_insert:
-            resolved, resolve_warns = _resolve_codes_to_ids(db, presup_to_insert)
-            # SIAF provides execution data — upsert to update existing rows
-            is_siaf = formato == "SIAF"
-            ins, insert_warns = _bulk_insert_presupuestal(db, resolved, upsert=is_siaf)
-            total_inserted += ins
-            all_warnings.extend(resolve_warns + insert_warns)
-
-        # Also process any mensual records embedded in the same parse result
-        if mensual_records:
-            resolved_m, warns_m = _resolve_ao_to_presupuestal_id(db, mensual_records)
-            ins_m, ins_warns_m = _bulk_insert_mensual(db, resolved_m)
-            total_inserted += ins_m
-            all_warnings.extend(warns_m + ins_warns_m)
-
-        return total_inserted, all_warnings
-
-    # Mensual formats (FORMATO_5A/5B) — records have codigo_ao, need resolution
-    if formato in _MENSUAL_FORMATS:
-        resolved, resolve_warns = _resolve_ao_to_presupuestal_id(db, all_records)
-        # 5B has ejecutado data — upsert to update existing 5A rows
-        is_5b = formato == "FORMATO_5B"
-        ins, insert_warns = _bulk_insert_mensual(db, resolved, upsert=is_5b)
-        total_inserted += ins
-        all_warnings.extend(resolve_warns + insert_warns)
-        return total_inserted, all_warnings
-
-    # Passthrough formats — count records but don't persist
-    if formato in _PASSTHROUGH_FORMATS and all_records:
-        logger.info(
-            "_persist: formato='%s' %d records counted as processed (no table).",
-            formato, len(all_records),
+    groups = _group_by_type(records)
+
+    # Process presupuestal records (untyped or explicitly typed)
+    presup_to_insert = groups["programacion_presupuestal"] or groups[None] or records
+    # UE/Meta lookups are loaded only when a resolver needs them, and then
+    # shared by both; the maps pick up entries auto-created while resolving
+    # presupuestal rows.
+    ue_map: dict[str, int] | None = None
+    meta_map: dict[str, int] | None = None
+
+    if _has_resolved_fks(presup_to_insert):
+        # Parser already resolved the FKs (see BaseParser contract)
+        resolved, resolve_warns = presup_to_insert, []
+    else:
+        ue_map, meta_map = _load_code_maps(db)
+        resolved, resolve_warns = _resolve_codes_to_ids(
+            db, presup_to_insert, ue_map=ue_map, meta_map=meta_map
         )
-        return len(all_records), [
-            f"Formato '{formato}': {len(all_records)} registros leídos correctamente."
-        ]
-
-    # Unknown formats with records
-    if all_records:
-        logger.info(
-            "_persist: formato='%s' has %d records — no table mapping.",
-            formato, len(all_records),
+    # SIAF provides execution data — upsert to update existing rows
+    is_siaf = formato == "SIAF"
+    ins, insert_warns = _bulk_insert_presupuestal(db, resolved, upsert=is_siaf)
+    total_inserted += ins
+    all_warnings.extend(resolve_warns + insert_warns)
+
+    # Also process any mensual records embedded in the same parse result.
+    # Resolved after the presupuestal insert so they attach to those rows.
+    mensual_records = groups["programacion_mensual"]
+    if mensual_records:
+        # Loads the maps itself when the presupuestal rows did not need them.
+        resolved_m, warns_m = _resolve_ao_to_presupuestal_id(
+            db, mensual_records, ue_map=ue_map, meta_map=meta_map
         )
-        return len(all_records), [
-            f"Formato '{formato}': {len(all_records)} registros leídos "
-            "correctamente (almacenamiento en tabla específica pendiente)."
-        ]
+        ins_m, ins_warns_m = _bulk_insert_mensual(db, resolved_m)
+        total_inserted += ins_m
+        all_warnings.extend(warns_m + ins_warns_m)
+
+    return total_inserted, all_warnings
+
+
+def _persist_mensual(
+    db: Session, formato: str, records: list[dict[str, Any]]
+) -> tuple[int, list[str]]:
+    """Mensual formats (FORMATO_5A/5B) — records have codigo_ao, need resolution."""
+    resolved, resolve_warns = _resolve_ao_to_presupuestal_id(db, records)
+    # 5B has ejecutado data — upsert to update existing 5A rows
+    is_5b = formato == "FORMATO_5B"
+    ins, insert_warns = _bulk_insert_mensual(db, resolved, upsert=is_5b)
+    return ins, resolve_warns + insert_warns
+
+
+def _persist_passthrough(
+    db: Session, formato: str, records: list[dict[str, Any]]
+) -> tuple[int, list[str]]:
+    """Passthrough formats — count records but don't persist."""
+    logger.info(
+        "_persist: formato='%s' %d records counted as processed (no table).",
+        formato, len(records),
+    )
+    return len(records), [
+        f"Formato '{formato}': {len(records)} registros leídos correctamente."
+    ]
 
-    return 0, []
+
+def _persist_unknown(
+    db: Session, formato: str, records: list[dict[str, Any]]
+) -> tuple[int, list[str]]:
+    """Unknown formats with records — counted, no table mapping yet."""
+    logger.info(
+        "_persist: formato='%s' has %d records — no table mapping.",
+        formato, len(records),
+    )
+    return len(records), [
+        f"Formato '{formato}': {len(records)} registros leídos "
+        "correctamente (almacenamiento en tabla específica pendiente)."
+    ]
+
+
+#: ``formato`` → persist handler, built once at import time.
+_FORMAT_HANDLERS: dict[str, _PersistHandler] = {
+    **dict.fromkeys(_MAESTRO_FORMATS, _persist_maestros),
+    **dict.fromkeys(_MODIFICACION_FORMATS, _persist_modificaciones),
+    **dict.fromkeys(_PRESUPUESTAL_FORMATS, _persist_presupuestal),
+    **dict.fromkeys(_MENSUAL_FORMATS, _persist_mensual),
+    **dict.fromkeys(_PASSTHROUGH_FORMATS, _persist_passthrough),
+}
+
+
+def _persist_parse_result(
+    db: Session, formato: str, result: ParseResult
+) -> tuple[int, list[str]]:
+    """Route parser output to the correct table and insert valid rows.
+
+    Dispatches on ``formato`` through ``_FORMAT_HANDLERS``; formats without
+    a table mapping fall back to ``_persist_unknown``.
+    """
+    if not result.records:
+        return 0, []
+    handler = _FORMAT_HANDLERS.get(formato, _persist_unknown)
+    return handler(db, formato, result.records)
 
 
 # ---------------------------------------------------------------------------
@@ -894,7 +1162,13 @@ async def process_upload(
     username: str,
     declared_format: str | None = None,
 ) -> ImportacionUploadResponse:
-    """Process an uploaded Excel or system-export file end-to-end."""
+    """Process an uploaded Excel or system-export file end-to-end.
+
+    Only the upload read happens on the event loop.  Saving, detection,
+    parsing and the DB writes are blocking (openpyxl is CPU-bound and the
+    session is synchronous), so they run in a worker thread to keep the
+    loop free for other requests.
+    """
     # 1. Read bytes
     raw: bytes = await file.read()
     filename: str = file.filename or "upload.xlsx"
@@ -902,6 +1176,30 @@ async def process_upload(
     if not raw:
         raise ValueError("El archivo está vacío.")
 
+    audit_async = get_settings().IMPORT_AUDIT_ASYNC
+    response, audit = await asyncio.to_thread(
+        _process_upload_sync,
+        db, raw, filename, user_id, username, declared_format, audit_async,
+    )
+    if audit_async:
+        _schedule_audit_log(audit)
+    return response
+
+
+def _process_upload_sync(
+    db: Session,
+    raw: bytes,
+    filename: str,
+    user_id: int,
+    username: str,
+    declared_format: str | None,
+    audit_async: bool,
+) -> tuple[ImportacionUploadResponse, dict[str, Any]]:
+    """Blocking part of :func:`process_upload`, run in a worker thread.
+
+    Returns the response and the audit-log fields.  With ``audit_async`` only
+    the imported data is committed here and the caller writes the audit row.
+    """
     # 1b. Save uploaded file to disk
     try:
         settings = get_settings()
@@ -924,12 +1222,21 @@ async def process_upload(
     )
 
     # 3. Detect UE from filename (best-effort)
-    ue_sigla: str | None = None
-    filename_upper = filename.upper()
-    for ue in db.query(UnidadEjecutora).filter(UnidadEjecutora.activo.is_(True)).all():
-        if ue.sigla and ue.sigla.upper() in filename_upper:
-            ue_sigla = ue.sigla
-            break
+    # Matched in SQL rather than fetching every active UE and scanning the
+    # name in Python.  A plain substring test (strpos/instr), not LIKE, so a
+    # '_' or '%' in a sigla is not a wildcard.
+    find = func.strpos if db.get_bind().dialect.name == "postgresql" else func.instr
+    ue_sigla: str | None = db.scalar(
+        select(UnidadEjecutora.sigla)
+        .where(
+            UnidadEjecutora.activo.is_(True),
+            UnidadEjecutora.sigla.is_not(None),
+            UnidadEjecutora.sigla != "",
+            find(literal(filename.upper()), func.upper(UnidadEjecutora.sigla)) > 0,
+        )
+        .order_by(UnidadEjecutora.id)
+        .limit(1)
+    )
 
     # 4. Parse
     errors: list[str] = []
@@ -971,25 +1278,30 @@ async def process_upload(
     registros_error = len(result.errors)
 
     # 6. Audit log + commit
+    audit: dict[str, Any] = {
+        "formato": formato,
+        "archivo_nombre": filename,
+        "usuario_id": user_id,
+        "usuario_username": username,
+        "ue_sigla": ue_sigla,
+        "registros_ok": registros_ok,
+        "registros_error": registros_error,
+        "errors": errors,
+        "warnings": warnings,
+    }
     try:
-        _write_audit_log(
-            db,
-            formato=formato,
-            archivo_nombre=filename,
-            usuario_id=user_id,
-            usuario_username=username,
-            ue_sigla=ue_sigla,
-            registros_ok=registros_ok,
-            registros_error=registros_error,
-            errors=errors,
-            warnings=warnings,
-        )
+        if not audit_async:
+            _write_audit_log(db, **audit)
         db.commit()
     except Exception as exc:
         db.rollback()
-        logger.exception("Failed to write audit log for import '%s'", filename)
+        logger.exception("Failed to commit import '%s'", filename)
         raise RuntimeError(f"Error al guardar el registro de importación: {exc}") from exc
 
+    if registros_ok:
+        refresh_resumen_mensual(db)
+    invalidate_presupuesto_cache()
+
     # 7. Build response
     total_rows_read = len(result.records) + registros_error
     meta: dict[str, Any] = {
@@ -999,7 +1311,7 @@ async def process_upload(
         **result.metadata,
     }
 
-    return ImportacionUploadResponse(
+    response = ImportacionUploadResponse(
         formato_detectado=formato,
         registros_validos=registros_ok,
         registros_error=registros_error,
@@ -1007,6 +1319,7 @@ async def process_upload(
         errors=errors,
         metadata=meta,
     )
+    return response, audit
 
 
 # ---------------------------------------------------------------------------
@@ -1014,37 +1327,83 @@ async def process_upload(
 # ---------------------------------------------------------------------------
 
 
-def _func_year(column: Any) -> Any:
-    return extract("year", column)
+def _year_bounds(anio: int) -> tuple[datetime, datetime]:
+    """Return the half-open ``[start, end)`` datetime range for a calendar year.
+
+    Filtering ``fecha`` by range instead of ``EXTRACT(year FROM fecha)`` keeps
+    the predicate sargable, so an index on ``fecha`` can be used.
+    """
+    return datetime(anio, 1, 1), datetime(anio + 1, 1, 1)
+
+
+#: Default and maximum page size for the import history.
+HISTORIAL_LIMIT_DEFAULT: int = 100
+HISTORIAL_LIMIT_MAX: int = 500
 
 
 def get_historial(
     db: Session,
     filters: FilterParams,
+    *,
+    limit: int = HISTORIAL_LIMIT_DEFAULT,
+    cursor: tuple[datetime, int] | None = None,
 ) -> list[HistorialImportacion]:
-    """Return the import history list, most-recent first."""
-    q = db.query(RegistroImportacion)
+    """Return one page of the import history, most-recent first.
+
+    Only the columns shown in the history table are selected, so the large
+    ``errors_json``/``warnings_json`` blobs are never loaded and no ORM
+    instances are built.
+
+    Pagination is keyset-based on ``(fecha, id)``: pass the ``fecha`` and
+    ``id`` of the last item of the previous page as ``cursor`` to fetch the
+    next one.  A page shorter than ``limit`` means there is nothing left.
+    """
+    stmt = select(
+        RegistroImportacion.id,
+        RegistroImportacion.formato,
+        RegistroImportacion.archivo_nombre,
+        RegistroImportacion.fecha,
+        RegistroImportacion.usuario_username,
+        RegistroImportacion.ue_sigla,
+        RegistroImportacion.registros_ok,
+        RegistroImportacion.registros_error,
+        RegistroImportacion.estado,
+    )
 
     if filters.anio is not None:
-        q = q.filter(_func_year(RegistroImportacion.fecha) == filters.anio)
+        inicio, fin = _year_bounds(filters.anio)
+        stmt = stmt.where(
+            RegistroImportacion.fecha >= inicio,
+            RegistroImportacion.fecha < fin,
+        )
 
-    records = q.order_by(RegistroImportacion.fecha.desc()).all()
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(RegistroImportacion.fecha, RegistroImportacion.id) < tuple_(*cursor)
+        )
 
-    result: list[HistorialImportacion] = []
-    for rec in records:
-        result.append(
-            HistorialImportacion(
-                id=rec.id,
-                formato=rec.formato,
-                archivo_nombre=rec.archivo_nombre,
-                fecha=rec.fecha,
-                usuario=rec.usuario_username,
-                ue=rec.ue_sigla,
-                registros_ok=rec.registros_ok,
-                registros_error=rec.registros_error,
-                estado=rec.estado,
-            )
+    stmt = stmt.order_by(
+        RegistroImportacion.fecha.desc(), RegistroImportacion.id.desc()
+    ).limit(min(limit, HISTORIAL_LIMIT_MAX))
+
+    rows = db.execute(stmt).all()
+
+    # Rows come straight from our own table and the router re-validates
+    # against response_model, so field validation is skipped here.
+    result: list[HistorialImportacion] = [
+        HistorialImportacion.model_construct(
+            id=row.id,
+            formato=row.formato,
+            archivo_nombre=row.archivo_nombre,
+            fecha=row.fecha,
+            usuario=row.usuario_username,
+            ue=row.ue_sigla,
+            registros_ok=row.registros_ok,
+            registros_error=row.registros_error,
+            estado=row.estado,
         )
+        for row in rows
+    ]
 
     logger.debug("get_historial: %d records returned", len(result))
     return result
@@ -1190,23 +1549,62 @@ _ESTADO_CATALOG: list[dict[str, Any]] = [
 ]
 
 
+#: Format keys accepted by :func:`limpiar_formato`.
+_VALID_FORMATS: frozenset[str] = frozenset(f["formato"] for f in _ESTADO_CATALOG)
+
+#: formato → plantilla file key (``plantilla_{key}.xlsx``).
+_PLANTILLA_KEYS: dict[str, str] = {
+    f["formato"]: f.get("plantilla_key", f["formato"].lower()) for f in _ESTADO_CATALOG
+}
+
+#: Seconds during which the plantilla existence check is reused.
+_PLANTILLA_CACHE_TTL: float = 60.0
+
+_plantilla_cache: tuple[float, dict[str, bool]] | None = None
+
+
+def _plantillas_existentes() -> dict[str, bool]:
+    """Return ``{formato: plantilla file exists}``, re-checked at most once per TTL."""
+    global _plantilla_cache
+    now = time.monotonic()
+    if _plantilla_cache is not None and now - _plantilla_cache[0] < _PLANTILLA_CACHE_TTL:
+        return _plantilla_cache[1]
+
+    plantillas_dir = get_settings().PLANTILLAS_DIR
+    existentes = {
+        fmt: (plantillas_dir / f"plantilla_{pkey}.xlsx").exists()
+        for fmt, pkey in _PLANTILLA_KEYS.items()
+    }
+    _plantilla_cache = (now, existentes)
+    return existentes
+
+
 def get_estado_formatos(db: Session) -> EstadoFormatosResponse:
     """Query the last import record per format and compose a status dashboard."""
-    settings = get_settings()
-
-    # Get latest import per formato using a subquery
-    from sqlalchemy import desc
-    latest_imports: dict[str, RegistroImportacion] = {}
-    for fmt_info in _ESTADO_CATALOG:
-        fmt_key = fmt_info["formato"]
-        row = (
-            db.query(RegistroImportacion)
-            .filter(RegistroImportacion.formato == fmt_key)
-            .order_by(desc(RegistroImportacion.fecha))
-            .first()
+    plantillas_existentes = _plantillas_existentes()
+
+    # Latest import per formato in one query: rank each format's rows newest
+    # first and keep rank 1.  Only the columns the dashboard shows are read,
+    # all of them covered by ix_registro_importacion_formato_fecha.
+    ranked = (
+        select(
+            RegistroImportacion.formato,
+            RegistroImportacion.fecha,
+            RegistroImportacion.estado,
+            RegistroImportacion.registros_ok,
+            RegistroImportacion.usuario_username,
+            func.row_number().over(
+                partition_by=RegistroImportacion.formato,
+                order_by=(RegistroImportacion.fecha.desc(), RegistroImportacion.id.desc()),
+            ).label("rn"),
         )
-        if row:
-            latest_imports[fmt_key] = row
+        .where(RegistroImportacion.formato.in_(_VALID_FORMATS))
+        .subquery()
+    )
+    latest_imports = {
+        row.formato: row
+        for row in db.execute(select(ranked).where(ranked.c.rn == 1))
+    }
 
     formatos: list[FormatoEstadoItem] = []
     total = len(_ESTADO_CATALOG)
@@ -1220,11 +1618,7 @@ def get_estado_formatos(db: Session) -> EstadoFormatosResponse:
         latest = latest_imports.get(fmt_key)
 
         # Check plantilla exists using the correct file key
-        tiene_plantilla = fmt_info["tiene_plantilla"]
-        if tiene_plantilla:
-            pkey = fmt_info.get("plantilla_key", fmt_key.lower())
-            plantilla_path = settings.PLANTILLAS_DIR / f"plantilla_{pkey}.xlsx"
-            tiene_plantilla = plantilla_path.exists()
+        tiene_plantilla = fmt_info["tiene_plantilla"] and plantillas_existentes[fmt_key]
 
         if latest:
             estado = latest.estado  # EXITOSO, PARCIAL, FALLIDO
@@ -1246,9 +1640,11 @@ def get_estado_formatos(db: Session) -> EstadoFormatosResponse:
             if fmt_info["es_requerido"]:
                 requeridos_faltantes += 1
 
-        formatos.append(FormatoEstadoItem(
+        # Built from the static catalog and our own rows; the router
+        # validates the response model, so skip validation here.
+        formatos.append(FormatoEstadoItem.model_construct(
             formato=fmt_key,
-            plantilla_key=fmt_info.get("plantilla_key", fmt_key.lower()),
+            plantilla_key=_PLANTILLA_KEYS[fmt_key],
             nombre=fmt_info["nombre"],
             descripcion=fmt_info["descripcion"],
             categoria=fmt_info["categoria"],
@@ -1262,7 +1658,7 @@ def get_estado_formatos(db: Session) -> EstadoFormatosResponse:
             usuario_ultima_carga=usuario,
         ))
 
-    return EstadoFormatosResponse(
+    return EstadoFormatosResponse.model_construct(
         formatos=formatos,
         total=total,
         cargados_exitosos=cargados_exitosos,
@@ -1277,6 +1673,11 @@ def get_estado_formatos(db: Session) -> EstadoFormatosResponse:
 # ---------------------------------------------------------------------------
 
 #: Maps each format to the tables/models whose data should be deleted.
+#: The foreign keys are ON DELETE CASCADE (migration 5a2c7e9b4d18), so
+#: deleting programacion_presupuestal also removes its programacion_mensual
+#: rows.  UnidadEjecutora and MetaPresupuestal are deliberately absent: an
+#: unfiltered delete of either would cascade into usuarios, adquisiciones,
+#: contratos menores, alertas and the whole programacion.
 _FORMAT_TABLE_MAP: dict[str, list[type]] = {
     "FORMATO_1": [ProgramacionMensual, ProgramacionPresupuestal],
     "FORMATO_2": [ProgramacionPresupuestal],
@@ -1285,7 +1686,7 @@ _FORMAT_TABLE_MAP: dict[str, list[type]] = {
     "FORMATO_5A": [ProgramacionMensual],
     "FORMATO_5B": [ProgramacionMensual],
     "SIAF": [ProgramacionPresupuestal],
-    "CUADRO_AO_META": [ActividadOperativa, MetaPresupuestal, UnidadEjecutora],
+    "CUADRO_AO_META": [ActividadOperativa],
     "TABLAS": [ClasificadorGasto],
 }
 
@@ -1299,28 +1700,32 @@ def limpiar_formato(db: Session, formato: str) -> dict[str, Any]:
     Returns a summary dict with deleted counts.
     """
     # Validate format exists in catalog
-    valid_formats = {f["formato"] for f in _ESTADO_CATALOG}
-    if formato not in valid_formats:
+    if formato not in _VALID_FORMATS:
         raise ValueError(f"Formato '{formato}' no existe en el catalogo.")
 
     deleted_data = 0
     tables_affected: list[str] = []
 
-    # Delete data from associated tables
+    # Delete data from associated tables.  Plain bulk DELETE statements:
+    # no rows are loaded, so there is nothing to synchronize in the session.
     models = _FORMAT_TABLE_MAP.get(formato, [])
     for model in models:
-        count = db.query(model).delete()
+        count = db.execute(
+            delete(model).execution_options(synchronize_session=False)
+        ).rowcount
         deleted_data += count
         tables_affected.append(model.__tablename__)
 
     # Delete import history records for this format
-    deleted_history = (
-        db.query(RegistroImportacion)
-        .filter(RegistroImportacion.formato == formato)
-        .delete()
-    )
+    deleted_history = db.execute(
+        delete(RegistroImportacion)
+        .where(RegistroImportacion.formato == formato)
+        .execution_options(synchronize_session=False)
+    ).rowcount
 
     db.commit()
+    refresh_resumen_mensual(db)
+    invalidate_presupuesto_cache()
 
     logger.info(
         "limpiar_formato: formato='%s' data_deleted=%d history_deleted=%d tables=%s",
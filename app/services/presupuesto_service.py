@@ -9,23 +9,35 @@ instances ready for serialisation by FastAPI.
 Design notes
 ------------
 - ``func.coalesce(..., 0)`` guards against NULL sums on empty result sets.
+- Amounts are cast to double precision in SQL (``_as_float``) so rows
+  arrive as ``float`` rather than ``Decimal``.
 - Execution percentage is calculated in Python after aggregation to avoid
   division-by-zero inside the SQL engine.
 - Every public function is synchronous (uses ``Session``, not ``AsyncSession``)
-  to match the existing ``get_db`` dependency pattern in the project.
+  to match the existing ``get_db`` dependency pattern in the project.  The
+  one exception is ``get_dashboard_bundle``, which overlaps its independent
+  queries in worker threads, each on a session of its own.
 - Month labels are derived from the integer month number (1–12) using a
   static lookup list so that the API always returns Spanish abbreviations
   regardless of the database locale.
+- KPI and chart results are memoised per filter combination for
+  ``_CACHE_TTL`` seconds.  Imports call ``invalidate_presupuesto_cache`` after
+  committing; other worker processes catch up when their entries expire.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from typing import Any
+import threading
+import time
+from typing import Any, Callable, TypeVar
 
-from sqlalchemy import func
+from sqlalchemy import Float, case, cast, column, func, or_, select, table, text
 from sqlalchemy.orm import Session
 
+from app.database import SessionLocal
 from app.models.clasificador_gasto import ClasificadorGasto
 from app.models.meta_presupuestal import MetaPresupuestal
 from app.models.programacion_mensual import ProgramacionMensual
@@ -33,6 +45,8 @@ from app.models.programacion_presupuestal import ProgramacionPresupuestal
 from app.models.unidad_ejecutora import UnidadEjecutora
 from app.schemas.common import FilterParams, PaginationParams
 from app.schemas.presupuesto import (
+    DashboardPresupuestoResponse,
+    GraficoBarColumnas,
     GraficoBarItem,
     GraficoEvolucionItem,
     KpiPresupuestoResponse,
@@ -43,11 +57,26 @@ from app.schemas.presupuesto import (
 logger = logging.getLogger(__name__)
 
 # Spanish month abbreviations indexed 1–12 (index 0 unused)
-_MES_LABELS: list[str] = [
+_MES_LABELS: tuple[str, ...] = (
     "",
     "Ene", "Feb", "Mar", "Abr", "May", "Jun",
     "Jul", "Ago", "Sep", "Oct", "Nov", "Dic",
-]
+)
+
+#: (programado, ejecutado) for a month with no rows.
+_MES_VACIO: tuple[float, float] = (0.0, 0.0)
+
+
+#: Seconds a dashboard aggregate is served from the in-process cache.
+_CACHE_TTL: float = 60.0
+
+#: Maximum cached entries; the least recently stored one is evicted first.
+_CACHE_MAXSIZE: int = 512
+
+_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+
+_T = TypeVar("_T")
 
 
 # ---------------------------------------------------------------------------
@@ -55,31 +84,93 @@ _MES_LABELS: list[str] = [
 # ---------------------------------------------------------------------------
 
 
-def _apply_pp_filters(query: Any, filters: FilterParams) -> Any:
+def _cached(fn: Callable[..., _T]) -> Callable[..., _T]:
+    """Memoise a ``(db, filters, **options)`` service function for ``_CACHE_TTL`` seconds.
+
+    The key is the function name plus every FilterParams field and keyword
+    option, so each filter combination is cached separately.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(db: Session, filters: FilterParams, **options: Any) -> _T:
+        key = (
+            fn.__name__,
+            filters.anio,
+            filters.ue_id,
+            filters.meta_id,
+            filters.fuente_financiamiento,
+            filters.mes,
+            *sorted(options.items()),
+        )
+        now = time.monotonic()
+        hit = _cache.get(key)
+        if hit is not None and now - hit[0] < _CACHE_TTL:
+            return hit[1]
+
+        value = fn(db, filters, **options)
+        with _cache_lock:
+            _cache.pop(key, None)
+            if len(_cache) >= _CACHE_MAXSIZE:
+                del _cache[next(iter(_cache))]
+            _cache[key] = (now, value)
+        return value
+
+    return wrapper
+
+
+def invalidate_presupuesto_cache() -> None:
+    """Drop every cached dashboard aggregate (call after writing budget data)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _apply_pp_filters(query: Any, filters: FilterParams, cols: Any = None) -> Any:
     """Apply standard FilterParams constraints to a ProgramacionPresupuestal query.
 
     Args:
-        query: An active SQLAlchemy query object targeting
+        query: A ``select()`` (or legacy ``Query``) targeting
                ``ProgramacionPresupuestal`` (possibly already joined).
         filters: Domain filter parameters from the HTTP request.
+        cols: Object exposing the ``anio``/``ue_id``/``meta_id``/
+              ``fuente_financiamiento`` columns to filter on; defaults to
+              ``ProgramacionPresupuestal`` (``_MV_MENSUAL.c`` for the rollup).
 
     Returns:
         The query with WHERE clauses appended for each non-None filter field.
     """
+    if cols is None:
+        cols = ProgramacionPresupuestal
     if filters.anio is not None:
-        query = query.filter(ProgramacionPresupuestal.anio == filters.anio)
+        query = query.filter(cols.anio == filters.anio)
     if filters.ue_id is not None:
-        query = query.filter(ProgramacionPresupuestal.ue_id == filters.ue_id)
+        query = query.filter(cols.ue_id == filters.ue_id)
     if filters.meta_id is not None:
-        query = query.filter(ProgramacionPresupuestal.meta_id == filters.meta_id)
+        query = query.filter(cols.meta_id == filters.meta_id)
     if filters.fuente_financiamiento is not None:
         query = query.filter(
-            ProgramacionPresupuestal.fuente_financiamiento
-            == filters.fuente_financiamiento
+            cols.fuente_financiamiento == filters.fuente_financiamiento
         )
     return query
 
 
+def refresh_resumen_mensual(db: Session) -> None:
+    """Refresh the ``mv_prog_mensual`` rollup after monthly data changes.
+
+    PostgreSQL only (other dialects read the base tables directly).  Uses
+    ``CONCURRENTLY`` so dashboard reads are not blocked while it rebuilds.
+    Failures are logged and swallowed: the data is already committed and
+    the view will catch up on the next refresh.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    try:
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_prog_mensual"))
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("refresh_resumen_mensual: could not refresh mv_prog_mensual")
+
+
 def _safe_pct(numerator: float, denominator: float) -> float:
     """Return numerator / denominator × 100, capped at 100.0, or 0.0 if denominator is zero.
 
@@ -95,11 +186,174 @@ def _safe_pct(numerator: float, denominator: float) -> float:
     return round(min((numerator / denominator) * 100, 100.0), 2)
 
 
+def _ejecucion_pct(numerator: Any, denominator: Any) -> Any:
+    """SQL counterpart of :func:`_safe_pct` for per-row use in a select list.
+
+    Args:
+        numerator: Column expression for the dividend (e.g. devengado).
+        denominator: Column expression for the divisor (e.g. PIM).
+
+    Returns:
+        A ``CASE`` expression yielding 0 when the divisor is zero, else the
+        percentage capped at 100 and rounded to two decimal places.
+    """
+    pct = numerator * 100.0 / denominator
+    return case(
+        (denominator == 0, 0.0),
+        (pct >= 100.0, 100.0),
+        else_=func.round(pct, 2),
+    )
+
+
+def _as_float(expr: Any, name: str) -> Any:
+    """Label ``expr`` cast to double precision.
+
+    NUMERIC results arrive from psycopg2 as ``Decimal``; casting in SQL lets
+    the driver hand back ``float`` directly, which is what every response
+    schema holds, so no per-value conversion is needed in Python.
+    """
+    return cast(expr, Float).label(name)
+
+
+# ---------------------------------------------------------------------------
+# Base statements
+# ---------------------------------------------------------------------------
+# Built once at import time; each request only appends its filter WHERE
+# clauses.  SQLAlchemy's compiled cache keys on statement structure, so every
+# filter combination is compiled once per process and then reused.
+
+#: Columns read by the KPI aggregates (filtered into the ``pp_f`` CTE).
+_KPI_BASE = select(
+    ProgramacionPresupuestal.ue_id,
+    ProgramacionPresupuestal.meta_id,
+    ProgramacionPresupuestal.pim,
+    ProgramacionPresupuestal.certificado,
+    ProgramacionPresupuestal.compromiso_anual,
+    ProgramacionPresupuestal.devengado,
+)
+
+#: Budget aggregates shared by the per-UE statements below, built once so
+#: every statement reuses the same clause objects.
+_SUM_PIM = func.sum(ProgramacionPresupuestal.pim)
+_SUM_CERTIFICADO = func.sum(ProgramacionPresupuestal.certificado)
+_SUM_COMPROMETIDO = func.sum(ProgramacionPresupuestal.compromiso_anual)
+_SUM_DEVENGADO = func.sum(ProgramacionPresupuestal.devengado)
+
+#: PIM / certificado / devengado totals per UE (both bar charts).
+_POR_UE_BASE = (
+    select(
+        UnidadEjecutora.sigla.label("nombre"),
+        _as_float(func.coalesce(_SUM_PIM, 0), "pim"),
+        _as_float(func.coalesce(_SUM_CERTIFICADO, 0), "certificado"),
+        _as_float(func.coalesce(_SUM_DEVENGADO, 0), "devengado"),
+    )
+    .join(UnidadEjecutora, ProgramacionPresupuestal.ue_id == UnidadEjecutora.id)
+    .group_by(UnidadEjecutora.id, UnidadEjecutora.sigla)
+)
+_PIM_CERTIFICADO_STMT = _POR_UE_BASE.order_by(_SUM_PIM.desc())
+# Filter out UEs with no budget to avoid division by zero in the frontend,
+# then rank by the exact devengado/PIM ratio (UE id breaks ties).  Lines with
+# every amount at zero cannot change any sum, so they are dropped before
+# aggregating; the predicate matches ix_programacion_presupuestal_con_montos.
+_EJECUCION_STMT = (
+    _POR_UE_BASE
+    .where(
+        or_(
+            ProgramacionPresupuestal.pim != 0,
+            ProgramacionPresupuestal.certificado != 0,
+            ProgramacionPresupuestal.devengado != 0,
+        )
+    )
+    .having(_SUM_PIM > 0)
+    .order_by((_SUM_DEVENGADO * 100.0 / _SUM_PIM).desc(), UnidadEjecutora.id)
+)
+
+#: Totals per (UE, meta) pair for the dashboard bundle.
+_BUNDLE_STMT = (
+    select(
+        UnidadEjecutora.id.label("ue_id"),
+        UnidadEjecutora.sigla.label("nombre"),
+        ProgramacionPresupuestal.meta_id,
+        # Kept as NUMERIC: the per-meta groups are re-summed in Python and
+        # must stay exact to match the KPI totals.
+        func.coalesce(_SUM_PIM, 0).label("pim"),
+        func.coalesce(_SUM_CERTIFICADO, 0).label("certificado"),
+        func.coalesce(_SUM_COMPROMETIDO, 0).label("comprometido"),
+        func.coalesce(_SUM_DEVENGADO, 0).label("devengado"),
+    )
+    .join(UnidadEjecutora, ProgramacionPresupuestal.ue_id == UnidadEjecutora.id)
+    .group_by(UnidadEjecutora.id, UnidadEjecutora.sigla, ProgramacionPresupuestal.meta_id)
+)
+
+#: Monthly programado / ejecutado totals.
+_MENSUAL_STMT = (
+    select(
+        ProgramacionMensual.mes.label("mes"),
+        _as_float(func.coalesce(func.sum(ProgramacionMensual.programado), 0), "programado"),
+        _as_float(func.coalesce(func.sum(ProgramacionMensual.ejecutado), 0), "ejecutado"),
+    )
+    .join(
+        ProgramacionPresupuestal,
+        ProgramacionMensual.programacion_presupuestal_id == ProgramacionPresupuestal.id,
+    )
+    .group_by(ProgramacionMensual.mes)
+    .order_by(ProgramacionMensual.mes)
+)
+
+#: Monthly rollup materialised on PostgreSQL (migration ``0b7e3f5a9c21``):
+#: programado/ejecutado summed per (anio, ue_id, meta_id, fuente, mes).
+_MV_MENSUAL = table(
+    "mv_prog_mensual",
+    column("anio"),
+    column("ue_id"),
+    column("meta_id"),
+    column("fuente_financiamiento"),
+    column("mes"),
+    column("programado"),
+    column("ejecutado"),
+)
+_MV_MENSUAL_STMT = (
+    select(
+        _MV_MENSUAL.c.mes.label("mes"),
+        _as_float(func.coalesce(func.sum(_MV_MENSUAL.c.programado), 0), "programado"),
+        _as_float(func.coalesce(func.sum(_MV_MENSUAL.c.ejecutado), 0), "ejecutado"),
+    )
+    .group_by(_MV_MENSUAL.c.mes)
+    .order_by(_MV_MENSUAL.c.mes)
+)
+
+#: Detail table rows with human-readable labels.
+_TABLA_BASE = (
+    select(
+        ProgramacionPresupuestal.id,
+        UnidadEjecutora.sigla.label("ue"),
+        MetaPresupuestal.codigo.label("meta"),
+        ClasificadorGasto.codigo.label("clasificador"),
+        ClasificadorGasto.descripcion.label("descripcion"),
+        _as_float(ProgramacionPresupuestal.pim, "pim"),
+        _as_float(ProgramacionPresupuestal.certificado, "certificado"),
+        _as_float(ProgramacionPresupuestal.devengado, "devengado"),
+        _as_float(ProgramacionPresupuestal.saldo, "saldo"),
+        _as_float(
+            _ejecucion_pct(ProgramacionPresupuestal.devengado, ProgramacionPresupuestal.pim),
+            "ejecucion",
+        ),
+    )
+    .join(UnidadEjecutora, ProgramacionPresupuestal.ue_id == UnidadEjecutora.id)
+    .join(MetaPresupuestal, ProgramacionPresupuestal.meta_id == MetaPresupuestal.id)
+    .join(ClasificadorGasto, ProgramacionPresupuestal.clasificador_id == ClasificadorGasto.id)
+)
+
+#: Rows fetched per driver round trip when streaming a table page.
+_TABLA_YIELD_PER: int = 256
+
+
 # ---------------------------------------------------------------------------
 # Public service functions
 # ---------------------------------------------------------------------------
 
 
+@_cached
 def get_kpis(db: Session, filters: FilterParams) -> KpiPresupuestoResponse:
     """Aggregate top-level KPI figures for the Budget Dashboard header cards.
 
@@ -113,38 +367,37 @@ def get_kpis(db: Session, filters: FilterParams) -> KpiPresupuestoResponse:
     Returns:
         A ``KpiPresupuestoResponse`` with all five aggregate values.
     """
-    q = db.query(
-        func.count(func.distinct(ProgramacionPresupuestal.ue_id)).label("total_ues"),
-        func.count(func.distinct(ProgramacionPresupuestal.meta_id)).label("total_metas"),
-        func.coalesce(func.sum(ProgramacionPresupuestal.pim), 0).label("pim_total"),
-        func.coalesce(func.sum(ProgramacionPresupuestal.certificado), 0).label("certificado_total"),
-        func.coalesce(func.sum(ProgramacionPresupuestal.compromiso_anual), 0).label("comprometido_total"),
-        func.coalesce(func.sum(ProgramacionPresupuestal.devengado), 0).label("devengado_total"),
-    )
-    q = _apply_pp_filters(q, filters)
-    row = q.one()
-
-    pim_total = float(row.pim_total)
-    certificado_total = float(row.certificado_total)
-    comprometido_total = float(row.comprometido_total)
-    devengado_total = float(row.devengado_total)
+    # Filter once into a CTE projecting only the six columns the aggregates
+    # read; the distinct counts and the sums then share that single scan.
+    pp_f = _apply_pp_filters(_KPI_BASE, filters).cte("pp_f")
+    row = db.execute(
+        select(
+            func.count(func.distinct(pp_f.c.ue_id)).label("total_ues"),
+            func.count(func.distinct(pp_f.c.meta_id)).label("total_metas"),
+            _as_float(func.coalesce(func.sum(pp_f.c.pim), 0), "pim_total"),
+            _as_float(func.coalesce(func.sum(pp_f.c.certificado), 0), "certificado_total"),
+            _as_float(func.coalesce(func.sum(pp_f.c.compromiso_anual), 0), "comprometido_total"),
+            _as_float(func.coalesce(func.sum(pp_f.c.devengado), 0), "devengado_total"),
+        )
+    ).one()
 
     logger.debug(
         "get_kpis: ues=%d metas=%d pim=%.2f",
-        row.total_ues, row.total_metas, pim_total,
+        row.total_ues, row.total_metas, row.pim_total,
     )
 
     return KpiPresupuestoResponse(
         total_ues=row.total_ues,
         total_metas=row.total_metas,
-        pim_total=pim_total,
-        certificado_total=certificado_total,
-        comprometido_total=comprometido_total,
-        devengado_total=devengado_total,
-        ejecucion_porcentaje=_safe_pct(devengado_total, pim_total),
+        pim_total=row.pim_total,
+        certificado_total=row.certificado_total,
+        comprometido_total=row.comprometido_total,
+        devengado_total=row.devengado_total,
+        ejecucion_porcentaje=_safe_pct(row.devengado_total, row.pim_total),
     )
 
 
+@_cached
 def get_grafico_pim_certificado(
     db: Session, filters: FilterParams
 ) -> list[GraficoBarItem]:
@@ -160,31 +413,19 @@ def get_grafico_pim_certificado(
     Returns:
         A list of ``GraficoBarItem``, one per distinct UE.
     """
-    q = (
-        db.query(
-            UnidadEjecutora.sigla.label("nombre"),
-            func.coalesce(func.sum(ProgramacionPresupuestal.pim), 0).label("pim"),
-            func.coalesce(func.sum(ProgramacionPresupuestal.certificado), 0).label("certificado"),
-            func.coalesce(func.sum(ProgramacionPresupuestal.devengado), 0).label("devengado"),
-        )
-        .join(UnidadEjecutora, ProgramacionPresupuestal.ue_id == UnidadEjecutora.id)
-    )
-    q = _apply_pp_filters(q, filters)
-    q = q.group_by(UnidadEjecutora.id, UnidadEjecutora.sigla)
-    q = q.order_by(func.sum(ProgramacionPresupuestal.pim).desc())
+    stmt = _apply_pp_filters(_PIM_CERTIFICADO_STMT, filters)
 
+    # Values are already typed by SQL (floats cast here), so the per-row
+    # Pydantic validation is skipped with model_construct.
     items: list[GraficoBarItem] = []
-    for row in q.all():
-        pim = float(row.pim)
-        certificado = float(row.certificado)
-        devengado = float(row.devengado)
+    for row in db.execute(stmt):
         items.append(
-            GraficoBarItem(
+            GraficoBarItem.model_construct(
                 nombre=row.nombre,
-                pim=pim,
-                certificado=certificado,
-                devengado=devengado,
-                ejecucion_porcentaje=_safe_pct(devengado, pim),
+                pim=row.pim,
+                certificado=row.certificado,
+                devengado=row.devengado,
+                ejecucion_porcentaje=_safe_pct(row.devengado, row.pim),
             )
         )
 
@@ -192,66 +433,187 @@ def get_grafico_pim_certificado(
     return items
 
 
+@_cached
 def get_grafico_ejecucion(
-    db: Session, filters: FilterParams
+    db: Session, filters: FilterParams, *, top_n: int | None = None
 ) -> list[GraficoBarItem]:
     """Return UEs ranked by execution percentage (devengado / PIM) descending.
 
     Intended for the "Top UEs por ejecución" horizontal bar chart.
     UEs with zero PIM are excluded to avoid meaningless 0 % entries.
+    Ranking and the optional top-N cut both happen in SQL.
 
     Args:
         db: Active SQLAlchemy session.
         filters: Year, UE, meta, and funding-source constraints.
+        top_n: Return only the N best-ranked UEs; ``None`` returns all.
 
     Returns:
         List of ``GraficoBarItem`` sorted by execution percentage, highest first.
     """
-    q = (
-        db.query(
-            UnidadEjecutora.sigla.label("nombre"),
-            func.coalesce(func.sum(ProgramacionPresupuestal.pim), 0).label("pim"),
-            func.coalesce(func.sum(ProgramacionPresupuestal.certificado), 0).label("certificado"),
-            func.coalesce(func.sum(ProgramacionPresupuestal.devengado), 0).label("devengado"),
-        )
-        .join(UnidadEjecutora, ProgramacionPresupuestal.ue_id == UnidadEjecutora.id)
-    )
-    q = _apply_pp_filters(q, filters)
-    q = q.group_by(UnidadEjecutora.id, UnidadEjecutora.sigla)
-    # Filter out UEs with no budget to avoid division by zero in the frontend
-    q = q.having(func.sum(ProgramacionPresupuestal.pim) > 0)
-
-    rows = q.all()
+    stmt = _apply_pp_filters(_EJECUCION_STMT, filters)
+    if top_n is not None:
+        stmt = stmt.limit(top_n)
+    rows = db.execute(stmt).all()
 
     items: list[GraficoBarItem] = []
     for row in rows:
-        pim = float(row.pim)
-        certificado = float(row.certificado)
-        devengado = float(row.devengado)
         items.append(
-            GraficoBarItem(
+            GraficoBarItem.model_construct(
                 nombre=row.nombre,
-                pim=pim,
-                certificado=certificado,
-                devengado=devengado,
-                ejecucion_porcentaje=_safe_pct(devengado, pim),
+                pim=row.pim,
+                certificado=row.certificado,
+                devengado=row.devengado,
+                ejecucion_porcentaje=_safe_pct(row.devengado, row.pim),
             )
         )
 
-    # Sort in Python so we keep full precision for the percentage comparison
-    items.sort(key=lambda x: x.ejecucion_porcentaje, reverse=True)
     logger.debug("get_grafico_ejecucion: %d UEs returned", len(items))
     return items
 
 
+def a_columnas(items: list[GraficoBarItem]) -> GraficoBarColumnas:
+    """Transpose bar-chart items into one array per field.
+
+    Args:
+        items: Output of ``get_grafico_pim_certificado`` or
+            ``get_grafico_ejecucion``.
+
+    Returns:
+        A ``GraficoBarColumnas`` with the arrays in the same order as ``items``.
+    """
+    return GraficoBarColumnas.model_construct(
+        nombre=[item.nombre for item in items],
+        pim=[item.pim for item in items],
+        certificado=[item.certificado for item in items],
+        devengado=[item.devengado for item in items],
+        ejecucion_porcentaje=[item.ejecucion_porcentaje for item in items],
+    )
+
+
+@_cached
+def _get_dashboard_por_ue(
+    db: Session, filters: FilterParams
+) -> tuple[KpiPresupuestoResponse, list[GraficoBarItem], list[GraficoBarItem]]:
+    """Return the KPI cards and both per-UE bar charts from one query.
+
+    Aggregates once per (UE, meta) pair and derives everything else in
+    Python over that small result: KPI totals are sums of the groups, the
+    PIM chart sorts the per-UE totals by PIM, and the execution chart keeps
+    UEs with PIM > 0 sorted by execution percentage.  Payloads match
+    ``get_kpis``, ``get_grafico_pim_certificado`` and ``get_grafico_ejecucion``.
+
+    Args:
+        db: Active SQLAlchemy session.
+        filters: Year, UE, meta, and funding-source constraints.
+
+    Returns:
+        Tuple of (kpis, grafico_pim_certificado, grafico_ejecucion).
+    """
+    stmt = _apply_pp_filters(_BUNDLE_STMT, filters)
+
+    # Per-UE totals, summed as Decimal so the KPI figures stay exact.
+    por_ue: dict[int, dict[str, Any]] = {}
+    meta_ids: set[int] = set()
+    for row in db.execute(stmt):
+        meta_ids.add(row.meta_id)
+        ue = por_ue.setdefault(row.ue_id, {
+            "nombre": row.nombre, "pim": 0, "certificado": 0, "comprometido": 0, "devengado": 0,
+        })
+        for field in ("pim", "certificado", "comprometido", "devengado"):
+            ue[field] += getattr(row, field)
+
+    pim_total = float(sum(ue["pim"] for ue in por_ue.values()))
+    devengado_total = float(sum(ue["devengado"] for ue in por_ue.values()))
+    kpis = KpiPresupuestoResponse(
+        total_ues=len(por_ue),
+        total_metas=len(meta_ids),
+        pim_total=pim_total,
+        certificado_total=float(sum(ue["certificado"] for ue in por_ue.values())),
+        comprometido_total=float(sum(ue["comprometido"] for ue in por_ue.values())),
+        devengado_total=devengado_total,
+        ejecucion_porcentaje=_safe_pct(devengado_total, pim_total),
+    )
+
+    items: dict[int, GraficoBarItem] = {}
+    for ue_id, ue in por_ue.items():
+        pim = float(ue["pim"])
+        devengado = float(ue["devengado"])
+        items[ue_id] = GraficoBarItem.model_construct(
+            nombre=ue["nombre"],
+            pim=pim,
+            certificado=float(ue["certificado"]),
+            devengado=devengado,
+            ejecucion_porcentaje=_safe_pct(devengado, pim),
+        )
+
+    grafico_pim_certificado = [
+        items[ue_id]
+        for ue_id in sorted(por_ue, key=lambda ue_id: por_ue[ue_id]["pim"], reverse=True)
+    ]
+    # Same ranking as _EJECUCION_STMT: exact devengado/PIM, then UE id.
+    grafico_ejecucion = [
+        items[ue_id]
+        for ue_id in sorted(
+            (ue_id for ue_id, ue in por_ue.items() if ue["pim"] > 0),
+            key=lambda ue_id: (-por_ue[ue_id]["devengado"] / por_ue[ue_id]["pim"], ue_id),
+        )
+    ]
+
+    logger.debug("_get_dashboard_por_ue: %d UEs, %d metas", len(por_ue), len(meta_ids))
+    return kpis, grafico_pim_certificado, grafico_ejecucion
+
+
+def _run_in_session(fn: Callable[[Session, FilterParams], _T], filters: FilterParams) -> _T:
+    """Call ``fn`` on a short-lived session of its own.
+
+    A ``Session`` must not be shared between threads, so every concurrent
+    query in ``get_dashboard_bundle`` checks out its own pooled connection.
+    """
+    db = SessionLocal()
+    try:
+        return fn(db, filters)
+    finally:
+        db.close()
+
+
+async def get_dashboard_bundle(filters: FilterParams) -> DashboardPresupuestoResponse:
+    """Return every dashboard chart, running the independent queries concurrently.
+
+    The per-UE aggregate (KPIs + both bar charts) and the monthly series do
+    not depend on each other, so both run at the same time in worker
+    threads and the latency is that of the slower one.  Each piece is
+    still served from the per-filter cache when warm.
+
+    Args:
+        filters: Year, UE, meta, and funding-source constraints.
+
+    Returns:
+        A ``DashboardPresupuestoResponse`` bundling the four payloads.
+    """
+    (kpis, grafico_pim_certificado, grafico_ejecucion), mensual = await asyncio.gather(
+        asyncio.to_thread(_run_in_session, _get_dashboard_por_ue, filters),
+        asyncio.to_thread(_run_in_session, get_grafico_devengado_mensual, filters),
+    )
+    return DashboardPresupuestoResponse(
+        kpis=kpis,
+        grafico_pim_certificado=grafico_pim_certificado,
+        grafico_ejecucion=grafico_ejecucion,
+        grafico_devengado_mensual=mensual,
+    )
+
+
+@_cached
 def get_grafico_devengado_mensual(
     db: Session, filters: FilterParams
 ) -> list[GraficoEvolucionItem]:
     """Aggregate monthly programado vs ejecutado across all matching records.
 
-    Joins ``ProgramacionMensual`` → ``ProgramacionPresupuestal`` so that
-    the same year/UE/meta/fuente filters apply uniformly.  Returns 12 items
-    (one per month), with zero-filled values for months with no data.
+    On PostgreSQL this reads the ``mv_prog_mensual`` rollup (refreshed after
+    each import); elsewhere it joins ``ProgramacionMensual`` →
+    ``ProgramacionPresupuestal``.  Either way the same year/UE/meta/fuente
+    filters apply uniformly.  Returns 12 items (one per month), with
+    zero-filled values for months with no data.
 
     Args:
         db: Active SQLAlchemy session.
@@ -260,27 +622,20 @@ def get_grafico_devengado_mensual(
     Returns:
         Exactly 12 ``GraficoEvolucionItem`` instances ordered January → December.
     """
-    q = (
-        db.query(
-            ProgramacionMensual.mes.label("mes"),
-            func.coalesce(func.sum(ProgramacionMensual.programado), 0).label("programado"),
-            func.coalesce(func.sum(ProgramacionMensual.ejecutado), 0).label("ejecutado"),
-        )
-        .join(
-            ProgramacionPresupuestal,
-            ProgramacionMensual.programacion_presupuestal_id == ProgramacionPresupuestal.id,
-        )
-    )
-    q = _apply_pp_filters(q, filters)
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = _apply_pp_filters(_MV_MENSUAL_STMT, filters, _MV_MENSUAL.c)
+        mes_col = _MV_MENSUAL.c.mes
+    else:
+        stmt = _apply_pp_filters(_MENSUAL_STMT, filters)
+        mes_col = ProgramacionMensual.mes
     # If a specific month is requested, restrict to that month only
     if filters.mes is not None:
-        q = q.filter(ProgramacionMensual.mes == filters.mes)
-    q = q.group_by(ProgramacionMensual.mes).order_by(ProgramacionMensual.mes)
+        stmt = stmt.filter(mes_col == filters.mes)
 
     # Build a dict keyed by month number for O(1) lookup
     mes_data: dict[int, tuple[float, float]] = {
-        row.mes: (float(row.programado), float(row.ejecutado))
-        for row in q.all()
+        row.mes: (row.programado, row.ejecutado)
+        for row in db.execute(stmt)
     }
 
     # Determine which month range to return
@@ -289,21 +644,29 @@ def get_grafico_devengado_mensual(
     else:
         mes_range = range(1, 13)
 
-    items: list[GraficoEvolucionItem] = []
-    for mes_num in mes_range:
-        programado, ejecutado = mes_data.get(mes_num, (0.0, 0.0))
-        items.append(
-            GraficoEvolucionItem(
-                mes=_MES_LABELS[mes_num],
-                programado=programado,
-                ejecutado=ejecutado,
-            )
+    items: list[GraficoEvolucionItem] = [
+        GraficoEvolucionItem.model_construct(
+            mes=_MES_LABELS[mes_num], programado=programado, ejecutado=ejecutado
         )
+        for mes_num in mes_range
+        for programado, ejecutado in (mes_data.get(mes_num, _MES_VACIO),)
+    ]
 
     logger.debug("get_grafico_devengado_mensual: %d months aggregated", len(items))
     return items
 
 
+@_cached
+def _count_tabla(db: Session, filters: FilterParams) -> int:
+    """Total rows of the budget table for *filters*.
+
+    Cached like the dashboard aggregates, so walking the keyset pages of one
+    filter set counts the table once rather than on every page.
+    """
+    base_q = _apply_pp_filters(_TABLA_BASE, filters)
+    return db.scalar(select(func.count()).select_from(base_q.subquery()))
+
+
 def get_tabla(
     db: Session, filters: FilterParams, pagination: PaginationParams
 ) -> TablaPresupuestoResponse:
@@ -315,55 +678,64 @@ def get_tabla(
     Args:
         db: Active SQLAlchemy session.
         filters: Year, UE, meta, and funding-source constraints.
-        pagination: Page number and page size requested by the client.
+        pagination: Page number and page size requested by the client, or
+            an ``after_id`` cursor for keyset pagination.
 
     Returns:
-        A ``TablaPresupuestoResponse`` with the current page of rows plus
-        the total row count for the client to compute page count.
+        A ``TablaPresupuestoResponse`` with the current page of rows (ordered
+        by id), the total row count, and the cursor for the next page.
     """
-    base_q = (
-        db.query(
-            ProgramacionPresupuestal.id,
-            UnidadEjecutora.sigla.label("ue"),
-            MetaPresupuestal.codigo.label("meta"),
-            ClasificadorGasto.codigo.label("clasificador"),
-            ClasificadorGasto.descripcion.label("descripcion"),
-            ProgramacionPresupuestal.pim,
-            ProgramacionPresupuestal.certificado,
-            ProgramacionPresupuestal.devengado,
-            ProgramacionPresupuestal.saldo,
+    base_q = _apply_pp_filters(_TABLA_BASE, filters)
+
+    # Keyset pagination on id when the client sends a cursor (index seek at
+    # any depth); plain page offsets remain supported for the first page and
+    # for older clients.
+    page_q = base_q.order_by(ProgramacionPresupuestal.id)
+    total: int | None = None
+    if pagination.after_id is not None:
+        # The cursor predicate would also narrow a window count, so the
+        # total for the client's page navigator comes from its own (cached)
+        # query.
+        total = _count_tabla(db, filters)
+        page_q = (
+            page_q.filter(ProgramacionPresupuestal.id > pagination.after_id)
+            .limit(pagination.page_size)
+        )
+    else:
+        # COUNT(*) OVER () is evaluated before OFFSET/LIMIT, so the total
+        # comes back with the page in the same round trip.
+        page_q = (
+            page_q.add_columns(func.count().over().label("total_count"))
+            .offset((pagination.page - 1) * pagination.page_size)
+            .limit(pagination.page_size)
         )
-        .join(UnidadEjecutora, ProgramacionPresupuestal.ue_id == UnidadEjecutora.id)
-        .join(MetaPresupuestal, ProgramacionPresupuestal.meta_id == MetaPresupuestal.id)
-        .join(ClasificadorGasto, ProgramacionPresupuestal.clasificador_id == ClasificadorGasto.id)
-    )
-    base_q = _apply_pp_filters(base_q, filters)
-
-    # Count total before pagination for the client's page navigator
-    total: int = base_q.count()
-
-    offset = (pagination.page - 1) * pagination.page_size
-    page_rows = base_q.offset(offset).limit(pagination.page_size).all()
 
+    # Stream the page in batches (server-side cursor on psycopg2) and build
+    # the response rows as they arrive instead of buffering with .all().
+    result = db.execute(page_q.execution_options(yield_per=_TABLA_YIELD_PER))
     rows: list[TablaPresupuestoRow] = []
-    for row in page_rows:
-        pim = float(row.pim)
-        devengado = float(row.devengado)
+    for row in result:
+        if total is None:
+            total = row.total_count
         rows.append(
-            TablaPresupuestoRow(
+            TablaPresupuestoRow.model_construct(
                 id=row.id,
                 ue=row.ue,
                 meta=row.meta,
                 clasificador=row.clasificador,
                 descripcion=row.descripcion,
-                pim=pim,
-                certificado=float(row.certificado),
-                devengado=devengado,
-                saldo=float(row.saldo),
-                ejecucion=_safe_pct(devengado, pim),
+                pim=row.pim,
+                certificado=row.certificado,
+                devengado=row.devengado,
+                saldo=row.saldo,
+                ejecucion=row.ejecucion,
             )
         )
 
+    if total is None:
+        # Past the last page (or no matches at all on page 1).
+        total = _count_tabla(db, filters) if pagination.page > 1 else 0
+
     logger.debug(
         "get_tabla: page=%d size=%d total=%d returned=%d",
         pagination.page, pagination.page_size, total, len(rows),
@@ -374,4 +746,5 @@ def get_tabla(
         total=total,
         page=pagination.page,
         page_size=pagination.page_size,
+        next_cursor=rows[-1].id if len(rows) == pagination.page_size else None,
     )
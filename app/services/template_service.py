@@ -10,15 +10,18 @@ INEI import formats using ``openpyxl``.  Each workbook contains:
 
 Public API
 ----------
-- ``FORMATO_CATALOG`` — list of format metadata dicts (key, nombre, etc.).
-- ``get_formato_catalog()`` — returns the catalog (safe copy).
+- ``FormatoSpec`` — frozen dataclass describing one format (key, nombre, etc.).
+- ``FORMATO_CATALOG`` — tuple of ``FormatoSpec`` entries.
+- ``get_formato_catalog()`` — returns the (immutable) catalog.
+- ``get_template_bytes(formato_key)`` — the ``.xlsx`` content, cached in memory.
 - ``generate_template(formato_key, output_path)`` — writes a single ``.xlsx`` file.
 - ``generate_all_templates(plantillas_dir)`` — writes all 10 templates to a directory.
 
 Design notes
 ------------
 - Uses ``openpyxl`` directly (not ``xlsxwriter`` or ``pandas``) to keep the
-  API simple and avoid a secondary dependency path.
+  API simple and avoid a secondary dependency path.  Workbooks are opened in
+  write-only mode, so rows are laid out first and then streamed in order.
 - Column header row is placed at ``fila_inicio - 1`` (1-based), matching the
   real file layout that parsers expect.
 - Context rows (rows 1-4) are always written at fixed positions regardless of
@@ -29,11 +32,15 @@ Design notes
 
 from __future__ import annotations
 
-import copy
+import functools
+import hashlib
+import io
 import logging
+import zipfile
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from openpyxl import Workbook
 from openpyxl.styles import (
@@ -43,7 +50,10 @@ from openpyxl.styles import (
     PatternFill,
     Side,
 )
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
+from openpyxl.writer.excel import ExcelWriter
+from openpyxl.worksheet.dimensions import ColumnDimension, RowDimension
 
 logger = logging.getLogger(__name__)
 
@@ -58,59 +68,72 @@ _HEX_LABEL_TEXT = "1E3A5F"     # dark navy for context label text
 _HEX_TITLE_BG = "1E3A5F"       # dark navy for format title row
 _HEX_BORDER = "CBD5E1"         # slate-300 for all borders
 
-_CURRENT_YEAR: int = date.today().year
-
 
 # ---------------------------------------------------------------------------
 # Format catalog
 # ---------------------------------------------------------------------------
 
-#: Complete catalog of the 10 INEI Excel import formats.
-#: Each entry is a plain dict with the following keys:
-#:
-#: * ``key``         — unique identifier used in API calls and file names.
-#: * ``nombre``      — human-readable format name (Spanish).
-#: * ``descripcion`` — one-line summary of the format's purpose.
-#: * ``hoja``        — sheet name as it appears in real source files.
-#: * ``columnas``    — ordered list of column header strings.
-#: * ``fila_inicio`` — 1-based row number where data rows begin (mirrors parsers).
-FORMATO_CATALOG: list[dict[str, Any]] = [
-    {
-        "key": "cuadro_ao_meta",
-        "nombre": "Cuadro AO-META",
-        "descripcion": "Datos maestros: 85 actividades operativas y sus relaciones con metas.",
-        "hoja": "Cuadro AO-Meta",
-        "columnas": [
+@dataclass(frozen=True, slots=True)
+class FormatoSpec:
+    """Metadata for one INEI Excel import format.
+
+    Attributes:
+        key: Unique identifier used in API calls and file names.
+        nombre: Human-readable format name (Spanish).
+        descripcion: One-line summary of the format's purpose.
+        hoja: Sheet name as it appears in real source files.
+        columnas: Ordered column header strings.
+        fila_inicio: 1-based row number where data rows begin (mirrors parsers).
+    """
+
+    key: str
+    nombre: str
+    descripcion: str
+    hoja: str
+    columnas: tuple[str, ...]
+    fila_inicio: int
+
+
+#: Complete catalog of the 10 INEI Excel import formats.  It is shared as-is
+#: (never copied) by every caller, so it must stay immutable: a tuple of
+#: frozen entries with tuple columns.
+FORMATO_CATALOG: tuple[FormatoSpec, ...] = (
+    FormatoSpec(
+        key="cuadro_ao_meta",
+        nombre="Cuadro AO-META",
+        descripcion="Datos maestros: 85 actividades operativas y sus relaciones con metas.",
+        hoja="Cuadro AO-Meta",
+        columnas=(
             "N°",
             "Codigo CEPLAN",
             "Nombre AO",
             "Codigo Meta",
             "Descripcion Meta",
             "Area Responsable",
-        ],
-        "fila_inicio": 7,
-    },
-    {
-        "key": "tablas",
-        "nombre": "Tablas de Referencia",
-        "descripcion": "Datos maestros: 569 clasificadores de gasto y tipos de referencia.",
-        "hoja": "Tablas",
-        "columnas": [
+        ),
+        fila_inicio=7,
+    ),
+    FormatoSpec(
+        key="tablas",
+        nombre="Tablas de Referencia",
+        descripcion="Datos maestros: 569 clasificadores de gasto y tipos de referencia.",
+        hoja="Tablas",
+        columnas=(
             "Clasificador",
             "Tipo Generico",
             "Tipo Especifico",
             "Sub Tipo",
             "Descripcion",
             "Estado",
-        ],
-        "fila_inicio": 5,
-    },
-    {
-        "key": "formato1",
-        "nombre": "Formato 1 - Programacion Presupuestal",
-        "descripcion": "Programacion presupuestal anual por clasificador de gasto (23 columnas desde F8).",
-        "hoja": "Formato 1",
-        "columnas": [
+        ),
+        fila_inicio=5,
+    ),
+    FormatoSpec(
+        key="formato1",
+        nombre="Formato 1 - Programacion Presupuestal",
+        descripcion="Programacion presupuestal anual por clasificador de gasto (23 columnas desde F8).",
+        hoja="Formato 1",
+        columnas=(
             "Clasificador",
             "Descripcion",
             "PIA",
@@ -128,15 +151,15 @@ FORMATO_CATALOG: list[dict[str, Any]] = [
             "Nov",
             "Dic",
             "Total",
-        ],
-        "fila_inicio": 8,
-    },
-    {
-        "key": "formato2",
-        "nombre": "Formato 2 - Programacion por Tareas",
-        "descripcion": "Programacion a nivel de tarea (19 columnas desde F8).",
-        "hoja": "Formato 2",
-        "columnas": [
+        ),
+        fila_inicio=8,
+    ),
+    FormatoSpec(
+        key="formato2",
+        nombre="Formato 2 - Programacion por Tareas",
+        descripcion="Programacion a nivel de tarea (19 columnas desde F8).",
+        hoja="Formato 2",
+        columnas=(
             "Cod Meta",
             "Desc Meta",
             "Cod AO",
@@ -158,15 +181,15 @@ FORMATO_CATALOG: list[dict[str, Any]] = [
             "Oct",
             "Nov",
             "Dic",
-        ],
-        "fila_inicio": 8,
-    },
-    {
-        "key": "formato3",
-        "nombre": "Formato 3 - Tareas con Justificacion",
-        "descripcion": "Tareas con campos de justificacion y observaciones.",
-        "hoja": "Formato 3",
-        "columnas": [
+        ),
+        fila_inicio=8,
+    ),
+    FormatoSpec(
+        key="formato3",
+        nombre="Formato 3 - Tareas con Justificacion",
+        descripcion="Tareas con campos de justificacion y observaciones.",
+        hoja="Formato 3",
+        columnas=(
             "Cod Meta",
             "Desc Meta",
             "Cod AO",
@@ -182,30 +205,30 @@ FORMATO_CATALOG: list[dict[str, Any]] = [
             "% Avance",
             "Justificacion",
             "Observaciones",
-        ],
-        "fila_inicio": 8,
-    },
-    {
-        "key": "formato04",
-        "nombre": "Formato 04 - Modificaciones Presupuestales",
-        "descripcion": "Registro de modificaciones presupuestales (6 columnas desde F8).",
-        "hoja": "Formato 04",
-        "columnas": [
+        ),
+        fila_inicio=8,
+    ),
+    FormatoSpec(
+        key="formato04",
+        nombre="Formato 04 - Modificaciones Presupuestales",
+        descripcion="Registro de modificaciones presupuestales (6 columnas desde F8).",
+        hoja="Formato 04",
+        columnas=(
             "Clasificador",
             "Descripcion",
             "Asignado",
             "Habilitadora",
             "Habilitada",
             "PIM Resultante",
-        ],
-        "fila_inicio": 8,
-    },
-    {
-        "key": "formato5a",
-        "nombre": "Formato 5.A - Programacion AO",
-        "descripcion": "Programacion mensual de actividades operativas (22 columnas desde F12).",
-        "hoja": "Formato 5.A",
-        "columnas": [
+        ),
+        fila_inicio=8,
+    ),
+    FormatoSpec(
+        key="formato5a",
+        nombre="Formato 5.A - Programacion AO",
+        descripcion="Programacion mensual de actividades operativas (22 columnas desde F12).",
+        hoja="Formato 5.A",
+        columnas=(
             "Codigo AO",
             "Nombre AO",
             "Ene",
@@ -221,15 +244,15 @@ FORMATO_CATALOG: list[dict[str, Any]] = [
             "Nov",
             "Dic",
             "Total Programado",
-        ],
-        "fila_inicio": 12,
-    },
-    {
-        "key": "formato5b",
-        "nombre": "Formato 5.B - Ejecucion AO",
-        "descripcion": "Ejecucion mensual triple (programado/ejecutado/saldo x 12 meses, 45 columnas desde F12).",
-        "hoja": "Formato 5.B",
-        "columnas": [
+        ),
+        fila_inicio=12,
+    ),
+    FormatoSpec(
+        key="formato5b",
+        nombre="Formato 5.B - Ejecucion AO",
+        descripcion="Ejecucion mensual triple (programado/ejecutado/saldo x 12 meses, 45 columnas desde F12).",
+        hoja="Formato 5.B",
+        columnas=(
             "Codigo AO",
             "Nombre AO",
             # Programado (12 months)
@@ -250,15 +273,15 @@ FORMATO_CATALOG: list[dict[str, Any]] = [
             "Total Saldo",
             "PIM",
             "% Avance",
-        ],
-        "fila_inicio": 12,
-    },
-    {
-        "key": "formato5_resumen",
-        "nombre": "Formato 5 Resumen - Resumen Ejecucion",
-        "descripcion": "Resumen de ejecucion por AO (20 columnas desde F7).",
-        "hoja": "Formato 5 Resumen",
-        "columnas": [
+        ),
+        fila_inicio=12,
+    ),
+    FormatoSpec(
+        key="formato5_resumen",
+        nombre="Formato 5 Resumen - Resumen Ejecucion",
+        descripcion="Resumen de ejecucion por AO (20 columnas desde F7).",
+        hoja="Formato 5 Resumen",
+        columnas=(
             "Codigo AO",
             "Nombre AO",
             "PIM",
@@ -282,15 +305,15 @@ FORMATO_CATALOG: list[dict[str, Any]] = [
             "Oct",
             "Nov",
             "Dic",
-        ],
-        "fila_inicio": 7,
-    },
-    {
-        "key": "anexo01",
-        "nombre": "Anexo 01 - Datos RRHH",
-        "descripcion": "Datos de recursos humanos por unidad ejecutora.",
-        "hoja": "Anexo 01",
-        "columnas": [
+        ),
+        fila_inicio=7,
+    ),
+    FormatoSpec(
+        key="anexo01",
+        nombre="Anexo 01 - Datos RRHH",
+        descripcion="Datos de recursos humanos por unidad ejecutora.",
+        hoja="Anexo 01",
+        columnas=(
             "N°",
             "DNI",
             "Apellidos y Nombres",
@@ -303,16 +326,76 @@ FORMATO_CATALOG: list[dict[str, Any]] = [
             "Remuneracion Mensual",
             "Observaciones",
             "Estado",
-        ],
-        "fila_inicio": 8,
-    },
-]
+        ),
+        fila_inicio=8,
+    ),
+)
 
 # Fast lookup by key
-_CATALOG_BY_KEY: dict[str, dict[str, Any]] = {
-    fmt["key"]: fmt for fmt in FORMATO_CATALOG
+_CATALOG_BY_KEY: dict[str, FormatoSpec] = {
+    fmt.key: fmt for fmt in FORMATO_CATALOG
+}
+
+#: Static part of the template fingerprint: the catalog and this module's
+#: source (styles/layout).  ``_catalog_fingerprint`` adds the example year.
+_FINGERPRINT_BASE: bytes = repr(FORMATO_CATALOG).encode() + Path(__file__).read_bytes()
+
+_FINGERPRINT_FILE = ".catalog_fingerprint"
+
+#: Deflate level for the generated ``.xlsx`` archives (zipfile default is 6).
+_ZIP_COMPRESSLEVEL = 1
+
+
+def _catalog_fingerprint(anio: int) -> str:
+    """Identify the templates this code produces for the given example year.
+
+    Stored next to the generated files so unchanged templates are not rebuilt.
+    """
+    return hashlib.blake2b(
+        _FINGERPRINT_BASE + str(anio).encode(), digest_size=16
+    ).hexdigest()
+
+
+class _Layout(NamedTuple):
+    """Sheet geometry derived from a catalog entry, fixed for the process."""
+
+    col_letters: tuple[str, ...]
+    col_widths: tuple[int, ...]
+    title_merge: str | None  # e.g. "A1:F1"; None for single-column formats
+    row_heights: dict[int, float]  # 1-based row index -> height in points
+
+
+def _build_layout(fmt: FormatoSpec) -> _Layout:
+    """Precompute column letters, widths, the title merge range and row heights.
+
+    Widths follow the header text length (min 10, max 30); the title merge
+    spans at most 6 columns so it stays compact on narrow sheets.  Heights:
+    title 28, context rows 18, blank filler rows 15 and the column-header row
+    (``fila_inicio - 1``) 22, which wins if it coincides with a context row.
+    """
+    columnas = fmt.columnas
+    header_row = fmt.fila_inicio - 1
+    merge_end_col = min(len(columnas), 6)
+
+    row_heights: dict[int, float] = {1: 28, 2: 18, 3: 18, 4: 18}
+    row_heights.update((blank_row, 15) for blank_row in range(5, header_row))
+    row_heights[header_row] = 22
+
+    return _Layout(
+        col_letters=tuple(get_column_letter(i) for i in range(1, len(columnas) + 1)),
+        col_widths=tuple(max(10, min(30, len(col) + 4)) for col in columnas),
+        title_merge=f"A1:{get_column_letter(merge_end_col)}1" if merge_end_col > 1 else None,
+        row_heights=row_heights,
+    )
+
+
+_LAYOUT_BY_KEY: dict[str, _Layout] = {
+    fmt.key: _build_layout(fmt) for fmt in FORMATO_CATALOG
 }
 
+#: Row heights of the Instrucciones sheet: title row, then five instructions.
+_INSTR_ROW_HEIGHTS: dict[int, float] = {1: 24, **{row: 18 for row in range(2, 7)}}
+
 
 # ---------------------------------------------------------------------------
 # openpyxl style helpers
@@ -348,6 +431,31 @@ def _make_medium_border() -> Border:
     )
 
 
+# Style objects are built once at import and shared by every cell: openpyxl
+# styles are immutable, and reusing the same instance avoids re-hashing a
+# fresh Font/Fill/Border/Alignment for each cell when it is registered.
+_THIN_BORDER: Border = _make_thin_border()
+
+_COL_HEADER_FONT = Font(bold=True, color=_HEX_WHITE, size=10, name="Calibri")
+_COL_HEADER_FILL = PatternFill(fill_type="solid", fgColor=_HEX_PRIMARY)
+_COL_HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+_LABEL_FONT = Font(bold=True, color=_HEX_LABEL_TEXT, size=10, name="Calibri")
+_LABEL_FILL = PatternFill(fill_type="solid", fgColor=_HEX_LABEL_BG)
+_LABEL_ALIGN = Alignment(horizontal="right", vertical="center")
+
+_VALUE_FONT = Font(color="111827", size=10, name="Calibri")
+_VALUE_ALIGN = Alignment(horizontal="left", vertical="center")
+
+_TITLE_FONT = Font(bold=True, color=_HEX_WHITE, size=14, name="Calibri")
+_TITLE_FILL = PatternFill(fill_type="solid", fgColor=_HEX_TITLE_BG)
+_TITLE_ALIGN = Alignment(horizontal="center", vertical="center")
+
+_INSTR_TITLE_FONT = Font(bold=True, size=13, color=_HEX_LABEL_TEXT, name="Calibri")
+_INSTR_TEXT_FONT = Font(size=10, name="Calibri", color="374151")
+_INSTR_TEXT_ALIGN = Alignment(horizontal="left", vertical="center", wrap_text=True)
+
+
 def _apply_col_header_style(cell: Any) -> None:
     """Apply the INEI column-header style to a single openpyxl cell.
 
@@ -357,22 +465,10 @@ def _apply_col_header_style(cell: Any) -> None:
     Args:
         cell: An ``openpyxl`` ``Cell`` object to style in-place.
     """
-    cell.font = Font(
-        bold=True,
-        color=_HEX_WHITE,
-        size=10,
-        name="Calibri",
-    )
-    cell.fill = PatternFill(
-        fill_type="solid",
-        fgColor=_HEX_PRIMARY,
-    )
-    cell.border = _make_thin_border()
-    cell.alignment = Alignment(
-        horizontal="center",
-        vertical="center",
-        wrap_text=True,
-    )
+    cell.font = _COL_HEADER_FONT
+    cell.fill = _COL_HEADER_FILL
+    cell.border = _THIN_BORDER
+    cell.alignment = _COL_HEADER_ALIGN
 
 
 def _apply_context_label_style(cell: Any) -> None:
@@ -384,33 +480,26 @@ def _apply_context_label_style(cell: Any) -> None:
     Args:
         cell: An ``openpyxl`` ``Cell`` object to style in-place.
     """
-    cell.font = Font(
-        bold=True,
-        color=_HEX_LABEL_TEXT,
-        size=10,
-        name="Calibri",
-    )
-    cell.fill = PatternFill(
-        fill_type="solid",
-        fgColor=_HEX_LABEL_BG,
-    )
-    cell.border = _make_thin_border()
-    cell.alignment = Alignment(horizontal="right", vertical="center")
+    cell.font = _LABEL_FONT
+    cell.fill = _LABEL_FILL
+    cell.border = _THIN_BORDER
+    cell.alignment = _LABEL_ALIGN
 
 
 def _apply_context_value_style(cell: Any) -> None:
     """Apply the style for a context-area value cell (user fills this in).
 
-    Style: regular weight, dark text, white background, all-sides thin border,
-    left-aligned — clearly indicating an editable input cell.
+    Style: regular weight, dark text, all-sides thin border, left-aligned —
+    clearly indicating an editable input cell.  No fill is set: the default
+    background is already white and the border hides the gridlines, so a
+    solid-white fill would only add a redundant entry to the styles table.
 
     Args:
         cell: An ``openpyxl`` ``Cell`` object to style in-place.
     """
-    cell.font = Font(color="111827", size=10, name="Calibri")
-    cell.fill = PatternFill(fill_type="solid", fgColor=_HEX_WHITE)
-    cell.border = _make_thin_border()
-    cell.alignment = Alignment(horizontal="left", vertical="center")
+    cell.font = _VALUE_FONT
+    cell.border = _THIN_BORDER
+    cell.alignment = _VALUE_ALIGN
 
 
 def _apply_title_style(cell: Any) -> None:
@@ -421,117 +510,158 @@ def _apply_title_style(cell: Any) -> None:
     Args:
         cell: An ``openpyxl`` ``Cell`` object to style in-place.
     """
-    cell.font = Font(
-        bold=True,
-        color=_HEX_WHITE,
-        size=14,
-        name="Calibri",
-    )
-    cell.fill = PatternFill(fill_type="solid", fgColor=_HEX_TITLE_BG)
-    cell.alignment = Alignment(horizontal="center", vertical="center")
+    cell.font = _TITLE_FONT
+    cell.fill = _TITLE_FILL
+    cell.alignment = _TITLE_ALIGN
 
 
 # ---------------------------------------------------------------------------
-# Context header block writer
+# Fixed sheet text
 # ---------------------------------------------------------------------------
+# Identical in every template, so the same string objects are reused for all
+# workbooks instead of rebuilding the literals per call.
+
+#: Context row labels (rows 2-4).
+_CONTEXTO_LABELS: tuple[str, ...] = (
+    "Unidad Ejecutora:",
+    "Meta Presupuestal:",
+    "Año Fiscal:",
+)
+
+#: Instrucciones sheet text; ``{fila_inicio}`` is filled in per format.
+_INSTRUCCIONES: tuple[str, ...] = (
+    "1. Complete los datos de contexto (UE, Meta, Año) en las celdas correspondientes.",
+    "2. Ingrese los datos a partir de la fila {fila_inicio}.",
+    "3. No modifique las cabeceras de columna.",
+    "4. Los campos de montos deben ser numéricos (sin formato de texto).",
+    "5. No elimine ni agregue columnas.",
+)
+
+
+# ---------------------------------------------------------------------------
+# Row builders
+# ---------------------------------------------------------------------------
+# Templates are written with a write-only (streaming) workbook, so cells can
+# only be appended top to bottom.  The builders below therefore return rows as
+# ``{row_index: [cells]}`` and ``_append_rows`` streams them in order, with the
+# precomputed row heights, once the whole layout is known.
+
+#: Row contents keyed by 1-based row index.
+_Rows = dict[int, list[Any]]
+
+
+def _styled_cell(ws: Any, value: Any, apply_style: Any) -> WriteOnlyCell:
+    """Return a ``WriteOnlyCell`` holding ``value`` styled by ``apply_style``.
+
+    Args:
+        ws: The write-only worksheet the cell will be appended to.
+        value: Cell value.
+        apply_style: One of the ``_apply_*_style`` helpers.
+
+    Returns:
+        The styled cell, ready to be placed in a row.
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    apply_style(cell)
+    return cell
+
 
 def _write_context_header(
     ws: Any,
+    rows: _Rows,
     formato_nombre: str,
-    fila_inicio: int,
-    num_cols: int,
+    layout: _Layout,
+    anio: int,
 ) -> None:
-    """Write the four-row context header block to the given worksheet.
+    """Lay out the four-row context header block for the given worksheet.
 
     Layout (all 1-based row indices):
-    - Row 1  : Format title, merged across ``min(num_cols, 6)`` columns.
+    - Row 1  : Format title, merged across ``layout.title_merge``.
     - Row 2  : "Unidad Ejecutora:" label (col A) + empty value cell (col B).
     - Row 3  : "Meta Presupuestal:" label (col A) + empty value cell (col B).
-    - Row 4  : "Año Fiscal:" label (col A) + current year as example (col B).
+    - Row 4  : "Año Fiscal:" label (col A) + ``anio`` as example (col B).
     - Rows 5 … (fila_inicio - 2): blank filler rows (no styling).
-    - Row (fila_inicio - 1): Column header row — written by the caller.
+    - Row (fila_inicio - 1): Column header row — laid out by the caller.
 
     Args:
-        ws: An ``openpyxl`` ``Worksheet`` object.
+        ws: A write-only ``openpyxl`` worksheet.
+        rows: Row contents to fill in, keyed by 1-based row index.
         formato_nombre: Human-readable format name for the title cell.
-        fila_inicio: 1-based first data row (determines where headers go).
-        num_cols: Total number of data columns (used for merge width).
+        layout: Precomputed geometry of the format (title merge range).
+        anio: Example fiscal year shown in the "Año Fiscal" cell.
     """
-    # The title merge spans at most 6 columns so it stays compact on narrow sheets
-    merge_end_col = min(num_cols, 6)
-    merge_end_letter = get_column_letter(merge_end_col)
-
     # --- Row 1: title ---
-    title_cell = ws["A1"]
-    title_cell.value = formato_nombre
-    _apply_title_style(title_cell)
-    ws.row_dimensions[1].height = 28
-
-    if merge_end_col > 1:
-        ws.merge_cells(f"A1:{merge_end_letter}1")
-
-    # --- Row 2: Unidad Ejecutora ---
-    ws.row_dimensions[2].height = 18
-    label_ue = ws["A2"]
-    label_ue.value = "Unidad Ejecutora:"
-    _apply_context_label_style(label_ue)
-    value_ue = ws["B2"]
-    value_ue.value = ""
-    _apply_context_value_style(value_ue)
-
-    # --- Row 3: Meta Presupuestal ---
-    ws.row_dimensions[3].height = 18
-    label_meta = ws["A3"]
-    label_meta.value = "Meta Presupuestal:"
-    _apply_context_label_style(label_meta)
-    value_meta = ws["B3"]
-    value_meta.value = ""
-    _apply_context_value_style(value_meta)
-
-    # --- Row 4: Año Fiscal ---
-    ws.row_dimensions[4].height = 18
-    label_anio = ws["A4"]
-    label_anio.value = "Año Fiscal:"
-    _apply_context_label_style(label_anio)
-    value_anio = ws["B4"]
-    value_anio.value = _CURRENT_YEAR
-    _apply_context_value_style(value_anio)
-
-    # --- Rows 5 … (fila_inicio - 2): blank filler ---
-    # fila_inicio - 1 is reserved for column headers (written by _write_col_headers)
-    for blank_row in range(5, fila_inicio - 1):
-        ws.row_dimensions[blank_row].height = 15
+    rows[1] = [_styled_cell(ws, formato_nombre, _apply_title_style)]
 
+    if layout.title_merge is not None:
+        ws.merged_cells.add(layout.title_merge)
+
+    # --- Rows 2-4: Unidad Ejecutora, Meta Presupuestal, Año Fiscal ---
+    valores: tuple[Any, ...] = ("", "", anio)
+    for row_idx, (label, value) in enumerate(zip(_CONTEXTO_LABELS, valores), start=2):
+        rows[row_idx] = [
+            _styled_cell(ws, label, _apply_context_label_style),
+            _styled_cell(ws, value, _apply_context_value_style),
+        ]
+
+    # --- Rows 5 … (fila_inicio - 2): blank filler, heights only (see _Layout) ---
 
-# ---------------------------------------------------------------------------
-# Column header row writer
-# ---------------------------------------------------------------------------
 
 def _write_col_headers(
     ws: Any,
-    columnas: list[str],
+    rows: _Rows,
+    columnas: tuple[str, ...],
     fila_inicio: int,
+    layout: _Layout,
 ) -> None:
-    """Write styled column headers in the row immediately before data rows.
+    """Lay out styled column headers in the row immediately before data rows.
 
-    The column-header row is placed at ``fila_inicio - 1`` (1-based).
+    The column-header row is placed at ``fila_inicio - 1`` (1-based).  Column
+    widths are set here too; they must be in place before the first row is
+    streamed.
 
     Args:
-        ws: An ``openpyxl`` ``Worksheet`` object.
+        ws: A write-only ``openpyxl`` worksheet.
+        rows: Row contents to fill in, keyed by 1-based row index.
         columnas: Ordered list of column header strings.
         fila_inicio: 1-based first data row index.
+        layout: Precomputed geometry of the format (column letters/widths).
     """
     header_row = fila_inicio - 1  # 1-based
-    ws.row_dimensions[header_row].height = 22
+    rows[header_row] = [
+        _styled_cell(ws, col_name, _apply_col_header_style) for col_name in columnas
+    ]
 
-    for col_idx, col_name in enumerate(columnas, start=1):
-        cell = ws.cell(row=header_row, column=col_idx, value=col_name)
-        _apply_col_header_style(cell)
+    ws.column_dimensions.update(
+        {
+            col_letter: ColumnDimension(ws, index=col_letter, width=width)
+            for col_letter, width in zip(layout.col_letters, layout.col_widths)
+        }
+    )
 
-        # Auto-size column width based on header text length (min 10, max 30)
-        col_letter = get_column_letter(col_idx)
-        estimated_width = max(10, min(30, len(col_name) + 4))
-        ws.column_dimensions[col_letter].width = estimated_width
+
+def _set_row_heights(ws: Any, row_heights: dict[int, float]) -> None:
+    """Register every row height on ``ws`` in a single dictionary update."""
+    ws.row_dimensions.update(
+        {row_idx: RowDimension(ws, index=row_idx, ht=height) for row_idx, height in row_heights.items()}
+    )
+
+
+def _append_rows(ws: Any, rows: _Rows, row_heights: dict[int, float]) -> None:
+    """Stream the laid-out rows to a write-only worksheet in row order.
+
+    Row heights are registered first because a streamed row is written out
+    as soon as it is appended.  Gaps between laid-out rows become empty rows.
+
+    Args:
+        ws: A write-only ``openpyxl`` worksheet.
+        rows: Row contents keyed by 1-based row index.
+        row_heights: Row heights keyed by 1-based row index.
+    """
+    _set_row_heights(ws, row_heights)
+
+    for row_idx in range(1, max(rows, default=0) + 1):
+        ws.append(rows.get(row_idx, []))
 
 
 # ---------------------------------------------------------------------------
@@ -545,63 +675,71 @@ def _write_instrucciones_sheet(wb: Workbook, fila_inicio: int) -> None:
     end users on how to fill in the template correctly.
 
     Args:
-        wb: The ``openpyxl`` ``Workbook`` to add the sheet to.
+        wb: The write-only ``openpyxl`` ``Workbook`` to add the sheet to.
         fila_inicio: 1-based data start row — embedded in instruction #2 text.
     """
     ws_instr = wb.create_sheet(title="Instrucciones")
 
-    # Title
-    title_cell = ws_instr["A1"]
-    title_cell.value = "INSTRUCCIONES DE LLENADO"
-    title_cell.font = Font(bold=True, size=13, color=_HEX_LABEL_TEXT, name="Calibri")
-    title_cell.fill = PatternFill(fill_type="solid", fgColor=_HEX_LABEL_BG)
-    title_cell.alignment = Alignment(horizontal="left", vertical="center")
-    ws_instr.row_dimensions[1].height = 24
-    ws_instr.merge_cells("A1:E1")
-
-    # Five numbered instructions
-    instrucciones: list[str] = [
-        "1. Complete los datos de contexto (UE, Meta, Año) en las celdas correspondientes.",
-        f"2. Ingrese los datos a partir de la fila {fila_inicio}.",
-        "3. No modifique las cabeceras de columna.",
-        "4. Los campos de montos deben ser numéricos (sin formato de texto).",
-        "5. No elimine ni agregue columnas.",
-    ]
-
-    for row_offset, text in enumerate(instrucciones, start=2):
-        cell = ws_instr.cell(row=row_offset, column=1, value=text)
-        cell.font = Font(size=10, name="Calibri", color="374151")
-        cell.alignment = Alignment(
-            horizontal="left",
-            vertical="center",
-            wrap_text=True,
-        )
-        ws_instr.row_dimensions[row_offset].height = 18
-
     # Set a comfortable column width for readability
     ws_instr.column_dimensions["A"].width = 80
 
+    # Title
+    title_cell = WriteOnlyCell(ws_instr, value="INSTRUCCIONES DE LLENADO")
+    title_cell.font = _INSTR_TITLE_FONT
+    title_cell.fill = _LABEL_FILL
+    title_cell.alignment = _VALUE_ALIGN
+    ws_instr.merged_cells.add("A1:E1")
+
+    # Five numbered instructions; only #2 depends on the format
+    _set_row_heights(ws_instr, _INSTR_ROW_HEIGHTS)
+    ws_instr.append([title_cell])
+    for text in _INSTRUCCIONES:
+        cell = WriteOnlyCell(ws_instr, value=text.format(fila_inicio=fila_inicio))
+        cell.font = _INSTR_TEXT_FONT
+        cell.alignment = _INSTR_TEXT_ALIGN
+        ws_instr.append([cell])
+
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def get_formato_catalog() -> list[dict[str, Any]]:
-    """Return a safe copy of the complete format catalog.
+def get_formato_catalog() -> tuple[FormatoSpec, ...]:
+    """Return the complete format catalog.
 
-    Each dict in the returned list contains the keys ``key``, ``nombre``,
-    ``descripcion``, ``hoja``, ``columnas``, and ``fila_inicio``.
+    The entries are frozen dataclasses, so the catalog itself is handed out
+    without copying; use ``dataclasses.asdict(entry)`` if a mutable dict is
+    needed.
 
     Returns:
-        Deep-copied list of all 10 format catalog entries.
+        Tuple of ``FormatoSpec`` entries for all 10 formats.
     """
-    return copy.deepcopy(FORMATO_CATALOG)
+    return FORMATO_CATALOG
 
 
-def generate_template(formato_key: str, output_path: Path) -> Path:
-    """Generate a single Excel template file for the specified format.
+def get_template_bytes(formato_key: str) -> bytes:
+    """Return the ``.xlsx`` template for a format, with the current year.
+
+    The year is read on every call, so long-running workers pick up the new
+    year after 1 January; the built bytes are cached per (format, year).
+
+    Args:
+        formato_key: One of the 10 format keys defined in ``FORMATO_CATALOG``.
+
+    Returns:
+        The complete ``.xlsx`` file content.
+
+    Raises:
+        KeyError: If ``formato_key`` is not found in the catalog.
+    """
+    return _build_template_bytes(formato_key, date.today().year)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_template_bytes(formato_key: str, anio: int) -> bytes:
+    """Build the ``.xlsx`` template for a format and return its bytes.
 
-    Creates a ``.xlsx`` workbook at ``output_path`` containing:
+    The workbook contains:
 
     * A data sheet named after the format's ``hoja`` value, with:
         - A four-row context header (title, UE, Meta, Año).
@@ -609,17 +747,18 @@ def generate_template(formato_key: str, output_path: Path) -> Path:
         - Styled column headers at row ``fila_inicio - 1``.
     * An ``Instrucciones`` sheet with five numbered filling instructions.
 
+    The output only depends on the static catalog and ``anio``, so each
+    format is built once per process and year and then served from memory.
+
     Args:
         formato_key: One of the 10 format keys defined in ``FORMATO_CATALOG``.
-        output_path: Absolute ``Path`` where the ``.xlsx`` file will be saved.
-                     Parent directories must already exist.
+        anio: Example fiscal year written in the context header.
 
     Returns:
-        The resolved ``output_path`` after the file has been written.
+        The complete ``.xlsx`` file content.
 
     Raises:
         KeyError: If ``formato_key`` is not found in the catalog.
-        OSError: If ``output_path`` is not writable.
     """
     fmt = _CATALOG_BY_KEY.get(formato_key)
     if fmt is None:
@@ -629,56 +768,92 @@ def generate_template(formato_key: str, output_path: Path) -> Path:
             f"Claves disponibles: {available}"
         )
 
-    nombre: str = fmt["nombre"]
-    hoja: str = fmt["hoja"]
-    columnas: list[str] = fmt["columnas"]
-    fila_inicio: int = fmt["fila_inicio"]
-    num_cols: int = len(columnas)
+    nombre = fmt.nombre
+    hoja = fmt.hoja
+    columnas = fmt.columnas
+    fila_inicio = fmt.fila_inicio
+    layout = _LAYOUT_BY_KEY[formato_key]
 
-    wb = Workbook()
-
-    # Rename the default sheet to the format's sheet name
-    ws = wb.active
-    ws.title = hoja  # type: ignore[union-attr]
+    # Write-only workbooks stream each row straight to the output instead of
+    # keeping a cell grid in memory; sheets are created explicitly.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=hoja)
 
     # Freeze pane below the column-header row so users can scroll data easily
-    freeze_row = fila_inicio  # first data row in 1-based; freeze pane is 0-based Excel address
-    ws.freeze_panes = ws.cell(row=freeze_row, column=1)  # type: ignore[union-attr]
+    ws.freeze_panes = f"A{fila_inicio}"
+
+    rows: _Rows = {}
 
-    # Write context header block (rows 1-4 + optional filler)
-    _write_context_header(ws, nombre, fila_inicio, num_cols)
+    # Context header block (rows 1-4 + optional filler)
+    _write_context_header(ws, rows, nombre, layout, anio)
 
-    # Write styled column headers at row (fila_inicio - 1)
-    _write_col_headers(ws, columnas, fila_inicio)
+    # Styled column headers at row (fila_inicio - 1); when fila_inicio is 5
+    # the header row takes the place of the "Año Fiscal" row.
+    _write_col_headers(ws, rows, columnas, fila_inicio, layout)
+
+    _append_rows(ws, rows, layout.row_heights)
 
     # Add Instrucciones sheet
     _write_instrucciones_sheet(wb, fila_inicio)
 
-    # Ensure parent directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Same as wb.save(), but with a fast deflate level: the templates are
+    # small and highly repetitive XML, so level 1 is nearly as compact.
+    buffer = io.BytesIO()
+    archive = zipfile.ZipFile(
+        buffer, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=_ZIP_COMPRESSLEVEL
+    )
+    ExcelWriter(wb, archive).save()
+    return buffer.getvalue()
+
 
-    wb.save(str(output_path))
+def generate_template(formato_key: str, output_path: Path) -> Path:
+    """Generate a single Excel template file for the specified format.
 
+    Writes the workbook built by ``get_template_bytes`` to ``output_path``.
+
+    Args:
+        formato_key: One of the 10 format keys defined in ``FORMATO_CATALOG``.
+        output_path: Absolute ``Path`` where the ``.xlsx`` file will be saved.
+                     Parent directories are created if needed.
+
+    Returns:
+        The resolved ``output_path`` after the file has been written.
+
+    Raises:
+        KeyError: If ``formato_key`` is not found in the catalog.
+        OSError: If ``output_path`` is not writable.
+    """
+    content = get_template_bytes(formato_key)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(content)
+
+    fmt = _CATALOG_BY_KEY[formato_key]
     logger.info(
         "generate_template: key='%s' cols=%d fila_inicio=%d -> '%s'",
         formato_key,
-        num_cols,
-        fila_inicio,
+        len(fmt.columnas),
+        fmt.fila_inicio,
         output_path,
     )
 
     return output_path.resolve()
 
 
-def generate_all_templates(plantillas_dir: Path) -> list[str]:
+def generate_all_templates(plantillas_dir: Path, force: bool = False) -> list[str]:
     """Generate all 10 INEI format templates and save them to ``plantillas_dir``.
 
     File names follow the pattern ``plantilla_{formato_key}.xlsx`` so they can
     be served directly by the import router without any name-mapping step.
 
+    A ``.catalog_fingerprint`` file is written after a successful run.  When it
+    matches the current catalog and every template exists, the files are
+    returned as they are without opening ``openpyxl``.
+
     Args:
         plantillas_dir: Directory where the ``.xlsx`` files will be written.
                         Created (including parents) if it does not exist.
+        force: Regenerate every template even if the fingerprint matches.
 
     Returns:
         List of absolute file path strings for each generated template,
@@ -689,12 +864,27 @@ def generate_all_templates(plantillas_dir: Path) -> list[str]:
     """
     plantillas_dir.mkdir(parents=True, exist_ok=True)
 
-    generated: list[str] = []
-    for fmt in FORMATO_CATALOG:
-        key: str = fmt["key"]
-        file_path = plantillas_dir / f"plantilla_{key}.xlsx"
-        resolved = generate_template(key, file_path)
-        generated.append(str(resolved))
+    keys: list[str] = [fmt.key for fmt in FORMATO_CATALOG]
+    paths: list[Path] = [plantillas_dir / f"plantilla_{key}.xlsx" for key in keys]
+    fingerprint_path = plantillas_dir / _FINGERPRINT_FILE
+    fingerprint = _catalog_fingerprint(date.today().year)
+
+    if not force and all(path.is_file() for path in paths):
+        try:
+            vigente = fingerprint_path.read_text(encoding="utf-8").strip() == fingerprint
+        except OSError:
+            vigente = False
+        if vigente:
+            logger.info(
+                "generate_all_templates: templates in '%s' are up to date, skipping",
+                plantillas_dir,
+            )
+            return [str(path.resolve()) for path in paths]
+
+    generated: list[str] = [
+        str(generate_template(key, path)) for key, path in zip(keys, paths)
+    ]
+    fingerprint_path.write_text(fingerprint, encoding="utf-8")
 
     logger.info(
         "generate_all_templates: %d templates written to '%s'",
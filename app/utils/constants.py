@@ -3,6 +3,9 @@ Application-wide constants for the Dashboard INEI system.
 
 Defines domain enumerations, business rule thresholds, and
 lookup lists used across routers, services, and models.
+
+Each enumeration is an ordered list (for display and error messages) plus a
+``*_SET`` frozenset for membership checks.
 """
 
 from typing import Final
@@ -18,6 +21,7 @@ ROLES: Final[list[str]] = [
     "LOGISTICA",
     "CONSULTA",
 ]
+ROLES_SET: Final[frozenset[str]] = frozenset(ROLES)
 
 # ---------------------------------------------------------------------------
 # Acquisition states (Adquisiciones >8 UIT)
@@ -32,6 +36,7 @@ ESTADOS_ADQUISICION: Final[list[str]] = [
     "DESIERTO",
     "NULO",
 ]
+ESTADOS_ADQUISICION_SET: Final[frozenset[str]] = frozenset(ESTADOS_ADQUISICION)
 
 # ---------------------------------------------------------------------------
 # Minor contract states (Contratos Menores <=8 UIT)
@@ -44,6 +49,7 @@ ESTADOS_CONTRATO_MENOR: Final[list[str]] = [
     "EJECUTADO",
     "PAGADO",
 ]
+ESTADOS_CONTRATO_MENOR_SET: Final[frozenset[str]] = frozenset(ESTADOS_CONTRATO_MENOR)
 
 # ---------------------------------------------------------------------------
 # Acquisition phases (Ley 32069)
@@ -54,6 +60,7 @@ FASES_ADQUISICION: Final[list[str]] = [
     "SELECCION",
     "EJECUCION_CONTRACTUAL",
 ]
+FASES_ADQUISICION_SET: Final[frozenset[str]] = frozenset(FASES_ADQUISICION)
 
 # ---------------------------------------------------------------------------
 # Object types
@@ -65,6 +72,7 @@ TIPOS_OBJETO: Final[list[str]] = [
     "OBRA",
     "CONSULTORIA",
 ]
+TIPOS_OBJETO_SET: Final[frozenset[str]] = frozenset(TIPOS_OBJETO)
 
 # ---------------------------------------------------------------------------
 # Procedure types
@@ -79,6 +87,7 @@ TIPOS_PROCEDIMIENTO: Final[list[str]] = [
     "CATALOGO_ELECTRONICO",
     "DIALOGO_COMPETITIVO",
 ]
+TIPOS_PROCEDIMIENTO_SET: Final[frozenset[str]] = frozenset(TIPOS_PROCEDIMIENTO)
 
 # ---------------------------------------------------------------------------
 # Alert levels (semaphore)
@@ -89,6 +98,7 @@ NIVELES_ALERTA: Final[list[str]] = [
     "AMARILLO",
     "VERDE",
 ]
+NIVELES_ALERTA_SET: Final[frozenset[str]] = frozenset(NIVELES_ALERTA)
 
 # ---------------------------------------------------------------------------
 # Application modules
@@ -100,6 +110,7 @@ MODULOS: Final[list[str]] = [
     "CONTRATOS_MENORES",
     "ACTIVIDADES_OPERATIVAS",
 ]
+MODULOS_SET: Final[frozenset[str]] = frozenset(MODULOS)
 
 # ---------------------------------------------------------------------------
 # Business rule thresholds (UIT 2026 = S/5,500)
@@ -1,42 +1,113 @@
 """
 Security utilities for the Dashboard INEI authentication system.
 
-Provides JWT token creation/verification and bcrypt password hashing
-via python-jose and passlib respectively. All configuration is sourced
+Provides JWT token creation/verification via PyJWT and Argon2id password
+hashing via argon2-cffi (legacy bcrypt hashes are still verified and are
+re-hashed on the next successful login). All configuration is sourced
 from the application settings singleton so that secrets are never
 hard-coded in source files.
 """
 
 from __future__ import annotations
 
+import base64
 import logging
-from datetime import datetime, timedelta, timezone
+import threading
+import time
 from typing import Any
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from jwt import InvalidTokenError, PyJWK
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# JWT and password-hashing configuration, read once at import like
+# app.database does.
+_settings = get_settings()
+_JWT_SECRET: str = _settings.JWT_SECRET
+_JWT_ALGORITHM: str = _settings.JWT_ALGORITHM
+_JWT_ALGORITHMS: list[str] = [_JWT_ALGORITHM]
+_JWT_KEY: PyJWK | str = _JWT_SECRET
+if _JWT_ALGORITHM.startswith("HS"):
+    # A prepared key: PyJWT otherwise re-validates and re-encodes the secret
+    # on every decode.
+    _JWT_KEY = PyJWK(
+        {"kty": "oct", "k": base64.urlsafe_b64encode(_JWT_SECRET.encode()).rstrip(b"=").decode()},
+        algorithm=_JWT_ALGORITHM,
+    )
+_JWT_EXPIRATION_SECONDS: int = _settings.JWT_EXPIRATION_MINUTES * 60
+_PASSWORD_HASHER = PasswordHasher(
+    time_cost=_settings.ARGON2_TIME_COST,
+    memory_cost=_settings.ARGON2_MEMORY_COST,
+    parallelism=_settings.ARGON2_PARALLELISM,
+)
+
+# bcrypt only ever hashed the first 72 bytes of a password (it silently
+# truncated), so legacy hashes are verified against that prefix.  Argon2 has
+# no such limit; the request schemas bound password length.
+_BCRYPT_MAX_BYTES = 72
+
+#: Seconds a verified token's payload is reused without re-checking the
+#: signature.  Expiry is still enforced on every hit; the user row (activo)
+#: is re-read by get_current_user on every request regardless.
+_TOKEN_CACHE_TTL: float = 60.0
+
+#: Maximum cached tokens; the least recently stored one is evicted first.
+_TOKEN_CACHE_MAXSIZE: int = 10_000
+
+_token_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_token_cache_lock = threading.Lock()
+
+# Prefixes of bcrypt hashes stored before the switch to Argon2id.
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
 
 # ---------------------------------------------------------------------------
-# Password helpers (bcrypt direct — passlib has compatibility issues with
-# bcrypt 4.x on Python 3.13)
+# Password helpers (Argon2id; bcrypt kept only to verify legacy hashes)
 # ---------------------------------------------------------------------------
 
 
+def _as_str(hashed: str | bytes) -> str:
+    return hashed if isinstance(hashed, str) else hashed.decode("ascii")
+
+
 def hash_password(password: str) -> str:
-    pwd_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(pwd_bytes, salt).decode("utf-8")
+    return _PASSWORD_HASHER.hash(password.encode("utf-8"))
+
+
+def verify_password(plain: str, hashed: str | bytes) -> bool:
+    hashed = _as_str(hashed)
+    if hashed.startswith(_BCRYPT_PREFIXES):
+        try:
+            # checkpw compares the digests in constant time.
+            return bcrypt.checkpw(plain.encode("utf-8")[:_BCRYPT_MAX_BYTES], hashed.encode("ascii"))
+        except ValueError:
+            # Malformed bcrypt hash stored for the user.
+            return False
+    try:
+        return _PASSWORD_HASHER.verify(hashed, plain.encode("utf-8"))
+    except (VerificationError, InvalidHashError):
+        # Wrong password, or malformed/unknown hash stored for the user.
+        return False
 
 
-def verify_password(plain: str, hashed: str) -> bool:
+def password_needs_rehash(hashed: str | bytes) -> bool:
+    """Return ``True`` if *hashed* should be replaced on the next login.
+
+    That is the case for legacy bcrypt hashes and for Argon2 hashes created
+    with parameters other than the configured ones.
+    """
+    hashed = _as_str(hashed)
+    if hashed.startswith(_BCRYPT_PREFIXES):
+        return True
     try:
-        return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
-    except Exception:
+        return _PASSWORD_HASHER.check_needs_rehash(hashed)
+    except InvalidHashError:
         return False
 
 
@@ -64,26 +135,24 @@ def create_access_token(data: dict[str, Any]) -> str:
 
         token = create_access_token({"sub": str(user.id), "rol": user.rol})
     """
-    settings = get_settings()
     payload = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.JWT_EXPIRATION_MINUTES
-    )
-    payload["exp"] = expire
-    payload["iat"] = datetime.now(timezone.utc)
+    # NumericDate claims as plain ints: that is what ends up in the token
+    # anyway, and it spares PyJWT the datetime -> timestamp conversion.
+    now = int(time.time())
+    payload["exp"] = now + _JWT_EXPIRATION_SECONDS
+    payload["iat"] = now
 
-    encoded = jwt.encode(
-        payload,
-        settings.JWT_SECRET,
-        algorithm=settings.JWT_ALGORITHM,
-    )
-    return encoded
+    return jwt.encode(payload, _JWT_KEY, algorithm=_JWT_ALGORITHM)
 
 
 def verify_token(token: str) -> dict[str, Any]:
     """Decode and verify a JWT access token.
 
-    Validates signature, expiration, and structural integrity.
+    Validates signature, expiration, and structural integrity.  A token
+    verified within the last ``_TOKEN_CACHE_TTL`` seconds is served from an
+    in-process cache (still subject to its ``exp``), since browsers send the
+    same Bearer token on every request.  There is no revocation list, so a
+    cached token stays usable until it expires, exactly as an uncached one.
 
     Args:
         token: A compact JWT string obtained from ``create_access_token``.
@@ -96,14 +165,28 @@ def verify_token(token: str) -> dict[str, Any]:
                     Callers (e.g. FastAPI dependencies) should map this to
                     an HTTP 401 response.
     """
-    settings = get_settings()
+    now = time.monotonic()
+    hit = _token_cache.get(token)
+    if hit is not None and now - hit[0] < _TOKEN_CACHE_TTL:
+        payload = hit[1]
+        if payload.get("exp", float("inf")) > time.time():
+            return dict(payload)
+
     try:
-        payload: dict[str, Any] = jwt.decode(
+        payload = jwt.decode(
             token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
+            _JWT_KEY,
+            algorithms=_JWT_ALGORITHMS,
         )
-        return payload
-    except JWTError as exc:
+    except InvalidTokenError as exc:
+        with _token_cache_lock:
+            _token_cache.pop(token, None)
         logger.debug("JWT verification failed: %s", exc)
         raise ValueError("Token inválido o expirado") from exc
+
+    with _token_cache_lock:
+        _token_cache.pop(token, None)
+        if len(_token_cache) >= _TOKEN_CACHE_MAXSIZE:
+            del _token_cache[next(iter(_token_cache))]
+        _token_cache[token] = (now, payload)
+    return dict(payload)
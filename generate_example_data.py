@@ -8,30 +8,54 @@ Each file mirrors the exact layout that the parsers expect:
 Usage:
     cd backend
     py generate_example_data.py
+    py generate_example_data.py --combined   # one workbook, one sheet per format
 """
 from __future__ import annotations
 
-import random
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+import numpy as np
+import xlsxwriter
 
 # Resolve output directory
 OUTPUT_DIR = Path(__file__).resolve().parent.parent / "formatos" / "ejemplo"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# Shared styling
-BLUE_FILL = PatternFill(fill_type="solid", fgColor="3b82f6")
-WHITE_FONT = Font(bold=True, color="FFFFFF", size=10, name="Calibri")
-HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
-THIN_BORDER = Border(
-    left=Side(style="thin", color="CBD5E1"),
-    right=Side(style="thin", color="CBD5E1"),
-    top=Side(style="thin", color="CBD5E1"),
-    bottom=Side(style="thin", color="CBD5E1"),
-)
+# Output paths as plain strings, built once instead of on every save
+_OUT = {
+    name: str(OUTPUT_DIR / f"ejemplo_{name}.xlsx")
+    for name in (
+        "cuadro_ao_meta", "tablas", "formato1", "formato2", "formato3",
+        "formato04", "formato5a", "formato5b", "formato5_resumen", "anexo01",
+    )
+}
+
+# Every random value is drawn a whole column at a time from a
+# numpy.random.Generator passed in as ``rng``. Each format gets its own
+# child of SeedSequence(SEED), so output is reproducible no matter which
+# process writes which file.
+SEED = 42
+
+# Shared styling (xlsxwriter format properties; formats belong to a workbook,
+# so _new_workbook() registers them for each file)
+HEADER_FORMAT = {
+    "bold": True,
+    "font_color": "#FFFFFF",
+    "font_size": 10,
+    "font_name": "Calibri",
+    "bg_color": "#3b82f6",
+    "align": "center",
+    "valign": "vcenter",
+    "text_wrap": True,
+}
+BORDERED_HEADER_FORMAT = {**HEADER_FORMAT, "border": 1, "border_color": "#CBD5E1"}
+TITLE_FORMAT = {"bold": True, "font_size": 12}
+# Amounts are written unrounded; the cell format shows two decimals and the
+# parsers round on import.
+MONEY_FORMAT = {"num_format": "#,##0.00"}
 
 # Dummy data pools
 CLASIFICADORES = [
@@ -74,6 +98,10 @@ AO_NAMES = [
     "Gestion logistica y adquisiciones",
     "Difusion de resultados estadisticos",
 ]
+# Cuadro AO-Meta codes, one per AO row
+SEC_FUNCIONALES = tuple(f"00{i+1}" for i in range(len(AO_CODES)))
+OEI_CODES = tuple(f"OEI.0{(i%3)+1}" for i in range(len(AO_CODES)))
+AEI_CODES = tuple(f"AEI.0{(i%4)+1}" for i in range(len(AO_CODES)))
 METAS = ["0001", "0002", "0003", "0004", "0005"]
 META_DESCS = [
     "Produccion estadistica nacional",
@@ -111,44 +139,71 @@ REGIMENES = ["276", "728", "1057 (CAS)", "Locacion de Servicios"]
 TIPOS_CONTRATO = ["Indeterminado", "Plazo Fijo", "CAS", "Orden de Servicio"]
 
 
-def _styled_header(ws, row, cols):
-    for col_idx, name in enumerate(cols, 1):
-        cell = ws.cell(row=row, column=col_idx, value=name)
-        cell.font = WHITE_FONT
-        cell.fill = BLUE_FILL
-        cell.alignment = HEADER_ALIGN
-        cell.border = THIN_BORDER
+def _new_workbook(path):
+    """Open a constant_memory workbook and register the shared formats.
+
+    constant_memory flushes each row to disk once a later row is started, so
+    every sheet is written strictly top to bottom (0-based indexes).
+    """
+    wb = xlsxwriter.Workbook(path, {"constant_memory": True})
+    formats = {
+        "header": wb.add_format(HEADER_FORMAT),
+        "bordered_header": wb.add_format(BORDERED_HEADER_FORMAT),
+        "title": wb.add_format(TITLE_FORMAT),
+        "money": wb.add_format(MONEY_FORMAT),
+    }
+    return wb, formats
+
+
+def _write_workbook(path, sheet_title, fill, rng=None):
+    """Write a one-sheet example file whose rows come from ``fill(ws, formats, rng)``.
 
+    Without ``rng`` the file is drawn from a generator seeded with SEED.
+    """
+    if rng is None:
+        rng = np.random.default_rng(SEED)
+    wb, formats = _new_workbook(path)
+    fill(wb.add_worksheet(sheet_title), formats, rng)
+    wb.close()
 
-def _context_rows(ws, ue="001 - INEI SEDE CENTRAL", meta="0001", anio=2026):
+
+def _styled_header(ws, formats, row, cols):
+    """Write a bordered header row."""
+    ws.write_row(row, 0, cols, formats["bordered_header"])
+
+
+def _context_rows(ws, formats, ue="001 - INEI SEDE CENTRAL", meta="0001", anio=2026):
     """Write standard 4-row context block."""
-    ws["A1"] = "INSTITUTO NACIONAL DE ESTADISTICA E INFORMATICA"
-    ws["A1"].font = Font(bold=True, size=12)
-    ws["A2"] = "Unidad Ejecutora:"
-    ws["B2"] = ue
-    ws["A3"] = "Meta Presupuestal:"
-    ws["B3"] = meta
-    ws["A4"] = "Ano Fiscal:"
-    ws["B4"] = anio
+    ws.write(0, 0, "INSTITUTO NACIONAL DE ESTADISTICA E INFORMATICA", formats["title"])
+    ws.write_row(1, 0, ["Unidad Ejecutora:", ue])
+    ws.write_row(2, 0, ["Meta Presupuestal:", meta])
+    ws.write_row(3, 0, ["Ano Fiscal:", anio])
 
 
-def _random_monthly(total):
+def _random_monthly(total, rng):
     """Split total into 12 random monthly values that sum to total."""
     if total <= 0:
         return [0.0] * 12
-    weights = [random.uniform(0.5, 1.5) for _ in range(12)]
-    s = sum(weights)
-    monthly = [round(total * w / s, 2) for w in weights]
-    # Adjust last month to ensure exact sum
-    diff = round(total - sum(monthly), 2)
-    monthly[11] = round(monthly[11] + diff, 2)
-    return monthly
-
-
-def gen_cuadro_ao_meta():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Cuadro AO-Meta"
+    weights = rng.uniform(0.5, 1.5, 12)
+    return (total * weights / weights.sum()).tolist()
+
+
+def _formato5b_block(pims, weights, ratios):
+    """Build every Formato 5.B amount in one vectorised pass.
+
+    ``pims`` has one PIM per AO. ``weights`` (n x 12) splits each PIM into
+    monthly programado, as in _random_monthly, and ``ratios`` (n x 12) is
+    the executed share of each month. Returns an (n, 39) array laid out
+    like the sheet: Programado, Ejecutado, Saldo for each month, then the
+    three totals.
+    """
+    prog = pims[:, None] * weights / weights.sum(axis=1, keepdims=True)
+    ejec = prog * ratios
+    monthly = np.stack((prog, ejec, prog - ejec), axis=2)  # (n, 12, 3)
+    return np.concatenate((monthly.reshape(len(pims), 36), monthly.sum(axis=1)), axis=1)
+
+
+def _fill_cuadro_ao_meta(ws, formats, rng):
     # Cuadro AO-Meta has a simpler layout: direct header at row 1
     # matching what real INEI files look like for master data
     cols = [
@@ -156,116 +211,90 @@ def gen_cuadro_ao_meta():
         "Codigo Meta", "Sec. Funcional", "Descripcion Meta",
         "Codigo AO", "Nombre AO", "OEI", "AEI",
     ]
-    _styled_header(ws, 1, cols)
+    _styled_header(ws, formats, 0, cols)
     for i in range(10):
-        r = 2 + i
-        ws.cell(row=r, column=1, value="001")
-        ws.cell(row=r, column=2, value="INEI SEDE CENTRAL")
-        ws.cell(row=r, column=3, value="INEI")
-        ws.cell(row=r, column=4, value=METAS[i % 5])
-        ws.cell(row=r, column=5, value=f"00{i+1}")
-        ws.cell(row=r, column=6, value=META_DESCS[i % 5])
-        ws.cell(row=r, column=7, value=AO_CODES[i])
-        ws.cell(row=r, column=8, value=AO_NAMES[i])
-        ws.cell(row=r, column=9, value=f"OEI.0{(i%3)+1}")
-        ws.cell(row=r, column=10, value=f"AEI.0{(i%4)+1}")
-    wb.save(str(OUTPUT_DIR / "ejemplo_cuadro_ao_meta.xlsx"))
-    print("  cuadro_ao_meta OK")
-
-
-def gen_tablas():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Tablas"
+        ws.write_row(1 + i, 0, [
+            "001", "INEI SEDE CENTRAL", "INEI",
+            METAS[i % 5], SEC_FUNCIONALES[i], META_DESCS[i % 5],
+            AO_CODES[i], AO_NAMES[i], OEI_CODES[i], AEI_CODES[i],
+        ])
+
+
+def gen_cuadro_ao_meta(rng=None):
+    _write_workbook(_OUT["cuadro_ao_meta"], "Cuadro AO-Meta", _fill_cuadro_ao_meta, rng)
+    return "  cuadro_ao_meta OK"
+
+
+def _fill_tablas(ws, formats, rng):
     # Tablas parser expects header at row 1 with Clasificador + Descripcion + Tipo Generico
     cols = ["Clasificador", "Descripcion", "Tipo Generico"]
-    _styled_header(ws, 1, cols)
+    _styled_header(ws, formats, 0, cols)
     genericos = ["2.3", "2.6", "2.1"]
+    generico_ix = rng.integers(0, len(genericos), len(CLASIFICADORES))
     for i, clas in enumerate(CLASIFICADORES):
-        r = 2 + i
-        ws.cell(row=r, column=1, value=clas)
-        ws.cell(row=r, column=2, value=DESCRIPCIONES_GASTO[i])
-        ws.cell(row=r, column=3, value=random.choice(genericos))
-    wb.save(str(OUTPUT_DIR / "ejemplo_tablas.xlsx"))
-    print("  tablas OK")
-
-
-def gen_formato1():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Formato 1"
-    _context_rows(ws)
-    ws["A5"] = ""
-    ws["A6"] = ""
+        ws.write_row(1 + i, 0, [clas, DESCRIPCIONES_GASTO[i], genericos[generico_ix[i]]])
+
+
+def gen_tablas(rng=None):
+    _write_workbook(_OUT["tablas"], "Tablas", _fill_tablas, rng)
+    return "  tablas OK"
+
+
+def _fill_formato1(ws, formats, rng):
+    _context_rows(ws, formats)
     months = ["Ene", "Feb", "Mar", "Abr", "May", "Jun", "Jul", "Ago", "Sep", "Oct", "Nov", "Dic"]
     cols = ["Clasificador", "Descripcion", "PIA", "PIM"] + months + ["Total"]
-    _styled_header(ws, 7, cols)
-    for i in range(12):
-        r = 8 + i
-        pim = round(random.uniform(50000, 500000), 2)
-        pia = round(pim * random.uniform(0.8, 1.0), 2)
-        monthly = _random_monthly(pim)
-        ws.cell(row=r, column=1, value=CLASIFICADORES[i])
-        ws.cell(row=r, column=2, value=DESCRIPCIONES_GASTO[i])
-        ws.cell(row=r, column=3, value=pia)
-        ws.cell(row=r, column=4, value=pim)
-        for m_idx, mval in enumerate(monthly):
-            ws.cell(row=r, column=5 + m_idx, value=mval)
-        ws.cell(row=r, column=17, value=round(sum(monthly), 2))
-    wb.save(str(OUTPUT_DIR / "ejemplo_formato1.xlsx"))
-    print("  formato1 OK")
-
-
-def gen_formato2():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Formato 2"
-    _context_rows(ws)
-    ws["A5"] = ""
-    ws["A6"] = ""
+    _styled_header(ws, formats, 6, cols)
+    pims = rng.uniform(50000, 500000, 12)
+    pias = pims * rng.uniform(0.8, 1.0, 12)
+    for i, (pim, pia) in enumerate(zip(pims.tolist(), pias.tolist())):
+        monthly = _random_monthly(pim, rng)
+        ws.write_row(7 + i, 0, [CLASIFICADORES[i], DESCRIPCIONES_GASTO[i]])
+        ws.write_row(7 + i, 2, [pia, pim] + monthly + [sum(monthly)], formats["money"])
+
+
+def gen_formato1(rng=None):
+    _write_workbook(_OUT["formato1"], "Formato 1", _fill_formato1, rng)
+    return "  formato1 OK"
+
+
+def _fill_formato2(ws, formats, rng):
+    _context_rows(ws, formats)
     months = ["Ene", "Feb", "Mar", "Abr", "May", "Jun", "Jul", "Ago", "Sep", "Oct", "Nov", "Dic"]
     cols = [
         "Cod Meta", "Desc Meta", "Cod AO", "Desc AO",
         "Cod Tarea", "Desc Tarea", "Clasificador", "Desc Clasificador", "PIM",
     ] + months
-    _styled_header(ws, 7, cols)
-    row = 8
-    for t in range(10):
+    _styled_header(ws, formats, 6, cols)
+    pims = rng.uniform(20000, 200000, 10).tolist()
+    for t, pim in enumerate(pims):
         meta_idx = t % 5
         ao_idx = t % 10
         tarea_idx = t % 5
-        pim = round(random.uniform(20000, 200000), 2)
-        monthly = _random_monthly(pim)
-        ws.cell(row=row, column=1, value=METAS[meta_idx])
-        ws.cell(row=row, column=2, value=META_DESCS[meta_idx])
-        ws.cell(row=row, column=3, value=AO_CODES[ao_idx])
-        ws.cell(row=row, column=4, value=AO_NAMES[ao_idx])
-        ws.cell(row=row, column=5, value=TAREAS[tarea_idx])
-        ws.cell(row=row, column=6, value=TAREA_DESCS[tarea_idx])
-        ws.cell(row=row, column=7, value=CLASIFICADORES[t % 16])
-        ws.cell(row=row, column=8, value=DESCRIPCIONES_GASTO[t % 16])
-        ws.cell(row=row, column=9, value=pim)
-        for m_idx, mval in enumerate(monthly):
-            ws.cell(row=row, column=10 + m_idx, value=mval)
-        row += 1
-    wb.save(str(OUTPUT_DIR / "ejemplo_formato2.xlsx"))
-    print("  formato2 OK")
-
-
-def gen_formato3():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Formato 3"
-    _context_rows(ws)
-    ws["A5"] = ""
-    ws["A6"] = ""
+        monthly = _random_monthly(pim, rng)
+        ws.write_row(7 + t, 0, [
+            METAS[meta_idx], META_DESCS[meta_idx],
+            AO_CODES[ao_idx], AO_NAMES[ao_idx],
+            TAREAS[tarea_idx], TAREA_DESCS[tarea_idx],
+            CLASIFICADORES[t % 16], DESCRIPCIONES_GASTO[t % 16],
+        ])
+        ws.write_row(7 + t, 8, [pim] + monthly, formats["money"])
+
+
+def gen_formato2(rng=None):
+    _write_workbook(_OUT["formato2"], "Formato 2", _fill_formato2, rng)
+    return "  formato2 OK"
+
+
+def _fill_formato3(ws, formats, rng):
+    _context_rows(ws, formats)
     cols = [
         "Cod Meta", "Desc Meta", "Cod AO", "Desc AO",
         "Cod Tarea", "Desc Tarea", "Clasificador", "Desc Clasificador",
         "PIM", "Programado", "Ejecutado", "Saldo", "% Avance",
         "Justificacion", "Observaciones",
     ]
-    _styled_header(ws, 7, cols)
+    _styled_header(ws, formats, 6, cols)
     justificaciones = [
         "Ejecucion conforme al cronograma establecido",
         "Retraso por demora en proceso de seleccion",
@@ -273,277 +302,267 @@ def gen_formato3():
         "Pendiente conformidad de area usuaria",
         "En proceso de adquisicion de bienes",
     ]
-    row = 8
-    for t in range(10):
-        pim = round(random.uniform(30000, 300000), 2)
-        ejecutado = round(pim * random.uniform(0.3, 0.95), 2)
-        programado = round(pim * random.uniform(0.8, 1.0), 2)
-        saldo = round(pim - ejecutado, 2)
-        avance = round(ejecutado / pim * 100, 2) if pim > 0 else 0
-        ws.cell(row=row, column=1, value=METAS[t % 5])
-        ws.cell(row=row, column=2, value=META_DESCS[t % 5])
-        ws.cell(row=row, column=3, value=AO_CODES[t % 10])
-        ws.cell(row=row, column=4, value=AO_NAMES[t % 10])
-        ws.cell(row=row, column=5, value=TAREAS[t % 5])
-        ws.cell(row=row, column=6, value=TAREA_DESCS[t % 5])
-        ws.cell(row=row, column=7, value=CLASIFICADORES[t % 16])
-        ws.cell(row=row, column=8, value=DESCRIPCIONES_GASTO[t % 16])
-        ws.cell(row=row, column=9, value=pim)
-        ws.cell(row=row, column=10, value=programado)
-        ws.cell(row=row, column=11, value=ejecutado)
-        ws.cell(row=row, column=12, value=saldo)
-        ws.cell(row=row, column=13, value=avance)
-        ws.cell(row=row, column=14, value=random.choice(justificaciones))
-        ws.cell(row=row, column=15, value="Sin observaciones" if avance > 70 else "Requiere atencion")
-        row += 1
-    wb.save(str(OUTPUT_DIR / "ejemplo_formato3.xlsx"))
-    print("  formato3 OK")
-
-
-def gen_formato04():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Formato 04"
-    ws["A1"] = "NOTA DE MODIFICACION PRESUPUESTAL"
-    ws["A1"].font = Font(bold=True, size=12)
-    ws["A2"] = "Unidad Ejecutora:"
-    ws["C2"] = "001 - INEI SEDE CENTRAL"
-    ws["A3"] = "Nota de Modificacion:"
-    ws["C3"] = "NM-2026-001"
-    ws["A4"] = "Fecha:"
-    ws["F4"] = "15/02/2026"
-    ws["F3"] = ""
-    ws["F4"] = 2026
-    ws["A5"] = ""
-    ws["A6"] = ""
+    pims = rng.uniform(30000, 300000, 10)
+    ejecutados = pims * rng.uniform(0.3, 0.95, 10)
+    programados = pims * rng.uniform(0.8, 1.0, 10)
+    justificacion_ix = rng.integers(0, len(justificaciones), 10)
+    rows = zip(pims.tolist(), ejecutados.tolist(), programados.tolist(), justificacion_ix)
+    for t, (pim, ejecutado, programado, just_ix) in enumerate(rows):
+        saldo = pim - ejecutado
+        avance = ejecutado / pim * 100 if pim > 0 else 0
+        ws.write_row(7 + t, 0, [
+            METAS[t % 5], META_DESCS[t % 5],
+            AO_CODES[t % 10], AO_NAMES[t % 10],
+            TAREAS[t % 5], TAREA_DESCS[t % 5],
+            CLASIFICADORES[t % 16], DESCRIPCIONES_GASTO[t % 16],
+        ])
+        ws.write_row(7 + t, 8, [pim, programado, ejecutado, saldo, avance], formats["money"])
+        ws.write_row(7 + t, 13, [
+            justificaciones[just_ix],
+            "Sin observaciones" if avance > 70 else "Requiere atencion",
+        ])
+
+
+def gen_formato3(rng=None):
+    _write_workbook(_OUT["formato3"], "Formato 3", _fill_formato3, rng)
+    return "  formato3 OK"
+
+
+def _fill_formato04(ws, formats, rng):
+    ws.write(0, 0, "NOTA DE MODIFICACION PRESUPUESTAL", formats["title"])
+    ws.write(1, 0, "Unidad Ejecutora:")
+    ws.write(1, 2, "001 - INEI SEDE CENTRAL")
+    ws.write(2, 0, "Nota de Modificacion:")
+    ws.write(2, 2, "NM-2026-001")
+    ws.write(3, 0, "Fecha:")
+    ws.write(3, 5, 2026)
     cols = ["Clasificador", "Descripcion", "Asignado", "Habilitadora", "Habilitada", "PIM Resultante"]
-    _styled_header(ws, 7, cols)
-    for i in range(8):
-        r = 8 + i
-        asignado = round(random.uniform(50000, 300000), 2)
+    _styled_header(ws, formats, 6, cols)
+    asignados = rng.uniform(50000, 300000, 8).tolist()
+    montos = rng.uniform(10000, 50000, 8).tolist()
+    for i, (asignado, monto) in enumerate(zip(asignados, montos)):
         # Half rows are habilitadoras, half habilitadas
         if i % 2 == 0:
-            hab_r = round(random.uniform(10000, 50000), 2)
-            hab_g = 0.0
+            hab_r, hab_g = monto, 0.0
         else:
-            hab_r = 0.0
-            hab_g = round(random.uniform(10000, 50000), 2)
-        pim_res = round(asignado + hab_r - hab_g, 2)
-        ws.cell(row=r, column=1, value=CLASIFICADORES[i])
-        ws.cell(row=r, column=2, value=DESCRIPCIONES_GASTO[i])
-        ws.cell(row=r, column=3, value=asignado)
-        ws.cell(row=r, column=4, value=hab_r)
-        ws.cell(row=r, column=5, value=hab_g)
-        ws.cell(row=r, column=6, value=pim_res)
-    wb.save(str(OUTPUT_DIR / "ejemplo_formato04.xlsx"))
-    print("  formato04 OK")
-
-
-def gen_formato5a():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Formato 5.A"
+            hab_r, hab_g = 0.0, monto
+        pim_res = asignado + hab_r - hab_g
+        ws.write_row(7 + i, 0, [CLASIFICADORES[i], DESCRIPCIONES_GASTO[i]])
+        ws.write_row(7 + i, 2, [asignado, hab_r, hab_g, pim_res], formats["money"])
+
+
+def gen_formato04(rng=None):
+    _write_workbook(_OUT["formato04"], "Formato 04", _fill_formato04, rng)
+    return "  formato04 OK"
+
+
+def _fill_formato5a(ws, formats, rng):
     # Context rows (Formato 5.A has context up to row ~10)
-    ws["A1"] = "FORMATO 5.A - PROGRAMACION MENSUAL DE ACTIVIDADES OPERATIVAS"
-    ws["A1"].font = Font(bold=True, size=12)
-    ws["A2"] = ""
-    ws["A3"] = "Unidad Ejecutora:"
-    ws["C3"] = "001 - INEI SEDE CENTRAL"
-    ws["F3"] = ""
-    ws["A4"] = "Meta Presupuestal:"
-    ws["F4"] = "0001"
-    ws["A5"] = "Ano Fiscal:"
-    ws["F5"] = 2026
-    for r in range(6, 10):
-        ws.cell(row=r, column=1, value="")
+    ws.write(0, 0, "FORMATO 5.A - PROGRAMACION MENSUAL DE ACTIVIDADES OPERATIVAS", formats["title"])
+    ws.write(2, 0, "Unidad Ejecutora:")
+    ws.write(2, 2, "001 - INEI SEDE CENTRAL")
+    ws.write(3, 0, "Meta Presupuestal:")
+    ws.write(3, 5, "0001")
+    ws.write(4, 0, "Ano Fiscal:")
+    ws.write(4, 5, 2026)
     months = ["Ene", "Feb", "Mar", "Abr", "May", "Jun", "Jul", "Ago", "Sep", "Oct", "Nov", "Dic"]
     cols = ["Codigo AO", "Nombre AO"] + months + ["Total Programado"]
-    _styled_header(ws, 11, cols)
-    for i in range(10):
-        r = 12 + i
-        total = round(random.uniform(80000, 600000), 2)
-        monthly = _random_monthly(total)
-        ws.cell(row=r, column=1, value=AO_CODES[i])
-        ws.cell(row=r, column=2, value=AO_NAMES[i])
-        for m_idx, mval in enumerate(monthly):
-            ws.cell(row=r, column=3 + m_idx, value=mval)
-        ws.cell(row=r, column=15, value=round(sum(monthly), 2))
-    wb.save(str(OUTPUT_DIR / "ejemplo_formato5a.xlsx"))
-    print("  formato5a OK")
-
-
-def gen_formato5b():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Formato 5.B"
-    ws["A1"] = "FORMATO 5.B - EJECUCION MENSUAL DE ACTIVIDADES OPERATIVAS"
-    ws["A1"].font = Font(bold=True, size=12)
-    ws["A3"] = "Unidad Ejecutora:"
-    ws["C3"] = "001 - INEI SEDE CENTRAL"
-    ws["A4"] = ""
-    ws["F4"] = "0001"
-    ws["A5"] = ""
-    ws["F5"] = 2026
+    _styled_header(ws, formats, 10, cols)
+    totals = rng.uniform(80000, 600000, 10).tolist()
+    for i, total in enumerate(totals):
+        monthly = _random_monthly(total, rng)
+        ws.write_row(11 + i, 0, [AO_CODES[i], AO_NAMES[i]])
+        ws.write_row(11 + i, 2, monthly + [sum(monthly)], formats["money"])
+
+
+def gen_formato5a(rng=None):
+    _write_workbook(_OUT["formato5a"], "Formato 5.A", _fill_formato5a, rng)
+    return "  formato5a OK"
+
+
+def _fill_formato5b(ws, formats, rng):
+    ws.write(0, 0, "FORMATO 5.B - EJECUCION MENSUAL DE ACTIVIDADES OPERATIVAS", formats["title"])
+    ws.write(2, 0, "Unidad Ejecutora:")
+    ws.write(2, 2, "001 - INEI SEDE CENTRAL")
+    ws.write(3, 5, "0001")
+    ws.write(4, 5, 2026)
     months_full = [
         "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
         "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre",
     ]
     # Row 9 (1-based): Two-row compound header
     # Row 9: "Codigo AO", "Nombre AO", then month names (each spanning 3 cols)
-    ws.cell(row=9, column=1, value="Codigo AO")
-    ws.cell(row=9, column=2, value="Nombre AO")
-    col = 3
-    for month_name in months_full:
-        ws.cell(row=9, column=col, value=month_name)
-        # Merge across 3 columns for each month
-        ws.merge_cells(start_row=9, start_column=col, end_row=9, end_column=col + 2)
+    ws.write_row(8, 0, ["Codigo AO", "Nombre AO"], formats["header"])
+    col = 2
+    for month_name in months_full + ["Total"]:
+        # Merge across 3 columns for each month (and the Total block)
+        ws.merge_range(8, col, 8, col + 2, month_name, formats["header"])
         col += 3
-    # Add Total columns
-    ws.cell(row=9, column=col, value="Total")
-    ws.merge_cells(start_row=9, start_column=col, end_row=9, end_column=col + 2)
 
     # Row 10: sub-headers (Programado, Ejecutado, Saldo) repeated for each month
-    ws.cell(row=10, column=1, value="")
-    ws.cell(row=10, column=2, value="")
-    col = 3
-    for _ in range(13):  # 12 months + 1 total
-        ws.cell(row=10, column=col, value="Programado")
-        ws.cell(row=10, column=col + 1, value="Ejecutado")
-        ws.cell(row=10, column=col + 2, value="Saldo")
-        col += 3
-
-    # Style header rows
-    for r in (9, 10):
-        for c in range(1, col):
-            cell = ws.cell(row=r, column=c)
-            if cell.value:
-                cell.font = WHITE_FONT
-                cell.fill = BLUE_FILL
-                cell.alignment = HEADER_ALIGN
+    # (12 months + 1 total)
+    ws.write_row(9, 2, ["Programado", "Ejecutado", "Saldo"] * 13, formats["header"])
 
     # Data from row 12
-    for i in range(10):
-        r = 12 + i
-        pim = round(random.uniform(100000, 800000), 2)
-        prog_monthly = _random_monthly(pim)
-        ejec_monthly = [round(p * random.uniform(0.5, 1.0), 2) for p in prog_monthly]
-        saldo_monthly = [round(p - e, 2) for p, e in zip(prog_monthly, ejec_monthly)]
-        total_prog = round(sum(prog_monthly), 2)
-        total_ejec = round(sum(ejec_monthly), 2)
-        total_saldo = round(total_prog - total_ejec, 2)
-
-        ws.cell(row=r, column=1, value=AO_CODES[i])
-        ws.cell(row=r, column=2, value=AO_NAMES[i])
-        col = 3
-        for m in range(12):
-            ws.cell(row=r, column=col, value=prog_monthly[m])
-            ws.cell(row=r, column=col + 1, value=ejec_monthly[m])
-            ws.cell(row=r, column=col + 2, value=saldo_monthly[m])
-            col += 3
-        # Totals
-        ws.cell(row=r, column=col, value=total_prog)
-        ws.cell(row=r, column=col + 1, value=total_ejec)
-        ws.cell(row=r, column=col + 2, value=total_saldo)
-    wb.save(str(OUTPUT_DIR / "ejemplo_formato5b.xlsx"))
-    print("  formato5b OK")
-
-
-def gen_formato5_resumen():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Formato 5 Resumen"
-    ws["A1"] = "FORMATO 5 RESUMEN - EJECUCION POR ACTIVIDAD OPERATIVA"
-    ws["A1"].font = Font(bold=True, size=12)
-    ws["A2"] = "Unidad Ejecutora:"
-    ws["C2"] = "001 - INEI SEDE CENTRAL"
-    ws["A3"] = "Meta Presupuestal:"
-    ws["F3"] = "0001"
-    ws["A4"] = "Ano Fiscal:"
-    ws["F4"] = 2026
-    ws["A5"] = ""
+    n = len(AO_CODES)
+    block = _formato5b_block(
+        rng.uniform(100000, 800000, n),
+        rng.uniform(0.5, 1.5, (n, 12)),
+        rng.uniform(0.5, 1.0, (n, 12)),
+    )
+    for i, row in enumerate(block.tolist()):
+        ws.write_row(11 + i, 0, [AO_CODES[i], AO_NAMES[i]])
+        ws.write_row(11 + i, 2, row, formats["money"])
+
+
+def gen_formato5b(rng=None):
+    _write_workbook(_OUT["formato5b"], "Formato 5.B", _fill_formato5b, rng)
+    return "  formato5b OK"
+
+
+def _fill_formato5_resumen(ws, formats, rng):
+    ws.write(0, 0, "FORMATO 5 RESUMEN - EJECUCION POR ACTIVIDAD OPERATIVA", formats["title"])
+    ws.write(1, 0, "Unidad Ejecutora:")
+    ws.write(1, 2, "001 - INEI SEDE CENTRAL")
+    ws.write(2, 0, "Meta Presupuestal:")
+    ws.write(2, 5, "0001")
+    ws.write(3, 0, "Ano Fiscal:")
+    ws.write(3, 5, 2026)
     months = ["Ene", "Feb", "Mar", "Abr", "May", "Jun", "Jul", "Ago", "Sep", "Oct", "Nov", "Dic"]
     cols = [
         "Codigo AO", "Nombre AO", "PIM", "CCP", "Compromiso Anual",
         "Devengado", "Girado", "Saldo", "% Avance PIM", "% Avance CCP", "Semaforo",
     ] + months
-    _styled_header(ws, 6, cols)
-    semaforos = ["VERDE", "AMARILLO", "ROJO"]
-    for i in range(10):
-        r = 7 + i
-        pim = round(random.uniform(100000, 700000), 2)
-        ccp = round(pim * random.uniform(0.7, 1.0), 2)
-        compromiso = round(ccp * random.uniform(0.8, 1.0), 2)
-        devengado = round(compromiso * random.uniform(0.6, 0.95), 2)
-        girado = round(devengado * random.uniform(0.9, 1.0), 2)
-        saldo = round(pim - devengado, 2)
-        pct_pim = round(devengado / pim * 100, 2) if pim > 0 else 0
-        pct_ccp = round(devengado / ccp * 100, 2) if ccp > 0 else 0
+    _styled_header(ws, formats, 5, cols)
+    pims = rng.uniform(100000, 700000, 10)
+    ccps = pims * rng.uniform(0.7, 1.0, 10)
+    compromisos = ccps * rng.uniform(0.8, 1.0, 10)
+    devengados = compromisos * rng.uniform(0.6, 0.95, 10)
+    girados = devengados * rng.uniform(0.9, 1.0, 10)
+    rows = zip(pims.tolist(), ccps.tolist(), compromisos.tolist(), devengados.tolist(), girados.tolist())
+    for i, (pim, ccp, compromiso, devengado, girado) in enumerate(rows):
+        saldo = pim - devengado
+        pct_pim = devengado / pim * 100 if pim > 0 else 0
+        pct_ccp = devengado / ccp * 100 if ccp > 0 else 0
         semaforo = "VERDE" if pct_pim >= 90 else ("AMARILLO" if pct_pim >= 70 else "ROJO")
-        dev_monthly = _random_monthly(devengado)
-
-        ws.cell(row=r, column=1, value=AO_CODES[i])
-        ws.cell(row=r, column=2, value=AO_NAMES[i])
-        ws.cell(row=r, column=3, value=pim)
-        ws.cell(row=r, column=4, value=ccp)
-        ws.cell(row=r, column=5, value=compromiso)
-        ws.cell(row=r, column=6, value=devengado)
-        ws.cell(row=r, column=7, value=girado)
-        ws.cell(row=r, column=8, value=saldo)
-        ws.cell(row=r, column=9, value=pct_pim)
-        ws.cell(row=r, column=10, value=pct_ccp)
-        ws.cell(row=r, column=11, value=semaforo)
-        for m_idx, mval in enumerate(dev_monthly):
-            ws.cell(row=r, column=12 + m_idx, value=mval)
-    wb.save(str(OUTPUT_DIR / "ejemplo_formato5_resumen.xlsx"))
-    print("  formato5_resumen OK")
-
-
-def gen_anexo01():
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Anexo 01"
-    _context_rows(ws)
-    ws["A5"] = ""
-    ws["A6"] = ""
+        dev_monthly = _random_monthly(devengado, rng)
+
+        money = [pim, ccp, compromiso, devengado, girado, saldo, pct_pim, pct_ccp]
+        ws.write_row(6 + i, 0, [AO_CODES[i], AO_NAMES[i]])
+        ws.write_row(6 + i, 2, money, formats["money"])
+        ws.write(6 + i, 10, semaforo)
+        ws.write_row(6 + i, 11, dev_monthly, formats["money"])
+
+
+def gen_formato5_resumen(rng=None):
+    _write_workbook(_OUT["formato5_resumen"], "Formato 5 Resumen", _fill_formato5_resumen, rng)
+    return "  formato5_resumen OK"
+
+
+def _fill_anexo01(ws, formats, rng):
+    _context_rows(ws, formats)
     cols = [
         "N", "DNI", "Apellidos y Nombres", "Cargo", "Area",
         "Regimen Laboral", "Tipo Contrato", "Fecha Inicio", "Fecha Fin",
         "Remuneracion Mensual", "Observaciones", "Estado",
     ]
-    _styled_header(ws, 7, cols)
+    _styled_header(ws, formats, 6, cols)
+    n = len(NOMBRES_RRHH)
+    remus = rng.uniform(2500, 12000, n).tolist()
+    cargo_ix = rng.integers(0, len(CARGOS), n)
+    area_ix = rng.integers(0, len(AREAS), n)
+    regimen_ix = rng.integers(0, len(REGIMENES), n)
+    tipo_ix = rng.integers(0, len(TIPOS_CONTRATO), n)
     for i, (nombre, dni) in enumerate(NOMBRES_RRHH):
-        r = 8 + i
-        remu = round(random.uniform(2500, 12000), 2)
-        ws.cell(row=r, column=1, value=i + 1)
-        ws.cell(row=r, column=2, value=dni)
-        ws.cell(row=r, column=3, value=nombre)
-        ws.cell(row=r, column=4, value=random.choice(CARGOS))
-        ws.cell(row=r, column=5, value=random.choice(AREAS))
-        ws.cell(row=r, column=6, value=random.choice(REGIMENES))
-        ws.cell(row=r, column=7, value=random.choice(TIPOS_CONTRATO))
-        ws.cell(row=r, column=8, value="01/01/2026")
-        ws.cell(row=r, column=9, value="31/12/2026")
-        ws.cell(row=r, column=10, value=remu)
-        ws.cell(row=r, column=11, value="")
-        ws.cell(row=r, column=12, value="ACTIVO")
-    wb.save(str(OUTPUT_DIR / "ejemplo_anexo01.xlsx"))
-    print("  anexo01 OK")
+        ws.write_row(7 + i, 0, [
+            i + 1, dni, nombre,
+            CARGOS[cargo_ix[i]],
+            AREAS[area_ix[i]],
+            REGIMENES[regimen_ix[i]],
+            TIPOS_CONTRATO[tipo_ix[i]],
+            "01/01/2026", "31/12/2026",
+        ])
+        ws.write(7 + i, 9, remus[i], formats["money"])
+        ws.write_row(7 + i, 10, ["", "ACTIVO"])
+
+
+def gen_anexo01(rng=None):
+    _write_workbook(_OUT["anexo01"], "Anexo 01", _fill_anexo01, rng)
+    return "  anexo01 OK"
+
+
+# One entry per output file. They share nothing but read-only constants, so
+# main() runs them in separate processes.
+_GENERATORS = (
+    gen_cuadro_ao_meta,
+    gen_tablas,
+    gen_formato1,
+    gen_formato2,
+    gen_formato3,
+    gen_formato04,
+    gen_formato5a,
+    gen_formato5b,
+    gen_formato5_resumen,
+    gen_anexo01,
+)
+
+
+# Sheets of the --combined workbook, in the same order as _GENERATORS.
+_COMBINED_SHEETS = (
+    ("Cuadro AO-Meta", _fill_cuadro_ao_meta),
+    ("Tablas", _fill_tablas),
+    ("Formato 1", _fill_formato1),
+    ("Formato 2", _fill_formato2),
+    ("Formato 3", _fill_formato3),
+    ("Formato 04", _fill_formato04),
+    ("Formato 5.A", _fill_formato5a),
+    ("Formato 5.B", _fill_formato5b),
+    ("Formato 5 Resumen", _fill_formato5_resumen),
+    ("Anexo 01", _fill_anexo01),
+)
+COMBINED_FILENAME = "ejemplos_combinados.xlsx"
+# Next to formatos/ejemplo rather than in it, so it is never mistaken for one
+# of the per-format upload examples.
+_COMBINED_PATH = str(OUTPUT_DIR.parent / COMBINED_FILENAME)
+
+
+def _child_seeds():
+    """Per-format seeds, shared by the separate and combined outputs."""
+    return np.random.SeedSequence(SEED).spawn(len(_GENERATORS))
+
+
+def gen_all_combined():
+    """Write every example as a sheet of one workbook.
+
+    One zip container, styles table and shared metadata instead of ten.
+    Uploads still take one format per file, so this is for reviewing all
+    formats at once. Each sheet is seeded like its standalone file, so the
+    data is the same.
+    """
+    wb, formats = _new_workbook(_COMBINED_PATH)
+    for seed, (title, fill) in zip(_child_seeds(), _COMBINED_SHEETS):
+        fill(wb.add_worksheet(title), formats, np.random.default_rng(seed))
+    wb.close()
+    return f"  {_COMBINED_PATH} OK"
+
+
+def _run_generator(gen, seed):
+    """Run one generator in a worker with the RNG for its child seed."""
+    return gen(np.random.default_rng(seed))
 
 
 def main():
-    random.seed(42)  # Reproducible
-    print(f"Generating example files in: {OUTPUT_DIR}")
-    gen_cuadro_ao_meta()
-    gen_tablas()
-    gen_formato1()
-    gen_formato2()
-    gen_formato3()
-    gen_formato04()
-    gen_formato5a()
-    gen_formato5b()
-    gen_formato5_resumen()
-    gen_anexo01()
-    print(f"\nDone! {len(list(OUTPUT_DIR.glob('*.xlsx')))} files generated.")
+    # Generators return their status line instead of printing, so output from
+    # pool workers cannot interleave; it is written once, in generator order.
+    if "--combined" in sys.argv[1:]:
+        lines = ["Generating combined example workbook:", gen_all_combined(), "", "Done!"]
+    else:
+        lines = [f"Generating example files in: {OUTPUT_DIR}"]
+        workers = min(len(_GENERATORS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            lines += executor.map(_run_generator, _GENERATORS, _child_seeds())
+        lines += ["", f"Done! {len(_GENERATORS)} files generated."]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
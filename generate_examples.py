@@ -11,14 +11,26 @@ Usage:
     py generate_examples.py
 """
 
+import zipfile
 from pathlib import Path
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.dimensions import ColumnDimension
+from openpyxl.writer.excel import ExcelWriter
 
 BASE_DIR = Path(__file__).parent
 EJEMPLOS_DIR = BASE_DIR / "formatos" / "ejemplo"
 PLANTILLAS_DIR = BASE_DIR / "formatos" / "plantillas"
 
+# Deflate level for the generated archives (zipfile default is 6) and the
+# write buffer for the output file, see save_workbook().
+_ZIP_COMPRESSLEVEL = 1
+_SAVE_BUFFERING = 1 << 20
+
+# Column letters A..BL, indexed from 0 (the widest sheet, Formato 5.B, uses 38).
+_COL = tuple(get_column_letter(i) for i in range(1, 65))
+
 # =========================================================================
 # Styles
 # =========================================================================
@@ -36,45 +48,49 @@ HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
 
 TITLE_FONT = Font(bold=True, color="FFFFFF", size=14, name="Calibri")
 TITLE_FILL = PatternFill(fill_type="solid", fgColor=_DARK)
+TITLE_ALIGN = Alignment(horizontal="center", vertical="center")
 
 LABEL_FONT = Font(bold=True, color=_DARK, size=10, name="Calibri")
 LABEL_FILL = PatternFill(fill_type="solid", fgColor=_LIGHT_BG)
+LABEL_ALIGN = Alignment(horizontal="right", vertical="center")
 
 DATA_FONT = Font(size=10, name="Calibri")
 
+# Header, title, label and body cells each share one named style, so a cell
+# carries a single style reference. Assigning one registers it in the cell's
+# workbook on first use.
+HEADER_STYLE = NamedStyle(
+    name="hdr", font=HEADER_FONT, fill=HEADER_FILL, alignment=HEADER_ALIGN, border=THIN_BORDER
+)
+TITLE_STYLE = NamedStyle(name="sheet_title", font=TITLE_FONT, fill=TITLE_FILL, alignment=TITLE_ALIGN)
+LABEL_STYLE = NamedStyle(
+    name="label", font=LABEL_FONT, fill=LABEL_FILL, alignment=LABEL_ALIGN, border=THIN_BORDER
+)
+DATA_STYLE = NamedStyle(name="data", font=DATA_FONT, border=THIN_BORDER)
+
 
 def style_header(cell):
-    cell.font = HEADER_FONT
-    cell.fill = HEADER_FILL
-    cell.alignment = HEADER_ALIGN
-    cell.border = THIN_BORDER
+    cell.style = HEADER_STYLE
 
 
 def style_title(cell):
-    cell.font = TITLE_FONT
-    cell.fill = TITLE_FILL
-    cell.alignment = Alignment(horizontal="center", vertical="center")
+    cell.style = TITLE_STYLE
 
 
 def style_label(cell):
-    cell.font = LABEL_FONT
-    cell.fill = LABEL_FILL
-    cell.border = THIN_BORDER
-    cell.alignment = Alignment(horizontal="right", vertical="center")
+    cell.style = LABEL_STYLE
 
 
 def style_data(cell):
-    cell.font = DATA_FONT
-    cell.border = THIN_BORDER
+    cell.style = DATA_STYLE
 
 
 def write_context(ws, title, contexts, num_cols, *, safe_labels=False):
     """Write title and context rows. If safe_labels=True, use abbreviated
     labels that don't conflict with parser keyword detection."""
-    from openpyxl.utils import get_column_letter
     ws["A1"] = title
     style_title(ws["A1"])
-    end_col = get_column_letter(min(num_cols, 6))
+    end_col = _COL[min(num_cols, 6) - 1]
     if num_cols > 1:
         ws.merge_cells(f"A1:{end_col}1")
     ws.row_dimensions[1].height = 28
@@ -95,23 +111,29 @@ def write_context(ws, title, contexts, num_cols, *, safe_labels=False):
         display_label = _SAFE.get(label, label) if safe_labels else label
         lbl_cell = ws.cell(row=i, column=1, value=display_label)
         style_label(lbl_cell)
-        val_cell = ws.cell(row=i, column=2, value=value)
-        val_cell.font = DATA_FONT
-        val_cell.border = THIN_BORDER
+        style_data(ws.cell(row=i, column=2, value=value))
         ws.row_dimensions[i].height = 18
 
 
 def write_headers_and_data(ws, headers, data, header_row):
-    from openpyxl.utils import get_column_letter
+    # Register all column widths in one update instead of one
+    # column_dimensions lookup per header.
+    widths = {
+        _COL[col_idx - 1]: max(12, len(str(h)) + 4)
+        for col_idx, h in enumerate(headers, start=1)
+    }
+    ws.column_dimensions.update(
+        {letter: ColumnDimension(ws, index=letter, width=width) for letter, width in widths.items()}
+    )
+    # The sheet is back-patched afterwards (fmt_money, merges), so it stays a
+    # regular worksheet and cells are placed at explicit coordinates.
+    cell = ws.cell
     for col_idx, h in enumerate(headers, start=1):
-        cell = ws.cell(row=header_row, column=col_idx, value=h)
-        style_header(cell)
-        ws.column_dimensions[get_column_letter(col_idx)].width = max(12, len(str(h)) + 4)
+        style_header(cell(row=header_row, column=col_idx, value=h))
     ws.row_dimensions[header_row].height = 22
-    for row_offset, row_data in enumerate(data, start=header_row + 1):
+    for row_idx, row_data in enumerate(data, start=header_row + 1):
         for col_idx, val in enumerate(row_data, start=1):
-            cell = ws.cell(row=row_offset, column=col_idx, value=val)
-            style_data(cell)
+            style_data(cell(row=row_idx, column=col_idx, value=val))
 
 
 def fmt_money(ws, start_row, end_row, cols):
@@ -120,6 +142,18 @@ def fmt_money(ws, start_row, end_row, cols):
             ws.cell(row=r, column=c).number_format = '#,##0.00'
 
 
+def save_workbook(wb, path):
+    """Same as wb.save(), but with a fast deflate level and a 1 MB write buffer.
+
+    The examples are small, repetitive XML, so level 1 is nearly as compact.
+    """
+    with open(path, "wb", buffering=_SAVE_BUFFERING) as fh:
+        archive = zipfile.ZipFile(
+            fh, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=_ZIP_COMPRESSLEVEL
+        )
+        ExcelWriter(wb, archive).save()
+
+
 # =========================================================================
 # Shared Constants — consistent across ALL formats
 # =========================================================================
@@ -225,7 +259,7 @@ def generate_cuadro_ao_meta():
     write_headers_and_data(ws, headers, data, header_row=6)
     path = EJEMPLOS_DIR / "ejemplo_cuadro_ao_meta.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} AOs)")
 
 
@@ -254,7 +288,7 @@ def generate_tablas():
     write_headers_and_data(ws, headers, data, header_row=5)
     path = EJEMPLOS_DIR / "ejemplo_tablas.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} clasificadores)")
 
 
@@ -298,7 +332,7 @@ def generate_formato1():
 
     path = EJEMPLOS_DIR / "ejemplo_formato1.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} clasificadores)")
 
 
@@ -352,7 +386,7 @@ def generate_formato2():
     write_headers_and_data(ws, headers, data, header_row=7)
     path = EJEMPLOS_DIR / "ejemplo_formato2.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} tareas)")
 
 
@@ -405,7 +439,7 @@ def generate_formato3():
     write_headers_and_data(ws, headers, data, header_row=7)
     path = EJEMPLOS_DIR / "ejemplo_formato3.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} tareas)")
 
 
@@ -451,7 +485,7 @@ def generate_formato04():
 
     path = EJEMPLOS_DIR / "ejemplo_formato04.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} modificaciones)")
 
 
@@ -499,7 +533,7 @@ def generate_formato5a():
 
     path = EJEMPLOS_DIR / "ejemplo_formato5a.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} AOs)")
 
 
@@ -581,15 +615,14 @@ def generate_formato5b():
             col += 3
 
     # Set column widths
-    from openpyxl.utils import get_column_letter
     ws.column_dimensions["A"].width = 14
     ws.column_dimensions["B"].width = 35
     for c in range(3, 3 + 36):
-        ws.column_dimensions[get_column_letter(c)].width = 12
+        ws.column_dimensions[_COL[c - 1]].width = 12
 
     path = EJEMPLOS_DIR / "ejemplo_formato5b.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(AO_DATA)} AOs x 12 meses)")
 
 
@@ -631,7 +664,7 @@ def generate_formato5_resumen():
     write_headers_and_data(ws, headers, data, header_row=6)
     path = EJEMPLOS_DIR / "ejemplo_formato5_resumen.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} AOs)")
 
 
@@ -678,7 +711,7 @@ def generate_anexo01():
     write_headers_and_data(ws, headers, data, header_row=7)
     path = EJEMPLOS_DIR / "ejemplo_anexo01.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} registros RRHH)")
 
 
@@ -736,7 +769,7 @@ def generate_siaf():
 
     path = EJEMPLOS_DIR / "ejemplo_siaf.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} registros ejecucion)")
 
 
@@ -786,7 +819,7 @@ def generate_siga():
 
     path = EJEMPLOS_DIR / "ejemplo_siga.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path} ({len(data)} requerimientos)")
 
 
@@ -806,14 +839,13 @@ def generate_plantilla_siaf():
     ws.cell(row=3, column=2, value=2026).font = DATA_FONT
     headers = ["Anio", "Clasificador", "Descripcion", "PIA", "PIM",
                "Certificado", "Compromiso Anual", "Devengado", "Girado"]
-    from openpyxl.utils import get_column_letter
     for col_idx, h in enumerate(headers, start=1):
         cell = ws.cell(row=4, column=col_idx, value=h)
         style_header(cell)
-        ws.column_dimensions[get_column_letter(col_idx)].width = max(14, len(h) + 4)
+        ws.column_dimensions[_COL[col_idx - 1]].width = max(14, len(h) + 4)
     path = PLANTILLAS_DIR / "plantilla_siaf.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path}")
 
 
@@ -827,14 +859,13 @@ def generate_plantilla_siga():
     headers = ["Nro. Requerimiento", "Descripcion", "Unidad Medida",
                "Cantidad", "Precio Unitario", "Monto Total",
                "Estado", "Proveedor", "Fecha"]
-    from openpyxl.utils import get_column_letter
     for col_idx, h in enumerate(headers, start=1):
         cell = ws.cell(row=4, column=col_idx, value=h)
         style_header(cell)
-        ws.column_dimensions[get_column_letter(col_idx)].width = max(14, len(h) + 4)
+        ws.column_dimensions[_COL[col_idx - 1]].width = max(14, len(h) + 4)
     path = PLANTILLAS_DIR / "plantilla_siga.xlsx"
     path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(path))
+    save_workbook(wb, path)
     print(f"  [OK] {path}")
 
 